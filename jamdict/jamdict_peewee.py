@@ -19,7 +19,9 @@ completely untouched.
 # :license: MIT, see LICENSE for more details.
 
 import logging
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Iterator, List, Optional
 
 from .jmdict import JMDEntry, JMDictXMLParser
@@ -33,6 +35,16 @@ def getLogger():
     return logging.getLogger(__name__)
 
 
+# Module-level so import_data(parallel=True) can run them in worker processes
+def _parse_kd2_file(xml_path: str):
+    return Kanjidic2XMLParser().parse_file(xml_path)
+
+
+def _parse_jmne_file(xml_path: str) -> List[JMDEntry]:
+    # JMNEDict XML uses the same parser as JMDict
+    return list(JMDictXMLParser().parse_file_iter(xml_path))
+
+
 # ---------------------------------------------------------------------------
 # Lookup result
 # ---------------------------------------------------------------------------
@@ -202,30 +214,35 @@ class JamdictPeewee:
         parser = JMDictXMLParser()
         return parser.parse_file(xml_path)
 
-    def _parse_kd2_xml(self):
-        """Parse the configured KanjiDic2 XML file and return a KanjiDic2 object."""
+    def _kd2_xml_file(self) -> str:
+        """Return the absolute path of the configured KanjiDic2 XML file."""
         if not self._kd2_xml_path:
             raise ValueError("kd2_xml_path is required for KanjiDic2 XML import")
         xml_path = os.path.abspath(os.path.expanduser(self._kd2_xml_path))
         if not os.path.isfile(xml_path):
             raise FileNotFoundError(f"KanjiDic2 XML not found: {xml_path}")
+        return xml_path
+
+    def _parse_kd2_xml(self):
+        """Parse the configured KanjiDic2 XML file and return a KanjiDic2 object."""
+        xml_path = self._kd2_xml_file()
         getLogger().info("Parsing KanjiDic2 XML: %s", xml_path)
-        parser = Kanjidic2XMLParser()
-        return parser.parse_file(xml_path)
+        return _parse_kd2_file(xml_path)
 
-    def _parse_jmne_xml(self) -> List[JMDEntry]:
-        """Parse the configured JMNEDict XML file and return a list of JMDEntry objects."""
+    def _jmne_xml_file(self) -> str:
+        """Return the absolute path of the configured JMNEDict XML file."""
         if not self._jmne_xml_path:
             raise ValueError("jmne_xml_path is required for JMNEDict XML import")
         xml_path = os.path.abspath(os.path.expanduser(self._jmne_xml_path))
         if not os.path.isfile(xml_path):
             raise FileNotFoundError(f"JMNEDict XML not found: {xml_path}")
-        getLogger().info("Parsing JMNEDict XML: %s", xml_path)
-        # JMNEDict XML uses the same parser infrastructure as JMDict
-        from .old.util_old import JMNEDictXML
+        return xml_path
 
-        xdb = JMNEDictXML.from_file(xml_path)
-        return list(xdb)
+    def _parse_jmne_xml(self) -> List[JMDEntry]:
+        """Parse the configured JMNEDict XML file and return a list of JMDEntry objects."""
+        xml_path = self._jmne_xml_file()
+        getLogger().info("Parsing JMNEDict XML: %s", xml_path)
+        return _parse_jmne_file(xml_path)
 
     # ------------------------------------------------------------------
     # Import
@@ -236,6 +253,7 @@ class JamdictPeewee:
         jmdict: bool = True,
         kanjidic2: bool = True,
         jmnedict: bool = True,
+        parallel: bool = False,
     ) -> None:
         """
         Parse the configured XML source files and bulk-insert all entries
@@ -244,9 +262,30 @@ class JamdictPeewee:
         By default all three dictionaries are imported.  Pass ``jmdict=False``,
         ``kanjidic2=False``, or ``jmnedict=False`` to skip individual sources.
 
-        If the database already contains entries this method inserts
-        duplicates — call this only on a fresh (or just-wiped) database.
+        With ``parallel=True`` the KanjiDic2 and JMNEDict files are parsed in
+        worker processes while JMDict is parsed and imported; the databases
+        are still written one at a time.
+
+        Entries and characters that are already stored are skipped, so
+        re-running an import leaves the database unchanged.
         """
+        kanjidic2 = bool(kanjidic2 and self._kd2_xml_path and self.kd2_db is not None)
+        jmnedict = bool(jmnedict and self._jmne_xml_path and self.jmne_db is not None)
+        kd2_job = jmne_job = pool = None
+        if parallel and (kanjidic2 or jmnedict):
+            pool = ProcessPoolExecutor(
+                max_workers=2, mp_context=multiprocessing.get_context("spawn"))
+            if kanjidic2:
+                kd2_job = pool.submit(_parse_kd2_file, self._kd2_xml_file())
+            if jmnedict:
+                jmne_job = pool.submit(_parse_jmne_file, self._jmne_xml_file())
+        try:
+            self._import_sources(jmdict, kanjidic2, jmnedict, kd2_job, jmne_job)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+    def _import_sources(self, jmdict, kanjidic2, jmnedict, kd2_job, jmne_job) -> None:
         if jmdict:
             entries = self._parse_jmdict_xml()
             getLogger().info(
@@ -255,8 +294,8 @@ class JamdictPeewee:
             self.db.insert_entries(entries)
             getLogger().info("JMDict import complete")
 
-        if kanjidic2 and self._kd2_xml_path and self.kd2_db is not None:
-            kd2 = self._parse_kd2_xml()
+        if kanjidic2:
+            kd2 = kd2_job.result() if kd2_job is not None else self._parse_kd2_xml()
             getLogger().info(
                 "Importing %d KanjiDic2 characters into %s",
                 len(kd2),
@@ -270,8 +309,11 @@ class JamdictPeewee:
             self.kd2_db.insert_chars(kd2.characters)
             getLogger().info("KanjiDic2 import complete")
 
-        if jmnedict and self._jmne_xml_path and self.jmne_db is not None:
-            ne_entries = self._parse_jmne_xml()
+        if jmnedict:
+            if jmne_job is not None:
+                ne_entries = jmne_job.result()
+            else:
+                ne_entries = self._parse_jmne_xml()
             getLogger().info(
                 "Importing %d JMNEDict entries into %s",
                 len(ne_entries),
@@ -10,6 +10,7 @@ JMdict Models
 
 import logging
 import os
+import sys
 import warnings
 from typing import List
 
@@ -27,6 +28,12 @@ from chirptext import chio
 
 logger = logging.getLogger(__name__)
 
+
+def _intern(text):
+    """Intern a tag or attribute value so every entry shares a single string object."""
+    return sys.intern(text) if text else text
+
+
 ########################################################################
 
 
@@ -61,20 +68,18 @@ class JMDEntry(object):
     def text(self, compact=True, separator=" ", no_id=False):
         tmp = []
         if not compact and not no_id:
-            tmp.append("[id#%s]" % self.idseq)
+            tmp.append(f"[id#{self.idseq}]")
         if self.kana_forms:
             tmp.append(self.kana_forms[0].text)
         if self.kanji_forms:
-            tmp.append("({})".format(self.kanji_forms[0].text))
+            tmp.append(f"({self.kanji_forms[0].text})")
         if self.senses:
             tmp.append(":")
             if len(self.senses) == 1:
                 tmp.append(self.senses[0].text(compact=compact))
             else:
-                for sense, idx in zip(self.senses, range(len(self.senses))):
-                    tmp.append(
-                        "{i}. {s}".format(i=idx + 1, s=sense.text(compact=compact))
-                    )
+                for idx, sense in enumerate(self.senses, start=1):
+                    tmp.append(f"{idx}. {sense.text(compact=compact)}")
         return separator.join(tmp)
 
     def __repr__(self):
@@ -453,9 +458,7 @@ class Sense(object):
     def text(self, compact=True):
         tmp = [str(x) for x in self.gloss]
         if not compact and self.pos:
-            return "{gloss} ({pos})".format(
-                gloss="/".join(tmp), pos=("(%s)" % "|".join(self.pos))
-            )
+            return f"{'/'.join(tmp)} (({'|'.join(self.pos)}))"
         else:
             return "/".join(tmp)
 
@@ -516,7 +519,7 @@ class Translation(Sense):
         types = (
             "/".join(self.name_type) if compact else "/".join(self.name_type_human())
         )
-        return "{gloss} ({types})".format(gloss="/".join(tmp), types=types)
+        return f"{'/'.join(tmp)} ({types})"
 
     def to_json(self):
         warnings.warn(
@@ -673,18 +676,27 @@ class JMDictXMLParser(object):
 
     def parse_file(self, jmdict_file_path):
         """Parse JMDict_e.xml file and return a list of JMDEntry objects"""
+        return list(self.parse_file_iter(jmdict_file_path))
+
+    def parse_file_iter(self, jmdict_file_path):
+        """Parse JMDict_e.xml file and yield JMDEntry objects one by one
+
+        Only the entry being parsed is held in memory, so the whole dictionary
+        can be streamed into a database.
+        """
         actual_path = os.path.abspath(os.path.expanduser(jmdict_file_path))
         logger.debug("Loading data from file: {}".format(actual_path))
 
         with chio.open(actual_path, mode="rb") as jmfile:
-            tree = etree.iterparse(jmfile)
-            entries = []
-            for event, element in tree:
-                if event == "end" and element.tag == "entry":
-                    entries.append(self.parse_entry_tag(element))
-                    # and then we can clear the element to save memory
-                    element.clear()
-            return entries
+            root = None
+            for event, element in etree.iterparse(jmfile, events=("start", "end")):
+                if root is None:
+                    root = element
+                elif event == "end" and element.tag == "entry":
+                    yield self.parse_entry_tag(element)
+                    # drop the parsed entry together with the (already cleared)
+                    # siblings the root would otherwise keep accumulating
+                    root.clear()
 
     def parse_entry_tag(self, etag):
         """Parse a lxml XML Node and generate a JMDEntry entry"""
@@ -731,9 +743,9 @@ class JMDictXMLParser(object):
             if child.tag == "keb":
                 kr.set_text(child.text)
             elif child.tag == "ke_inf":
-                kr.info.append(child.text)
+                kr.info.append(_intern(child.text))
             elif child.tag == "ke_pri":
-                kr.pri.append(child.text)
+                kr.pri.append(_intern(child.text))
             else:
                 raise Exception("WARNING: invalid tag %s in k_ele" % child.tag)
         # parse kebs
@@ -750,9 +762,9 @@ class JMDictXMLParser(object):
             elif child.tag == "re_restr":
                 kr.restr.append(child.text)
             elif child.tag == "re_inf":
-                kr.info.append(child.text)
+                kr.info.append(_intern(child.text))
             elif child.tag == "re_pri":
-                kr.pri.append(child.text)
+                kr.pri.append(_intern(child.text))
             else:
                 raise Exception("WARNING: invalid tag %s in r_ele" % child.tag)
         # parse kebs
@@ -821,7 +833,7 @@ class JMDictXMLParser(object):
                 _name_type = (
                     JMENDICT_TYPE_MAP_DECODE[child.text]
                     if child.text in JMENDICT_TYPE_MAP_DECODE
-                    else child.text
+                    else _intern(child.text)
                 )
                 translation.name_type.append(_name_type)
             elif child.tag == "trans_det":
@@ -846,19 +858,19 @@ class JMDictXMLParser(object):
             elif child.tag == "stagr":
                 sense.stagr.append(child.text)
             elif child.tag == "pos":
-                sense.pos.append(child.text)
+                sense.pos.append(_intern(child.text))
             elif child.tag == "xref":
                 sense.xref.append(child.text)
             elif child.tag == "ant":
                 sense.antonym.append(child.text)
             elif child.tag == "field":
-                sense.field.append(child.text)
+                sense.field.append(_intern(child.text))
             elif child.tag == "misc":
-                sense.misc.append(child.text)
+                sense.misc.append(_intern(child.text))
             elif child.tag == "s_inf":
                 sense.info.append(child.text)
             elif child.tag == "dial":
-                sense.dialect.append(child.text)
+                sense.dialect.append(_intern(child.text))
             elif child.tag == "example":
                 sense.examples.append(child.text)
             elif child.tag == "lsource":
@@ -877,7 +889,7 @@ class JMDictXMLParser(object):
         if attr_name == "xml:lang":
             attr_name = """{http://www.w3.org/XML/1998/namespace}lang"""
         if attr_name in a_tag.attrib:
-            return a_tag.attrib[attr_name]
+            return _intern(a_tag.attrib[attr_name])
         else:
             return default_value
 
@@ -4,10 +4,11 @@
 JMDict SQLite backend — peewee implementation.
 
 Each JMDictDB instance owns its own SqliteDatabase object.  Model classes are
-unbound at definition time (database=None) and bound to a specific database
-instance via peewee's bind() API inside every public method.  This means
-multiple JMDictDB instances with different paths — including :memory: — can
-coexist safely in the same process without stomping on each other.
+bound to a thread-local database proxy (see :class:`ThreadBoundDatabase`) and
+every public method points that proxy at its own database for the current
+thread.  This means multiple JMDictDB instances with different paths —
+including :memory: — can coexist safely in the same process, and can be
+queried from several threads at once, without stomping on each other.
 
 This module is intentionally self-contained.  It does NOT attempt to replicate
 the puchikarui ctx-passing convention used by jmdict_sqlite.py; call sites
@@ -18,19 +19,30 @@ should use the clean API defined here.
 # :copyright: (c) 2016 Le Tuan Anh <tuananh.ke@gmail.com>
 # :license: MIT, see LICENSE for more details.
 
+import functools
+import itertools
 import logging
 import os
-from typing import Iterator, List, Optional
+import re
+import sqlite3
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from peewee import (
     AutoField,
     BooleanField,
     CharField,
+    DatabaseProxy,
     ForeignKeyField,
     IntegerField,
     Model,
+    SQL,
+    OperationalError,
     SqliteDatabase,
     TextField,
+    sort_models,
 )
 
 from . import __url__ as JAMDICT_URL
@@ -46,6 +58,7 @@ from .jmdict import (
     LSource,
     Sense,
     SenseGloss,
+    _intern,
 )
 
 # ---------------------------------------------------------------------------
@@ -61,18 +74,254 @@ def getLogger():
 
 
 # ---------------------------------------------------------------------------
-# Model definitions — database=None (unbound)
+# Thread-local model binding
+# ---------------------------------------------------------------------------
+
+
+class ThreadBoundDatabase(DatabaseProxy):
+    """
+    A peewee DatabaseProxy whose target database is chosen per thread.
+
+    peewee's ``bind_ctx()`` rebinds the model classes themselves, so two
+    threads querying at the same time (even the same database) can restore
+    each other's binding mid-query.  Models bound to this proxy instead
+    resolve it when a query executes, through ``bound()``, which only
+    affects the calling thread.
+    """
+
+    __slots__ = ("_local",)
+
+    def __init__(self):
+        object.__setattr__(self, "_local", threading.local())
+        super().__init__()
+
+    @property
+    def obj(self):
+        return getattr(self._local, "obj", None)
+
+    def __setattr__(self, attr, value):
+        if attr == "obj":
+            self._local.obj = value
+        else:
+            object.__setattr__(self, attr, value)
+
+    @contextmanager
+    def bound(self, database):
+        """Route the proxy to *database* in this thread for the block."""
+        previous = self.obj
+        self._local.obj = database
+        try:
+            yield database
+        finally:
+            self._local.obj = previous
+
+
+# bytes of the database file SQLite may read through mmap() instead of
+# read(); a 32-bit process keeps the smaller window to spare address space
+MMAP_SIZE = 1 << 30 if sys.maxsize > 2**32 else 1 << 28
+
+
+def chunked(iterable, n: int) -> Iterator[list]:
+    """Yield successive lists of at most *n* items from *iterable*.
+
+    Replaces ``peewee.chunked``, which pads the last group to *n* items and
+    pops the padding off one at a time, so even a single key costs ~n steps.
+    """
+    it = iter(iterable)
+    batch = list(itertools.islice(it, n))
+    while batch:
+        yield batch
+        batch = list(itertools.islice(it, n))
+
+
+class _Miss(Exception):
+    """Raised inside cache_hits() so lru_cache does not keep a None result."""
+
+
+def cache_hits(func, maxsize: int):
+    """
+    Memoize *func* like ``functools.lru_cache``, except for None results.
+
+    A miss is looked up again on the next call, so a row inserted since
+    (through another instance on the same file, say) is found.  The wrapper
+    keeps lru_cache's ``cache_clear()`` and ``cache_info()``.
+    """
+
+    @functools.lru_cache(maxsize=maxsize)
+    def cached(*args):
+        result = func(*args)
+        if result is None:
+            raise _Miss
+        return result
+
+    @functools.wraps(func)
+    def lookup(*args):
+        try:
+            return cached(*args)
+        except _Miss:
+            return None
+
+    lookup.cache_clear = cached.cache_clear
+    lookup.cache_info = cached.cache_info
+    return lookup
+
+
+class ThreadedSqliteDatabase(SqliteDatabase):
+    """
+    A SqliteDatabase that can close the connections of every thread.
+
+    peewee opens one connection per thread and ``close()`` only closes the
+    calling thread's, so lookups run on worker threads would leave theirs
+    open.  ``close_all()`` closes them all; a thread whose connection was
+    closed this way opens a new one if it queries again.
+    """
+
+    def __init__(self, database, **kwargs):
+        # close_all() closes connections that belong to other threads
+        kwargs.setdefault("check_same_thread", False)
+        super().__init__(database, **kwargs)
+        self._conns = set()
+        self._conns_lock = threading.Lock()
+
+    def _connect(self):
+        conn = super()._connect()
+        with self._conns_lock:
+            self._conns.add(conn)
+        return conn
+
+    def _close(self, conn):
+        with self._conns_lock:
+            self._conns.discard(conn)
+        super()._close(conn)
+
+    def is_closed(self):
+        if not self._state.closed and self._state.conn not in self._conns:
+            # closed by close_all() in another thread
+            self._state.reset()
+        return self._state.closed
+
+    def close_all(self) -> None:
+        """Close the connection of every thread, not only the calling one's."""
+        self.close()
+        with self._conns_lock:
+            conns, self._conns = self._conns, set()
+        for conn in conns:
+            conn.close()
+
+
+class SharedMemoryDatabase(ThreadedSqliteDatabase):
+    """
+    A private in-memory SQLite database that every thread can open.
+
+    A plain ``:memory:`` database only exists inside the connection that
+    created it, and sharing one sqlite3 connection between threads is not
+    safe.  This opens a uniquely named shared-cache memory database instead,
+    so each thread still gets its own connection.  An extra connection held
+    by the instance keeps the data alive until ``close_all()``.
+    """
+
+    _names = itertools.count()
+
+    def __init__(self, pragmas=None, **kwargs):
+        uri = "file:jamdict-{}-{}?mode=memory&cache=shared".format(
+            os.getpid(), next(self._names)
+        )
+        super().__init__(uri, pragmas=pragmas, uri=True, **kwargs)
+        self._keepalive = sqlite3.connect(uri, uri=True, check_same_thread=False)
+
+    def close_all(self) -> None:
+        super().close_all()
+        self._keepalive.close()
+
+
+def open_sqlite(db_path: str, pragmas: dict, **kwargs) -> SqliteDatabase:
+    """
+    Create the SqliteDatabase behind a *DB instance.
+
+    peewee opens one connection per thread; ``:memory:`` maps to a
+    :class:`SharedMemoryDatabase` so those connections see the same data.
+    """
+    if db_path == ":memory:":
+        return SharedMemoryDatabase(pragmas, **kwargs)
+    return ThreadedSqliteDatabase(db_path, pragmas=pragmas, **kwargs)
+
+
+def truncate_wal(db: SqliteDatabase) -> None:
+    """
+    Checkpoint a WAL-mode *db* and shrink its ``-wal`` file to zero bytes.
+
+    A bulk import leaves a copy of every page it wrote in the WAL until the
+    last connection closes; this hands the disk space back straight away.
+    """
+    if db.pragma("journal_mode") == "wal":
+        db.execute_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+def skip_stored(db: SqliteDatabase, items, key, table: str, column: str) -> list:
+    """
+    Return the *items* whose ``key(item)`` is neither stored in
+    ``table.column`` yet nor repeated by an earlier item.
+
+    This makes re-importing a source a no-op instead of a constraint error
+    (or a second copy).  Keys are looked up with one ``IN`` query per
+    ``_MAX_SQL_VARS`` items.
+    """
+    items = list(items)
+    keys = [key(item) for item in items]
+    seen = set()
+    for batch in chunked(keys, _MAX_SQL_VARS):
+        sql = 'SELECT "%s" FROM "%s" WHERE "%s" IN (%s)' % (
+            column, table, column, ", ".join("?" * len(batch))
+        )
+        seen.update(row[0] for row in db.execute_sql(sql, batch))
+    fresh = []
+    for k, item in zip(keys, items):
+        if k not in seen:
+            seen.add(k)
+            fresh.append(item)
+    return fresh
+
+
+_SCHEMA_SQL: Dict[Tuple[type, ...], Tuple[str, ...]] = {}
+
+
+def create_schema(db: SqliteDatabase, models) -> None:
+    """
+    Create missing tables and indexes for *models* in one transaction.
+
+    Equivalent to ``db.create_tables(models, safe=True)``, but the DDL is
+    rendered once per model list: rebuilding it is most of what peewee spends
+    on every open.  The models' proxy must be bound to *db*.
+    """
+    key = tuple(models)
+    statements = _SCHEMA_SQL.get(key)
+    if statements is None:
+        statements = []
+        for model in sort_models(models):
+            statements.append(model._schema._create_table(safe=True).query()[0])
+            statements.extend(
+                ctx.query()[0] for ctx in model._schema._create_indexes(safe=True)
+            )
+        statements = _SCHEMA_SQL[key] = tuple(statements)
+    with db.atomic():
+        for sql in statements:
+            db.execute_sql(sql)
+
+
+# ---------------------------------------------------------------------------
+# Model definitions — bound to a thread-local proxy
 #
-# Models are defined once at module level with no database attached.
-# JMDictDB.__init__ calls db.bind(ALL_MODELS) so each instance gets its
-# own connection without interfering with any other instance.
+# Models are defined once at module level against _DB_PROXY.  Every
+# JMDictDB method wraps its queries in ``_DB_PROXY.bound(self._db)`` so each
+# instance (and each thread) uses its own connection.
 # ---------------------------------------------------------------------------
 
+_DB_PROXY = ThreadBoundDatabase()
+
 
 class _Base(Model):
-    # No Meta.database needed — peewee defaults to database=None when unset.
-    # Queries are routed per-instance via bind_ctx() inside every JMDictDB method.
-    pass
+    class Meta:
+        database = _DB_PROXY
 
 
 class MetaModel(_Base):
@@ -135,6 +384,8 @@ class KanjiModel(_Base):
 
     class Meta:
         table_name = "Kanji"
+        # covers exact-match lookups without touching the table
+        indexes = ((("text", "idseq"), False),)
 
 
 class KJIModel(_Base):
@@ -163,6 +414,7 @@ class KanaModel(_Base):
 
     class Meta:
         table_name = "Kana"
+        indexes = ((("text", "idseq"), False),)
 
 
 class KNIModel(_Base):
@@ -224,6 +476,7 @@ class PosModel(_Base):
 
     class Meta:
         table_name = "pos"
+        indexes = ((("text", "sid"), False),)
         primary_key = False
 
 
@@ -301,6 +554,7 @@ class SenseGlossModel(_Base):
 
     class Meta:
         table_name = "SenseGloss"
+        indexes = ((("text", "sid"), False),)
         primary_key = False
 
 
@@ -334,6 +588,103 @@ ALL_MODELS = [
 ]
 
 
+# Sense attributes filled from a single ``text`` column, keyed by ``sid``.
+_SENSE_TEXT_MODELS = (
+    ("stagk", StagkModel),
+    ("stagr", StagrModel),
+    ("pos", PosModel),
+    ("xref", XrefModel),
+    ("antonym", AntonymModel),
+    ("field", FieldModel),
+    ("misc", MiscModel),
+    ("info", SenseInfoModel),
+    ("dialect", DialectModel),
+)
+
+# Columns written by _insert_batch(), one executemany() per table.  Kanji,
+# Kana and Sense IDs are assigned up front so child rows can reference them.
+_INSERT_FIELDS = {
+    EntryModel: [EntryModel.idseq],
+    LinkModel: [LinkModel.idseq, LinkModel.tag, LinkModel.desc, LinkModel.uri],
+    BibModel: [BibModel.idseq, BibModel.tag, BibModel.text],
+    EtymModel: [EtymModel.idseq, EtymModel.text],
+    AuditModel: [AuditModel.idseq, AuditModel.upd_date, AuditModel.upd_detl],
+    KanjiModel: [KanjiModel.id, KanjiModel.idseq, KanjiModel.text],
+    KJIModel: [KJIModel.kid, KJIModel.text],
+    KJPModel: [KJPModel.kid, KJPModel.text],
+    KanaModel: [KanaModel.id, KanaModel.idseq, KanaModel.text, KanaModel.nokanji],
+    KNIModel: [KNIModel.kid, KNIModel.text],
+    KNPModel: [KNPModel.kid, KNPModel.text],
+    KNRModel: [KNRModel.kid, KNRModel.text],
+    SenseModel: [SenseModel.id, SenseModel.idseq],
+    **{model: [model.sid, model.text] for _, model in _SENSE_TEXT_MODELS},
+    SenseSourceModel: [
+        SenseSourceModel.sid,
+        SenseSourceModel.text,
+        SenseSourceModel.lang,
+        SenseSourceModel.lstype,
+        SenseSourceModel.wasei,
+    ],
+    SenseGlossModel: [
+        SenseGlossModel.sid,
+        SenseGlossModel.lang,
+        SenseGlossModel.gend,
+        SenseGlossModel.text,
+    ],
+}
+
+
+def _insert_sql(fields) -> str:
+    table = fields[0].model._meta.table_name
+    columns = ", ".join(f'"{field.column_name}"' for field in fields)
+    return f'INSERT INTO "{table}" ({columns}) VALUES ({", ".join("?" * len(fields))})'
+
+
+# prebuilt INSERT statements; the rows are plain values, so they bypass
+# peewee's per-field conversion
+_SQL_INSERT = {model: _insert_sql(fields) for model, fields in _INSERT_FIELDS.items()}
+
+
+def _select_in_sql(key, columns, n: int) -> str:
+    table = key.model._meta.table_name
+    names = ", ".join(f'"{field.column_name}"' for field in (key, *columns))
+    placeholders = ", ".join("?" * n)
+    return f'SELECT {names} FROM "{table}" WHERE "{key.column_name}" IN ({placeholders})'
+
+
+# Trigram full-text index over every kanji form, kana form and gloss.  FTS5
+# answers LIKE patterns from it directly (with LIKE's own case rules), but
+# only those with a run of three or more literal characters — anything
+# shorter falls back to the plain tables.
+_SQL_FTS_CREATE = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS jmdict_fts "
+    "USING fts5(text, idseq UNINDEXED, tokenize='trigram')"
+)
+_SQL_FTS_FILL = (
+    "INSERT INTO jmdict_fts(text, idseq) "
+    "SELECT text, idseq FROM Kanji{where} UNION ALL SELECT text, idseq FROM Kana{where} "
+    'UNION ALL SELECT g.text, s.idseq FROM SenseGloss AS g JOIN Sense AS s ON g.sid = s."id"{where}'
+)
+# meta value of KEY_FTS once the index is complete; databases indexed before
+# glosses were added say "trigram" and get rebuilt on the next insert
+_FTS_INDEX = "trigram+gloss"
+_SQL_FTS_LIKE = "(SELECT idseq FROM jmdict_fts WHERE text LIKE ?)"
+_FTS_PATTERN = re.compile(r"[^%_]{3}")
+
+# Sense attributes holding entity tags (a few hundred distinct values at most)
+_SENSE_TAG_ATTRS = frozenset(("pos", "field", "misc", "dialect"))
+
+
+# SQLite's historical limit on host parameters per statement
+_MAX_SQL_VARS = 999
+# number of entries search_iter() hydrates per round of queries
+HYDRATE_BATCH_SIZE = 500
+# number of entries insert_entries() collects per round of executemany()
+INSERT_BATCH_SIZE = 200
+# number of JMDEntry objects memoized per JMDictDB by get_entry
+ENTRY_CACHE_SIZE = 4096
+
+
 # ---------------------------------------------------------------------------
 # JMDictDB — the clean public API
 # ---------------------------------------------------------------------------
@@ -369,6 +720,7 @@ class JMDictDB:
 
     KEY_VERSION = "jmdict.version"
     KEY_URL = "jmdict.url"
+    KEY_FTS = "jmdict.fts"
 
     def __init__(self, db_path: str):
         """
@@ -382,24 +734,65 @@ class JMDictDB:
             os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
         self._db_path = db_path
-        self._db = SqliteDatabase(
+        self._db = open_sqlite(
             db_path,
-            pragmas={"foreign_keys": 0},
+            pragmas={
+                # only takes effect while the file is still empty
+                "page_size": 8192,
+                "foreign_keys": 0,
+                "synchronous": "NORMAL",
+                "cache_size": -65536,  # 64 MB page cache
+                "mmap_size": MMAP_SIZE,
+                "temp_store": "MEMORY",
+                "journal_size_limit": 64 << 20,  # truncate the WAL after checkpoints
+            },
         )
-        # We do NOT call db.bind() permanently — that would mutate the
-        # module-level model classes and break any other JMDictDB instance.
-        # Instead, every public method wraps its queries in
-        # self._db.bind_ctx(ALL_MODELS), which temporarily routes model
-        # operations to this instance's database without touching others.
-        with self._db.bind_ctx(ALL_MODELS):
+        # The models stay bound to _DB_PROXY; every public method wraps its
+        # queries in _DB_PROXY.bound(self._db), which routes them to this
+        # instance's database for the calling thread only.
+        with _DB_PROXY.bound(self._db):
             self._db.connect(reuse_if_open=True)
-            self._db.create_tables(ALL_MODELS, safe=True)
+            if db_path != ":memory:":
+                self._enable_wal()
+            self._create_tables()
         self._seed_meta()
+        # the trigram index is only trusted once a full build has completed
+        self._fts = self.get_meta(self.KEY_FTS) == _FTS_INDEX
+        # distinct POS tags only change when entries are inserted
+        self._pos_cache: Optional[Tuple[str, ...]] = None
+        self._get_entry_cached = cache_hits(self._get_entry, ENTRY_CACHE_SIZE)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _enable_wal(self) -> None:
+        """Put a file database in WAL mode so readers never wait on a writer.
+
+        A read-only file cannot change its journal mode and keeps the current one.
+        """
+        try:
+            self._db.pragma("journal_mode", "wal")
+        except OperationalError:
+            getLogger().debug(
+                "JMDictDB: %s is read-only, journal mode unchanged", self._db_path
+            )
+
+    def _create_tables(self) -> None:
+        """Create missing tables and indexes.
+
+        A read-only file built by an older release is used as it is, without
+        the indexes it lacks.
+        """
+        try:
+            create_schema(self._db, ALL_MODELS)
+        except OperationalError as e:
+            if "readonly" not in str(e):
+                raise
+            getLogger().debug(
+                "JMDictDB: %s is read-only, schema unchanged", self._db_path
+            )
+
     def _seed_meta(self) -> None:
         """Insert default metadata rows if they are absent."""
         defaults = [
@@ -409,10 +802,17 @@ class JMDictDB:
             ("generator_version", JAMDICT_VERSION),
             ("generator_url", JAMDICT_URL),
         ]
-        with self._db.bind_ctx(ALL_MODELS):
+        # One SELECT to find what is missing, then a single executemany.  The
+        # probe keeps already-seeded (possibly read-only) databases write-free.
+        existing = {
+            key for (key,) in self._db.execute_sql("SELECT key FROM meta").fetchall()
+        }
+        missing = [(key, value) for key, value in defaults if key not in existing]
+        if missing:
             with self._db.atomic():
-                for key, value in defaults:
-                    MetaModel.get_or_create(key=key, defaults={"value": value})
+                self._db.cursor().executemany(
+                    "INSERT OR IGNORE INTO meta(key, value) VALUES (?, ?)", missing
+                )
 
     # ------------------------------------------------------------------
     # Metadata
@@ -420,26 +820,23 @@ class JMDictDB:
 
     def update_meta(self, version: str, url: str) -> None:
         """Upsert the jmdict version and source URL in the meta table."""
-        with self._db.bind_ctx(ALL_MODELS):
-            with self._db.atomic():
-                MetaModel.insert(key=self.KEY_VERSION, value=version).on_conflict(
-                    conflict_target=[MetaModel.key],
-                    update={MetaModel.value: version},
-                ).execute()
-                MetaModel.insert(key=self.KEY_URL, value=url).on_conflict(
-                    conflict_target=[MetaModel.key],
-                    update={MetaModel.value: url},
-                ).execute()
+        rows = [(self.KEY_VERSION, version), (self.KEY_URL, url)]
+        with self._db.atomic():
+            self._db.cursor().executemany(
+                "INSERT INTO meta(key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                rows,
+            )
 
     def get_meta(self, key: str) -> Optional[str]:
         """Return the value for *key* from the meta table, or None."""
-        with self._db.bind_ctx(ALL_MODELS):
+        with _DB_PROXY.bound(self._db):
             row = MetaModel.get_or_none(MetaModel.key == key)
         return row.value if row is not None else None
 
     def all_meta(self) -> List[tuple]:
         """Return all metadata rows as a list of ``(key, value)`` tuples."""
-        with self._db.bind_ctx(ALL_MODELS):
+        with _DB_PROXY.bound(self._db):
             return [
                 (row.key, row.value)
                 for row in MetaModel.select().order_by(MetaModel.key)
@@ -450,9 +847,12 @@ class JMDictDB:
     # ------------------------------------------------------------------
 
     def all_pos(self) -> List[str]:
-        """Return a list of all distinct POS tags stored in the database."""
-        with self._db.bind_ctx(ALL_MODELS):
-            return [row.text for row in PosModel.select(PosModel.text).distinct()]
+        """Return a sorted list of all distinct POS tags stored in the database."""
+        if self._pos_cache is None:
+            # the (text, sid) index yields the tags already sorted and distinct
+            cursor = self._db.execute_sql("SELECT DISTINCT text FROM pos ORDER BY text")
+            self._pos_cache = tuple(text for (text,) in cursor)
+        return list(self._pos_cache)
 
     # ------------------------------------------------------------------
     # Search
@@ -470,7 +870,7 @@ class JMDictDB:
         * exact string — equality match across kanji, kana, gloss
 
         NOTE: this method only *builds* the query object; it does not execute
-        it.  The caller must wrap execution inside ``bind_ctx``.
+        it.  The caller must wrap execution inside ``_DB_PROXY.bound()``.
         """
         q = EntryModel.select()
 
@@ -486,7 +886,11 @@ class JMDictDB:
         if query and query != "%":
             is_wildcard = "%" in query or "_" in query or "@" in query
 
-            if is_wildcard:
+            if is_wildcard and self._fts and _FTS_PATTERN.search(query):
+                # kanji forms, kana forms and glosses all live in the trigram index
+                kanji_sq = SQL(_SQL_FTS_LIKE, (query,))
+                kana_sq = gloss_sq = None
+            elif is_wildcard:
                 # peewee ** operator → SQL LIKE (case-insensitive on ASCII,
                 # but for Japanese text that distinction is irrelevant)
                 kanji_sq = KanjiModel.select(KanjiModel.idseq).where(
@@ -511,11 +915,12 @@ class JMDictDB:
                     .where(SenseGlossModel.text == query)
                 )
 
-            q = q.where(
-                (EntryModel.idseq << kanji_sq)
-                | (EntryModel.idseq << kana_sq)
-                | (EntryModel.idseq << gloss_sq)
-            )
+            cond = EntryModel.idseq << kanji_sq
+            if gloss_sq is not None:
+                cond |= EntryModel.idseq << gloss_sq
+            if kana_sq is not None:
+                cond |= EntryModel.idseq << kana_sq
+            q = q.where(cond)
 
         if pos:
             if isinstance(pos, str):
@@ -532,206 +937,340 @@ class JMDictDB:
 
         return q
 
-    def search(self, query: str, pos=None) -> List[JMDEntry]:
-        """Return all entries matching *query* as a list."""
-        return list(self.search_iter(query, pos=pos))
+    def search(self, query: str, pos=None, limit=None) -> List[JMDEntry]:
+        """Return all entries matching *query* as a list.
 
-    def search_iter(self, query: str, pos=None) -> Iterator[JMDEntry]:
-        """Yield entries matching *query* one at a time."""
-        with self._db.bind_ctx(ALL_MODELS):
-            idseqs = [row.idseq for row in self._build_entry_query(query, pos=pos)]
-        for idseq in idseqs:
-            entry = self.get_entry(idseq)
-            if entry is not None:
-                yield entry
+        Pass *limit* to stop after that many entries; SQLite then stops
+        scanning as soon as it has found them.
+        """
+        return list(self.search_iter(query, pos=pos, limit=limit))
+
+    def search_iter(self, query: str, pos=None, limit=None) -> Iterator[JMDEntry]:
+        """Yield entries matching *query* (at most *limit*) one at a time.
+
+        Entries are hydrated ``HYDRATE_BATCH_SIZE`` at a time, so each batch
+        costs one query per table rather than one per entry and table.
+        """
+        if query.startswith("id#") and query[3:].isascii() and query[3:].isdigit():
+            # a deep link names its entry; _build_entries() already skips
+            # unknown idseqs, so there is nothing left to select
+            idseqs = [int(query[3:])][:limit]
+        else:
+            q = self._build_entry_query(query, pos=pos)
+            if limit is not None:
+                q = q.limit(limit)
+            with _DB_PROXY.bound(self._db):
+                # read the raw cursor: a Model instance per idseq costs more
+                # than the query itself on large result sets
+                idseqs = [idseq for (idseq,) in self._db.execute(q)]
+        for batch in chunked(idseqs, HYDRATE_BATCH_SIZE):
+            yield from self._build_entries(batch)
 
     def get_entry(self, idseq: int) -> Optional[JMDEntry]:
         """
         Reconstruct a full JMDEntry domain object from the database.
 
-        Returns None if no entry with the given idseq exists.
+        Returns None if no entry with the given idseq exists.  Results are
+        memoized per instance (up to ``ENTRY_CACHE_SIZE`` entries) and the
+        same JMDEntry is returned for repeated calls, so callers must treat
+        it as read-only.  The cache is cleared by this instance's inserts and
+        by close(); misses are not cached, so entries added through another
+        instance are still found.  An idseq that is not a number matches no
+        entry.
         """
-        with self._db.bind_ctx(ALL_MODELS):
-            if not EntryModel.select().where(EntryModel.idseq == idseq).exists():
-                return None
+        try:
+            idseq = int(idseq)
+        except (TypeError, ValueError):
+            return None
+        return self._get_entry_cached(idseq)
 
-            entry = JMDEntry(str(idseq))
+    def _get_entry(self, idseq: int) -> Optional[JMDEntry]:
+        entries = self._build_entries([idseq])
+        return entries[0] if entries else None
+
+    def _fetch_grouped(self, key, columns, keys) -> Dict[int, List[tuple]]:
+        """Map each of *keys* to the rows of *columns* whose *key* matches.
+
+        Rows keep their storage order within each group.  Must be called
+        inside ``_DB_PROXY.bound()``.
+        """
+        grouped: Dict[int, List[tuple]] = {}
+        for batch in chunked(keys, _MAX_SQL_VARS):
+            # plain SQL: building the same SELECT through peewee for every
+            # table costs more than running it
+            sql = _select_in_sql(key, columns, len(batch))
+            for row in self._db.execute_sql(sql, batch):
+                grouped.setdefault(row[0], []).append(row[1:])
+        return grouped
+
+    def _build_entries(self, idseqs) -> List[JMDEntry]:
+        """
+        Reconstruct the JMDEntry objects for *idseqs* in a fixed number of
+        queries (one per table), preserving the order of *idseqs*.
+
+        Unknown idseqs are skipped.
+        """
+        idseqs = [int(i) for i in idseqs]
+        with _DB_PROXY.bound(self._db):
+            found = set()
+            for batch in chunked(idseqs, _MAX_SQL_VARS):
+                sql = _select_in_sql(EntryModel.idseq, (), len(batch))
+                found.update(idseq for (idseq,) in self._db.execute_sql(sql, batch))
+            # keep the caller's order (and duplicates) for known entries only
+            idseqs = [i for i in idseqs if i in found]
+            if not idseqs:
+                return []
+            keys = list(found)
 
             # ---- entry-level info (links / bibs / etym / audit) ---------
-            links = list(LinkModel.select().where(LinkModel.idseq == idseq))
-            bibs = list(BibModel.select().where(BibModel.idseq == idseq))
-            etyoms = list(EtymModel.select().where(EtymModel.idseq == idseq))
-            audits = list(AuditModel.select().where(AuditModel.idseq == idseq))
+            links = self._fetch_grouped(
+                LinkModel.idseq, (LinkModel.tag, LinkModel.desc, LinkModel.uri), keys
+            )
+            bibs = self._fetch_grouped(BibModel.idseq, (BibModel.tag, BibModel.text), keys)
+            etyoms = self._fetch_grouped(EtymModel.idseq, (EtymModel.text,), keys)
+            audits = self._fetch_grouped(
+                AuditModel.idseq, (AuditModel.upd_date, AuditModel.upd_detl), keys
+            )
 
-            if links or bibs or etyoms or audits:
+            # ---- kanji / kana forms and senses --------------------------
+            kanjis = self._fetch_grouped(
+                KanjiModel.idseq, (KanjiModel.id, KanjiModel.text), keys
+            )
+            kanas = self._fetch_grouped(
+                KanaModel.idseq, (KanaModel.id, KanaModel.text, KanaModel.nokanji), keys
+            )
+            senses = self._fetch_grouped(SenseModel.idseq, (SenseModel.id,), keys)
+
+            kids = [r[0] for rows in kanjis.values() for r in rows]
+            kjis = self._fetch_grouped(KJIModel.kid, (KJIModel.text,), kids)
+            kjps = self._fetch_grouped(KJPModel.kid, (KJPModel.text,), kids)
+
+            kids = [r[0] for rows in kanas.values() for r in rows]
+            knis = self._fetch_grouped(KNIModel.kid, (KNIModel.text,), kids)
+            knps = self._fetch_grouped(KNPModel.kid, (KNPModel.text,), kids)
+            knrs = self._fetch_grouped(KNRModel.kid, (KNRModel.text,), kids)
+
+            sids = [r[0] for rows in senses.values() for r in rows]
+            sense_text = {
+                attr: self._fetch_grouped(model.sid, (model.text,), sids)
+                for attr, model in _SENSE_TEXT_MODELS
+            }
+            lsources = self._fetch_grouped(
+                SenseSourceModel.sid,
+                (
+                    SenseSourceModel.lang,
+                    SenseSourceModel.lstype,
+                    SenseSourceModel.wasei,
+                    SenseSourceModel.text,
+                ),
+                sids,
+            )
+            glosses = self._fetch_grouped(
+                SenseGlossModel.sid,
+                (SenseGlossModel.lang, SenseGlossModel.gend, SenseGlossModel.text),
+                sids,
+            )
+
+        entries = []
+        for idseq in idseqs:
+            entry = JMDEntry(str(idseq))
+
+            e_links = links.get(idseq, ())
+            e_bibs = bibs.get(idseq, ())
+            e_etyoms = etyoms.get(idseq, ())
+            e_audits = audits.get(idseq, ())
+            if e_links or e_bibs or e_etyoms or e_audits:
                 entry.info = EntryInfo()
-                for lnk in links:
-                    entry.info.links.append(Link(lnk.tag, lnk.desc, lnk.uri))
-                for bib in bibs:
-                    entry.info.bibinfo.append(BibInfo(bib.tag, bib.text))
-                for etym in etyoms:
-                    entry.info.etym.append(etym.text)
-                for aud in audits:
-                    entry.info.audit.append(Audit(aud.upd_date, aud.upd_detl))
-
-            # ---- kanji forms --------------------------------------------
-            for dbkj in KanjiModel.select().where(KanjiModel.idseq == idseq):
-                kj = KanjiForm(dbkj.text)
-                for row in KJIModel.select().where(KJIModel.kid == dbkj.id):
-                    kj.info.append(row.text)
-                for row in KJPModel.select().where(KJPModel.kid == dbkj.id):
-                    kj.pri.append(row.text)
+                for tag, desc, uri in e_links:
+                    entry.info.links.append(Link(tag, desc, uri))
+                for tag, text in e_bibs:
+                    entry.info.bibinfo.append(BibInfo(tag, text))
+                for (text,) in e_etyoms:
+                    entry.info.etym.append(text)
+                for upd_date, upd_detl in e_audits:
+                    entry.info.audit.append(Audit(upd_date, upd_detl))
+
+            for kid, text in kanjis.get(idseq, ()):
+                kj = KanjiForm(text)
+                kj.info.extend(_intern(r[0]) for r in kjis.get(kid, ()))
+                kj.pri.extend(_intern(r[0]) for r in kjps.get(kid, ()))
                 entry.kanji_forms.append(kj)
 
-            # ---- kana forms ---------------------------------------------
-            for dbkn in KanaModel.select().where(KanaModel.idseq == idseq):
-                kn = KanaForm(dbkn.text, dbkn.nokanji)
-                for row in KNIModel.select().where(KNIModel.kid == dbkn.id):
-                    kn.info.append(row.text)
-                for row in KNPModel.select().where(KNPModel.kid == dbkn.id):
-                    kn.pri.append(row.text)
-                for row in KNRModel.select().where(KNRModel.kid == dbkn.id):
-                    kn.restr.append(row.text)
+            for kid, text, nokanji in kanas.get(idseq, ()):
+                kn = KanaForm(text, nokanji if nokanji is None else bool(nokanji))
+                kn.info.extend(_intern(r[0]) for r in knis.get(kid, ()))
+                kn.pri.extend(_intern(r[0]) for r in knps.get(kid, ()))
+                kn.restr.extend(r[0] for r in knrs.get(kid, ()))
                 entry.kana_forms.append(kn)
 
-            # ---- senses -------------------------------------------------
-            for dbs in SenseModel.select().where(SenseModel.idseq == idseq):
+            for (sid,) in senses.get(idseq, ()):
                 s = Sense()
-                sid = dbs.id
-                for row in StagkModel.select().where(StagkModel.sid == sid):
-                    s.stagk.append(row.text)
-                for row in StagrModel.select().where(StagrModel.sid == sid):
-                    s.stagr.append(row.text)
-                for row in PosModel.select().where(PosModel.sid == sid):
-                    s.pos.append(row.text)
-                for row in XrefModel.select().where(XrefModel.sid == sid):
-                    s.xref.append(row.text)
-                for row in AntonymModel.select().where(AntonymModel.sid == sid):
-                    s.antonym.append(row.text)
-                for row in FieldModel.select().where(FieldModel.sid == sid):
-                    s.field.append(row.text)
-                for row in MiscModel.select().where(MiscModel.sid == sid):
-                    s.misc.append(row.text)
-                for row in SenseInfoModel.select().where(SenseInfoModel.sid == sid):
-                    s.info.append(row.text)
-                for row in SenseSourceModel.select().where(SenseSourceModel.sid == sid):
-                    s.lsource.append(LSource(row.lang, row.lstype, row.wasei, row.text))
-                for row in DialectModel.select().where(DialectModel.sid == sid):
-                    s.dialect.append(row.text)
-                for row in SenseGlossModel.select().where(SenseGlossModel.sid == sid):
-                    s.gloss.append(SenseGloss(row.lang, row.gend, row.text))
+                for attr, _ in _SENSE_TEXT_MODELS:
+                    rows = sense_text[attr].get(sid, ())
+                    if attr in _SENSE_TAG_ATTRS:
+                        getattr(s, attr).extend(_intern(r[0]) for r in rows)
+                    else:
+                        getattr(s, attr).extend(r[0] for r in rows)
+                for lang, lstype, wasei, text in lsources.get(sid, ()):
+                    s.lsource.append(LSource(_intern(lang), lstype, wasei, text))
+                for lang, gend, text in glosses.get(sid, ()):
+                    s.gloss.append(SenseGloss(_intern(lang), _intern(gend), text))
                 entry.senses.append(s)
 
-        return entry
+            entries.append(entry)
+        return entries
 
     # ------------------------------------------------------------------
     # Import
     # ------------------------------------------------------------------
 
-    def insert_entries(self, entries) -> None:
+    def insert_entries(self, entries) -> int:
         """
-        Bulk-insert a collection of JMDEntry objects.
-
-        Wraps the entire operation in a single transaction with performance
-        PRAGMAs to match the throughput of the original puchikarui buckmode.
+        Bulk-insert JMDEntry objects from any iterable, e.g. a list or
+        ``JMDictXMLParser.parse_file_iter()``, and return how many were inserted.
+
+        Everything goes in a single transaction with ``synchronous=OFF`` (and
+        an in-memory rollback journal unless the file is in WAL mode), so
+        entries can be streamed straight from the parser.  Each run of
+        ``INSERT_BATCH_SIZE`` entries costs one ``executemany()`` per table.
+        Entries whose idseq is already stored are skipped, so importing the
+        same file twice leaves the database unchanged.
         """
-        getLogger().debug("JMDictDB: bulk insert %d entries", len(entries))
-        with self._db.bind_ctx(ALL_MODELS):
-            if self._db_path != ":memory:":
+        idseqs = []
+        with _DB_PROXY.bound(self._db):
+            # a file shared with a WAL-mode KanjiDic2DB must stay in WAL:
+            # leaving it requires exclusive access to the file
+            if self._db_path != ":memory:" and self._db.pragma("journal_mode") != "wal":
                 self._db.execute_sql("PRAGMA journal_mode=MEMORY")
-            self._db.execute_sql("PRAGMA cache_size=-65536")  # 64 MB page cache
-            self._db.execute_sql("PRAGMA temp_store=MEMORY")
-            with self._db.atomic():
-                for entry in entries:
-                    self._insert_entry_unsafe(entry)
+            self._db.pragma("synchronous", "OFF")
+            try:
+                with self._db.atomic():
+                    for batch in chunked(entries, INSERT_BATCH_SIZE):
+                        idseqs.extend(self._insert_batch(batch))
+                    self._index_fts(idseqs)
+            finally:
+                self._db.pragma("synchronous", "NORMAL")
+            truncate_wal(self._db)
+        getLogger().debug("JMDictDB: bulk inserted %d entries", len(idseqs))
+        return len(idseqs)
 
     def insert_entry(self, entry: JMDEntry) -> None:
-        """Insert a single JMDEntry and all its child rows."""
-        with self._db.bind_ctx(ALL_MODELS):
-            self._insert_entry_unsafe(entry)
+        """Insert a single JMDEntry and its child rows unless the idseq is stored."""
+        with _DB_PROXY.bound(self._db):
+            with self._db.atomic():
+                idseqs = self._insert_batch([entry])
+                if idseqs and self._fts:
+                    self._index_fts(idseqs)
 
-    def _insert_entry_unsafe(self, entry: JMDEntry) -> None:
+    def _index_fts(self, idseqs) -> None:
         """
-        Insert a single JMDEntry without acquiring bind_ctx.
+        Add the forms and glosses of *idseqs* to the trigram index.
 
-        Must only be called from within an active bind_ctx block.
+        The first call on a database without a complete index builds it from
+        every stored entry instead.  SQLite builds without FTS5 keep using the
+        plain LIKE queries.
+        """
+        if self._fts:
+            for batch in chunked(idseqs, _MAX_SQL_VARS):
+                where = " WHERE idseq IN (%s)" % ", ".join("?" * len(batch))
+                self._db.execute_sql(
+                    _SQL_FTS_FILL.format(where=where), list(batch) * 3
+                )
+            return
+        try:
+            self._db.execute_sql(_SQL_FTS_CREATE)
+        except OperationalError as e:
+            getLogger().warning("JMDictDB: trigram index unavailable (%s)", e)
+            return
+        self._db.execute_sql("DELETE FROM jmdict_fts")
+        self._db.execute_sql(_SQL_FTS_FILL.format(where=""))
+        MetaModel.insert(key=self.KEY_FTS, value=_FTS_INDEX).on_conflict(
+            conflict_target=[MetaModel.key],
+            update={MetaModel.value: _FTS_INDEX},
+        ).execute()
+        self._fts = True
+
+    def _max_id(self, model) -> int:
+        table = model._meta.table_name
+        return self._db.execute_sql(f'SELECT COALESCE(MAX("id"), 0) FROM "{table}"').fetchone()[0]
+
+    def _insert_batch(self, entries) -> list:
         """
-        EntryModel.create(idseq=entry.idseq)
+        Insert JMDEntry objects and all their child rows, table by table, and
+        return the idseqs inserted.  Entries whose idseq is already stored
+        are skipped.
 
-        # ---- entry info ---------------------------------------------
-        if entry.info:
-            for lnk in entry.info.links:
-                LinkModel.create(
-                    idseq=entry.idseq, tag=lnk.tag, desc=lnk.desc, uri=lnk.uri
+        Must only be called from within an active ``_DB_PROXY.bound()`` block.
+        """
+        entries = skip_stored(self._db, entries, lambda e: int(e.idseq), "Entry", "idseq")
+        self._pos_cache = None
+        self._get_entry_cached.cache_clear()
+        rows = {model: [] for model in _INSERT_FIELDS}
+        kid = self._max_id(KanjiModel)
+        rid = self._max_id(KanaModel)
+        sid = self._max_id(SenseModel)
+        for entry in entries:
+            idseq = int(entry.idseq)
+            rows[EntryModel].append((idseq,))
+
+            # ---- entry info -----------------------------------------
+            if entry.info:
+                info = entry.info
+                rows[LinkModel].extend(
+                    (idseq, lnk.tag, lnk.desc, lnk.uri) for lnk in info.links
                 )
-            for bib in entry.info.bibinfo:
-                BibModel.create(idseq=entry.idseq, tag=bib.tag, text=bib.text)
-            for etym in entry.info.etym:
-                EtymModel.create(idseq=entry.idseq, text=etym)
-            for aud in entry.info.audit:
-                AuditModel.create(
-                    idseq=entry.idseq, upd_date=aud.upd_date, upd_detl=aud.upd_detl
+                rows[BibModel].extend((idseq, bib.tag, bib.text) for bib in info.bibinfo)
+                rows[EtymModel].extend((idseq, etym) for etym in info.etym)
+                rows[AuditModel].extend(
+                    (idseq, aud.upd_date, aud.upd_detl) for aud in info.audit
                 )
 
-        # ---- kanji forms --------------------------------------------
-        for kj in entry.kanji_forms:
-            dbkj = KanjiModel.create(idseq=entry.idseq, text=kj.text)
-            for info in kj.info:
-                KJIModel.create(kid=dbkj.id, text=info)
-            for pri in kj.pri:
-                KJPModel.create(kid=dbkj.id, text=pri)
-
-        # ---- kana forms ---------------------------------------------
-        for kn in entry.kana_forms:
-            dbkn = KanaModel.create(idseq=entry.idseq, text=kn.text, nokanji=kn.nokanji)
-            for info in kn.info:
-                KNIModel.create(kid=dbkn.id, text=info)
-            for pri in kn.pri:
-                KNPModel.create(kid=dbkn.id, text=pri)
-            for restr in kn.restr:
-                KNRModel.create(kid=dbkn.id, text=restr)
-
-        # ---- senses -------------------------------------------------
-        for s in entry.senses:
-            dbs = SenseModel.create(idseq=entry.idseq)
-            sid = dbs.id
-            for text in s.stagk:
-                StagkModel.create(sid=sid, text=text)
-            for text in s.stagr:
-                StagrModel.create(sid=sid, text=text)
-            for text in s.pos:
-                PosModel.create(sid=sid, text=text)
-            for text in s.xref:
-                XrefModel.create(sid=sid, text=text)
-            for text in s.antonym:
-                AntonymModel.create(sid=sid, text=text)
-            for text in s.field:
-                FieldModel.create(sid=sid, text=text)
-            for text in s.misc:
-                MiscModel.create(sid=sid, text=text)
-            for text in s.info:
-                SenseInfoModel.create(sid=sid, text=text)
-            for ls in s.lsource:
-                SenseSourceModel.create(
-                    sid=sid,
-                    text=ls.text,
-                    lang=ls.lang,
-                    lstype=ls.lstype,
-                    wasei=ls.wasei,
+            # ---- kanji forms ----------------------------------------
+            for kj in entry.kanji_forms:
+                kid += 1
+                rows[KanjiModel].append((kid, idseq, kj.text))
+                rows[KJIModel].extend((kid, text) for text in kj.info)
+                rows[KJPModel].extend((kid, text) for text in kj.pri)
+
+            # ---- kana forms -----------------------------------------
+            for kn in entry.kana_forms:
+                rid += 1
+                rows[KanaModel].append((rid, idseq, kn.text, kn.nokanji))
+                rows[KNIModel].extend((rid, text) for text in kn.info)
+                rows[KNPModel].extend((rid, text) for text in kn.pri)
+                rows[KNRModel].extend((rid, text) for text in kn.restr)
+
+            # ---- senses ---------------------------------------------
+            for sense in entry.senses:
+                sid += 1
+                rows[SenseModel].append((sid, idseq))
+                for attr, model in _SENSE_TEXT_MODELS:
+                    rows[model].extend((sid, text) for text in getattr(sense, attr))
+                rows[SenseSourceModel].extend(
+                    (sid, ls.text, ls.lang, ls.lstype, ls.wasei) for ls in sense.lsource
                 )
-            for text in s.dialect:
-                DialectModel.create(sid=sid, text=text)
-            for g in s.gloss:
-                SenseGlossModel.create(sid=sid, lang=g.lang, gend=g.gend, text=g.text)
+                rows[SenseGlossModel].extend(
+                    (sid, g.lang, g.gend, g.text) for g in sense.gloss
+                )
+
+        cursor = self._db.cursor()
+        for model, model_rows in rows.items():
+            if model_rows:
+                cursor.executemany(_SQL_INSERT[model], model_rows)
+        return [row[0] for row in rows[EntryModel]]
 
     # ------------------------------------------------------------------
     # Resource management
     # ------------------------------------------------------------------
 
+    def set_query_only(self, enabled: bool = True) -> None:
+        """Reject (or allow again) every write through this connection."""
+        self._db.pragma("query_only", int(bool(enabled)), permanent=True)
+
     def close(self) -> None:
-        """Close the underlying database connection."""
-        if not self._db.is_closed():
-            self._db.close()
+        """Close the underlying database connections of every thread."""
+        self._get_entry_cached.cache_clear()
+        self._db.close_all()
 
     def __enter__(self):
         return self
@@ -4,13 +4,15 @@
 JMNEDict SQLite backend — peewee implementation.
 
 Each JMNEDictDB instance owns its own SqliteDatabase object.  Model classes
-are unbound at definition time (database=None) and bound to a specific
-database instance via peewee's bind_ctx API inside every public method.  This
-means multiple JMNEDictDB instances with different paths — including :memory:
-— can coexist safely in the same process without stomping on each other.
-
-This module mirrors the design established by jmdict_peewee.py and is
-intentionally self-contained.
+are bound to a thread-local database proxy, which every public method points
+at its own database for the current thread.  This means multiple JMNEDictDB
+instances with different paths — including :memory: — can coexist safely in
+the same process, and be queried from several threads at once, without
+stomping on each other.
+
+This module mirrors the design established by jmdict_peewee.py and reuses its
+thread-local binding (``ThreadBoundDatabase``); it is otherwise
+self-contained.
 """
 
 # This code is a part of jamdict library: https://github.com/neocl/jamdict
@@ -19,7 +21,8 @@ intentionally self-contained.
 
 import logging
 import os
-from typing import Iterator, List, Optional
+import re
+from typing import Dict, Iterator, List, Optional
 
 from peewee import (
     AutoField,
@@ -28,18 +31,32 @@ from peewee import (
     ForeignKeyField,
     IntegerField,
     Model,
-    SqliteDatabase,
+    SQL,
+    OperationalError,
     TextField,
 )
 
 from . import __url__ as JAMDICT_URL
 from . import __version__ as JAMDICT_VERSION
+from .jmdict_peewee import (
+    MMAP_SIZE,
+    ThreadBoundDatabase,
+    _insert_sql,
+    _select_in_sql,
+    cache_hits,
+    chunked,
+    create_schema,
+    open_sqlite,
+    skip_stored,
+    truncate_wal,
+)
 from .jmdict import (
     JMDEntry,
     KanaForm,
     KanjiForm,
     SenseGloss,
     Translation,
+    _intern,
 )
 
 # ---------------------------------------------------------------------------
@@ -56,16 +73,19 @@ def getLogger():
 
 
 # ---------------------------------------------------------------------------
-# Model definitions — database=None (unbound)
+# Model definitions — bound to a thread-local proxy
 #
-# Models are defined once at module level with no database attached.
-# JMNEDictDB.__init__ uses bind_ctx so each instance gets its own
-# connection without interfering with any other instance.
+# Models are defined once at module level against _DB_PROXY.  Every
+# JMNEDictDB method wraps its queries in ``_DB_PROXY.bound(self._db)`` so each
+# instance (and each thread) uses its own connection.
 # ---------------------------------------------------------------------------
 
+_DB_PROXY = ThreadBoundDatabase()
+
 
 class _Base(Model):
-    pass
+    class Meta:
+        database = _DB_PROXY
 
 
 class MetaModel(_Base):
@@ -90,6 +110,8 @@ class NEKanjiModel(_Base):
 
     class Meta:
         table_name = "NEKanji"
+        # covers exact-match lookups without touching the table
+        indexes = ((("text", "idseq"), False),)
 
 
 class NEKanaModel(_Base):
@@ -100,6 +122,7 @@ class NEKanaModel(_Base):
 
     class Meta:
         table_name = "NEKana"
+        indexes = ((("text", "idseq"), False),)
 
 
 class NETranslationModel(_Base):
@@ -116,6 +139,7 @@ class NETransTypeModel(_Base):
 
     class Meta:
         table_name = "NETransType"
+        indexes = ((("text", "tid"), False),)
         primary_key = False
 
 
@@ -136,6 +160,7 @@ class NETransGlossModel(_Base):
 
     class Meta:
         table_name = "NETransGloss"
+        indexes = ((("text", "tid"), False),)
         primary_key = False
 
 
@@ -151,6 +176,50 @@ ALL_MODELS = [
     NETransGlossModel,
 ]
 
+# Columns written by _insert_batch(), one executemany() per table.
+# Translation IDs are assigned up front so child rows can reference them.
+_INSERT_FIELDS = {
+    NEEntryModel: [NEEntryModel.idseq],
+    NEKanjiModel: [NEKanjiModel.idseq, NEKanjiModel.text],
+    NEKanaModel: [NEKanaModel.idseq, NEKanaModel.text, NEKanaModel.nokanji],
+    NETranslationModel: [NETranslationModel.ID, NETranslationModel.idseq],
+    NETransTypeModel: [NETransTypeModel.tid, NETransTypeModel.text],
+    NETransXRefModel: [NETransXRefModel.tid, NETransXRefModel.text],
+    NETransGlossModel: [
+        NETransGlossModel.tid,
+        NETransGlossModel.lang,
+        NETransGlossModel.gend,
+        NETransGlossModel.text,
+    ],
+}
+
+
+_SQL_INSERT = {model: _insert_sql(fields) for model, fields in _INSERT_FIELDS.items()}
+
+
+# Trigram full-text index over every kanji and kana form; see
+# jmdict_peewee for why only patterns with three literal characters use it.
+_SQL_FTS_CREATE = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS jmnedict_fts "
+    "USING fts5(text, idseq UNINDEXED, tokenize='trigram')"
+)
+_SQL_FTS_FILL = (
+    "INSERT INTO jmnedict_fts(text, idseq) "
+    "SELECT text, idseq FROM NEKanji{where} "
+    "UNION ALL SELECT text, idseq FROM NEKana{where}"
+)
+_SQL_FTS_LIKE = "(SELECT idseq FROM jmnedict_fts WHERE text LIKE ?)"
+_FTS_PATTERN = re.compile(r"[^%_]{3}")
+
+# SQLite's historical limit on host parameters per statement
+_MAX_SQL_VARS = 999
+# number of entries search_ne_iter() hydrates per round of queries
+HYDRATE_BATCH_SIZE = 500
+# number of entries insert_entries() collects per round of executemany()
+INSERT_BATCH_SIZE = 200
+# number of JMDEntry objects memoized per JMNEDictDB by get_ne
+ENTRY_CACHE_SIZE = 4096
+
 
 # ---------------------------------------------------------------------------
 # JMNEDictDB — the clean public API
@@ -194,6 +263,7 @@ class JMNEDictDB:
     KEY_VERSION = "jmnedict.version"
     KEY_URL = "jmnedict.url"
     KEY_DATE = "jmnedict.date"
+    KEY_FTS = "jmnedict.fts"
 
     def __init__(self, db_path: str):
         """
@@ -207,19 +277,60 @@ class JMNEDictDB:
             os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
         self._db_path = db_path
-        self._db = SqliteDatabase(
+        self._db = open_sqlite(
             db_path,
-            pragmas={"foreign_keys": 0},
+            pragmas={
+                # only takes effect while the file is still empty
+                "page_size": 8192,
+                "foreign_keys": 0,
+                "synchronous": "NORMAL",
+                "cache_size": -65536,  # 64 MB page cache
+                "mmap_size": MMAP_SIZE,
+                "temp_store": "MEMORY",
+                "journal_size_limit": 64 << 20,  # truncate the WAL after checkpoints
+            },
         )
-        with self._db.bind_ctx(ALL_MODELS):
+        with _DB_PROXY.bound(self._db):
             self._db.connect(reuse_if_open=True)
-            self._db.create_tables(ALL_MODELS, safe=True)
+            if db_path != ":memory:":
+                self._enable_wal()
+            self._create_tables()
         self._seed_meta()
+        # the trigram index is only trusted once a full build has completed
+        self._fts = self.get_meta(self.KEY_FTS) == "trigram"
+        self._get_ne_cached = cache_hits(self._get_ne, ENTRY_CACHE_SIZE)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _enable_wal(self) -> None:
+        """Put a file database in WAL mode so readers never wait on a writer.
+
+        A read-only file cannot change its journal mode and keeps the current one.
+        """
+        try:
+            self._db.pragma("journal_mode", "wal")
+        except OperationalError:
+            getLogger().debug(
+                "JMNEDictDB: %s is read-only, journal mode unchanged", self._db_path
+            )
+
+    def _create_tables(self) -> None:
+        """Create missing tables and indexes.
+
+        A read-only file built by an older release is used as it is, without
+        the indexes it lacks.
+        """
+        try:
+            create_schema(self._db, ALL_MODELS)
+        except OperationalError as e:
+            if "readonly" not in str(e):
+                raise
+            getLogger().debug(
+                "JMNEDictDB: %s is read-only, schema unchanged", self._db_path
+            )
+
     def _seed_meta(self) -> None:
         """Insert default metadata rows if they are absent."""
         defaults = [
@@ -230,10 +341,17 @@ class JMNEDictDB:
             ("generator_version", JAMDICT_VERSION),
             ("generator_url", JAMDICT_URL),
         ]
-        with self._db.bind_ctx(ALL_MODELS):
+        # One SELECT to find what is missing, then a single executemany.  The
+        # probe keeps already-seeded (possibly read-only) databases write-free.
+        existing = {
+            key for (key,) in self._db.execute_sql("SELECT key FROM meta").fetchall()
+        }
+        missing = [(key, value) for key, value in defaults if key not in existing]
+        if missing:
             with self._db.atomic():
-                for key, value in defaults:
-                    MetaModel.get_or_create(key=key, defaults={"value": value})
+                self._db.cursor().executemany(
+                    "INSERT OR IGNORE INTO meta(key, value) VALUES (?, ?)", missing
+                )
 
     # ------------------------------------------------------------------
     # Metadata
@@ -246,23 +364,22 @@ class JMNEDictDB:
             (self.KEY_URL, url),
             (self.KEY_DATE, date),
         ]
-        with self._db.bind_ctx(ALL_MODELS):
-            with self._db.atomic():
-                for key, value in rows:
-                    MetaModel.insert(key=key, value=value).on_conflict(
-                        conflict_target=[MetaModel.key],
-                        update={MetaModel.value: value},
-                    ).execute()
+        with self._db.atomic():
+            self._db.cursor().executemany(
+                "INSERT INTO meta(key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                rows,
+            )
 
     def get_meta(self, key: str) -> Optional[str]:
         """Return the value for *key* from the meta table, or None."""
-        with self._db.bind_ctx(ALL_MODELS):
+        with _DB_PROXY.bound(self._db):
             row = MetaModel.get_or_none(MetaModel.key == key)
         return row.value if row is not None else None
 
     def all_meta(self) -> List[tuple]:
         """Return all metadata rows as a list of ``(key, value)`` tuples."""
-        with self._db.bind_ctx(ALL_MODELS):
+        with _DB_PROXY.bound(self._db):
             return [
                 (row.key, row.value)
                 for row in MetaModel.select().order_by(MetaModel.key)
@@ -274,7 +391,7 @@ class JMNEDictDB:
 
     def all_ne_type(self) -> List[str]:
         """Return a list of all distinct name-type tags in the database."""
-        with self._db.bind_ctx(ALL_MODELS):
+        with _DB_PROXY.bound(self._db):
             return [
                 row.text
                 for row in NETransTypeModel.select(NETransTypeModel.text).distinct()
@@ -295,7 +412,7 @@ class JMNEDictDB:
         * exact string — equality match across kanji, kana, gloss and name_type
 
         NOTE: this method only *builds* the query object; the caller must wrap
-        execution inside ``bind_ctx``.
+        execution inside ``_DB_PROXY.bound()``.
         """
         q = NEEntryModel.select()
 
@@ -311,12 +428,17 @@ class JMNEDictDB:
         is_wildcard = "%" in query or "_" in query or "@" in query
 
         if is_wildcard:
-            kanji_sq = NEKanjiModel.select(NEKanjiModel.idseq).where(
-                NEKanjiModel.text**query
-            )
-            kana_sq = NEKanaModel.select(NEKanaModel.idseq).where(
-                NEKanaModel.text**query
-            )
+            if self._fts and _FTS_PATTERN.search(query):
+                # kanji and kana forms both live in the trigram index
+                kanji_sq = SQL(_SQL_FTS_LIKE, (query,))
+                kana_sq = None
+            else:
+                kanji_sq = NEKanjiModel.select(NEKanjiModel.idseq).where(
+                    NEKanjiModel.text**query
+                )
+                kana_sq = NEKanaModel.select(NEKanaModel.idseq).where(
+                    NEKanaModel.text**query
+                )
             gloss_sq = (
                 NETranslationModel.select(NETranslationModel.idseq)
                 .join(
@@ -357,139 +479,261 @@ class JMNEDictDB:
                 .where(NETransTypeModel.text == query)
             )
 
-        q = q.where(
+        cond = (
             (NEEntryModel.idseq << kanji_sq)
-            | (NEEntryModel.idseq << kana_sq)
             | (NEEntryModel.idseq << gloss_sq)
             | (NEEntryModel.idseq << netype_sq)
         )
-        return q
+        if kana_sq is not None:
+            cond |= NEEntryModel.idseq << kana_sq
+        return q.where(cond)
 
     def search_ne(self, query: str) -> List[JMDEntry]:
         """Return all named-entity entries matching *query* as a list."""
         return list(self.search_ne_iter(query))
 
     def search_ne_iter(self, query: str) -> Iterator[JMDEntry]:
-        """Yield named-entity entries matching *query* one at a time."""
-        with self._db.bind_ctx(ALL_MODELS):
-            idseqs = [row.idseq for row in self._build_ne_search_query(query)]
-        for idseq in idseqs:
-            entry = self.get_ne(idseq)
-            if entry is not None:
-                yield entry
+        """Yield named-entity entries matching *query* one at a time.
+
+        Entries are hydrated ``HYDRATE_BATCH_SIZE`` at a time, so each batch
+        costs one query per table rather than one per entry and table.
+        """
+        if query.startswith("id#") and query[3:].isascii() and query[3:].isdigit():
+            # _build_entries() already skips unknown idseqs
+            idseqs = [int(query[3:])]
+        else:
+            with _DB_PROXY.bound(self._db):
+                cursor = self._db.execute(self._build_ne_search_query(query))
+                idseqs = [idseq for (idseq,) in cursor]
+        for batch in chunked(idseqs, HYDRATE_BATCH_SIZE):
+            yield from self._build_entries(batch)
 
     def get_ne(self, idseq: int) -> Optional[JMDEntry]:
         """
         Reconstruct a full JMDEntry domain object from the database.
 
-        Returns None if no entry with the given idseq exists.
+        Returns None if no entry with the given idseq exists.  Results are
+        memoized per instance like ``JMDictDB.get_entry``: callers must treat
+        the returned entry as read-only, and the cache is cleared by this
+        instance's inserts and by close(); misses are not cached.  An idseq
+        that is not a number matches no entry.
         """
-        with self._db.bind_ctx(ALL_MODELS):
-            if not NEEntryModel.select().where(NEEntryModel.idseq == idseq).exists():
-                return None
+        try:
+            idseq = int(idseq)
+        except (TypeError, ValueError):
+            return None
+        return self._get_ne_cached(idseq)
 
-            entry = JMDEntry(str(idseq))
-            entry.idseq = idseq
+    def _get_ne(self, idseq: int) -> Optional[JMDEntry]:
+        entries = self._build_entries([idseq])
+        return entries[0] if entries else None
 
-            # ---- kanji forms ----------------------------------------
-            for dbkj in NEKanjiModel.select().where(NEKanjiModel.idseq == idseq):
-                kj = KanjiForm(dbkj.text)
-                entry.kanji_forms.append(kj)
+    def get_nes(self, idseqs) -> Dict[int, JMDEntry]:
+        """
+        Map each of *idseqs* that exists in the database to its JMDEntry.
 
-            # ---- kana forms -----------------------------------------
-            for dbkn in NEKanaModel.select().where(NEKanaModel.idseq == idseq):
-                kn = KanaForm(dbkn.text, dbkn.nokanji)
-                entry.kana_forms.append(kn)
+        Costs one query per table for the whole lot instead of get_ne()'s
+        queries per entry.
+        """
+        entries = {}
+        for batch in chunked(idseqs, HYDRATE_BATCH_SIZE):
+            entries.update((e.idseq, e) for e in self._build_entries(batch))
+        return entries
+
+    def all_ne_iter(self) -> Iterator[JMDEntry]:
+        """Yield every entry in the database in idseq order, hydrated in batches."""
+        with _DB_PROXY.bound(self._db):
+            cursor = self._db.execute_sql('SELECT "idseq" FROM "NEEntry" ORDER BY "idseq"')
+            idseqs = [idseq for (idseq,) in cursor]
+        for batch in chunked(idseqs, HYDRATE_BATCH_SIZE):
+            yield from self._build_entries(batch)
+
+    def _fetch_grouped(self, key, columns, keys) -> Dict[int, List[tuple]]:
+        """Map each of *keys* to the rows of *columns* whose *key* matches.
+
+        Rows keep their storage order within each group.  Must be called
+        inside ``_DB_PROXY.bound()``.
+        """
+        grouped: Dict[int, List[tuple]] = {}
+        for batch in chunked(keys, _MAX_SQL_VARS):
+            sql = _select_in_sql(key, columns, len(batch))
+            for row in self._db.execute_sql(sql, batch):
+                grouped.setdefault(row[0], []).append(row[1:])
+        return grouped
+
+    def _build_entries(self, idseqs) -> List[JMDEntry]:
+        """
+        Reconstruct the entries for *idseqs* in a fixed number of queries (one
+        per table), preserving their order.  Unknown idseqs are skipped.
+        """
+        idseqs = [int(i) for i in idseqs]
+        with _DB_PROXY.bound(self._db):
+            found = set()
+            for batch in chunked(idseqs, _MAX_SQL_VARS):
+                sql = _select_in_sql(NEEntryModel.idseq, (), len(batch))
+                found.update(idseq for (idseq,) in self._db.execute_sql(sql, batch))
+            idseqs = [i for i in idseqs if i in found]
+            if not idseqs:
+                return []
+            keys = list(found)
+
+            kanjis = self._fetch_grouped(NEKanjiModel.idseq, (NEKanjiModel.text,), keys)
+            kanas = self._fetch_grouped(
+                NEKanaModel.idseq, (NEKanaModel.text, NEKanaModel.nokanji), keys
+            )
+            translations = self._fetch_grouped(
+                NETranslationModel.idseq, (NETranslationModel.ID,), keys
+            )
+            tids = [r[0] for rows in translations.values() for r in rows]
+            name_types = self._fetch_grouped(
+                NETransTypeModel.tid, (NETransTypeModel.text,), tids
+            )
+            xrefs = self._fetch_grouped(NETransXRefModel.tid, (NETransXRefModel.text,), tids)
+            glosses = self._fetch_grouped(
+                NETransGlossModel.tid,
+                (NETransGlossModel.lang, NETransGlossModel.gend, NETransGlossModel.text),
+                tids,
+            )
 
-            # ---- translations (senses) ------------------------------
-            for dbt in NETranslationModel.select().where(
-                NETranslationModel.idseq == idseq
-            ):
+        entries = []
+        for idseq in idseqs:
+            entry = JMDEntry(str(idseq))
+            entry.idseq = idseq
+            for (text,) in kanjis.get(idseq, ()):
+                entry.kanji_forms.append(KanjiForm(text))
+            for text, nokanji in kanas.get(idseq, ()):
+                entry.kana_forms.append(
+                    KanaForm(text, nokanji if nokanji is None else bool(nokanji))
+                )
+            for (tid,) in translations.get(idseq, ()):
                 t = Translation()
-                tid = dbt.ID
-                for nt_row in NETransTypeModel.select().where(
-                    NETransTypeModel.tid == tid
-                ):
-                    t.name_type.append(nt_row.text)
-                for xr_row in NETransXRefModel.select().where(
-                    NETransXRefModel.tid == tid
-                ):
-                    t.xref.append(xr_row.text)
-                for g_row in NETransGlossModel.select().where(
-                    NETransGlossModel.tid == tid
-                ):
-                    t.gloss.append(SenseGloss(g_row.lang, g_row.gend, g_row.text))
+                t.name_type.extend(_intern(r[0]) for r in name_types.get(tid, ()))
+                t.xref.extend(r[0] for r in xrefs.get(tid, ()))
+                for lang, gend, text in glosses.get(tid, ()):
+                    t.gloss.append(SenseGloss(_intern(lang), _intern(gend), text))
                 entry.senses.append(t)
-
-        return entry
+            entries.append(entry)
+        return entries
 
     # ------------------------------------------------------------------
     # Import
     # ------------------------------------------------------------------
 
-    def insert_entries(self, entries) -> None:
+    def insert_entries(self, entries) -> int:
         """
-        Bulk-insert a collection of JMDEntry objects (JMNEDict entries).
-
-        Wraps the entire operation in a single transaction with performance
-        PRAGMAs to match the throughput of the original puchikarui buckmode.
+        Bulk-insert JMNEDict entries from any iterable, e.g. a list or
+        ``JMDictXMLParser.parse_file_iter()``, and return how many were inserted.
+
+        Everything goes in a single transaction with ``synchronous=OFF`` (and
+        an in-memory rollback journal unless the file is in WAL mode), so
+        entries can be streamed straight from the parser.  Each run of
+        ``INSERT_BATCH_SIZE`` entries costs one ``executemany()`` per table.
+        Entries whose idseq is already stored are skipped.
         """
-        getLogger().debug("JMNEDictDB: bulk insert %d entries", len(entries))
-        with self._db.bind_ctx(ALL_MODELS):
-            if self._db_path != ":memory:":
+        idseqs = []
+        with _DB_PROXY.bound(self._db):
+            # a file shared with a WAL-mode KanjiDic2DB must stay in WAL:
+            # leaving it requires exclusive access to the file
+            if self._db_path != ":memory:" and self._db.pragma("journal_mode") != "wal":
                 self._db.execute_sql("PRAGMA journal_mode=MEMORY")
-            self._db.execute_sql("PRAGMA cache_size=-65536")
-            self._db.execute_sql("PRAGMA temp_store=MEMORY")
-            with self._db.atomic():
-                for entry in entries:
-                    self._insert_entry_unsafe(entry)
+            self._db.pragma("synchronous", "OFF")
+            try:
+                with self._db.atomic():
+                    for batch in chunked(entries, INSERT_BATCH_SIZE):
+                        idseqs.extend(self._insert_batch(batch))
+                    self._index_fts(idseqs)
+            finally:
+                self._db.pragma("synchronous", "NORMAL")
+            truncate_wal(self._db)
+        getLogger().debug("JMNEDictDB: bulk inserted %d entries", len(idseqs))
+        return len(idseqs)
 
     def insert_entry(self, entry: JMDEntry) -> None:
-        """Insert a single JMNEDict entry and all its child rows."""
-        with self._db.bind_ctx(ALL_MODELS):
-            self._insert_entry_unsafe(entry)
+        """Insert a single JMNEDict entry and its child rows unless the idseq is stored."""
+        with _DB_PROXY.bound(self._db):
+            with self._db.atomic():
+                idseqs = self._insert_batch([entry])
+                if idseqs and self._fts:
+                    self._index_fts(idseqs)
 
-    def _insert_entry_unsafe(self, entry: JMDEntry) -> None:
+    def _index_fts(self, idseqs) -> None:
+        """
+        Add the forms of *idseqs* to the trigram index, building it from every
+        stored entry on the first call.  See ``JMDictDB._index_fts``.
+        """
+        if self._fts:
+            for batch in chunked(idseqs, _MAX_SQL_VARS):
+                where = " WHERE idseq IN (%s)" % ", ".join("?" * len(batch))
+                self._db.execute_sql(
+                    _SQL_FTS_FILL.format(where=where), list(batch) * 2
+                )
+            return
+        try:
+            self._db.execute_sql(_SQL_FTS_CREATE)
+        except OperationalError as e:
+            getLogger().warning("JMNEDictDB: trigram index unavailable (%s)", e)
+            return
+        self._db.execute_sql("DELETE FROM jmnedict_fts")
+        self._db.execute_sql(_SQL_FTS_FILL.format(where=""))
+        MetaModel.insert(key=self.KEY_FTS, value="trigram").on_conflict(
+            conflict_target=[MetaModel.key],
+            update={MetaModel.value: "trigram"},
+        ).execute()
+        self._fts = True
+
+    def _insert_batch(self, entries) -> list:
         """
-        Insert a single JMNEDict entry without acquiring bind_ctx.
+        Insert JMNEDict entries and all their child rows, table by table, and
+        return the idseqs inserted.  Entries whose idseq is already stored
+        are skipped.
 
-        Must only be called from within an active bind_ctx block.
+        Must only be called from within an active ``_DB_PROXY.bound()`` block.
         """
-        idseq = int(entry.idseq)
-        NEEntryModel.create(idseq=idseq)
-
-        # ---- kanji forms --------------------------------------------
-        for kj in entry.kanji_forms:
-            NEKanjiModel.create(idseq=idseq, text=kj.text)
-
-        # ---- kana forms ---------------------------------------------
-        for kn in entry.kana_forms:
-            NEKanaModel.create(idseq=idseq, text=kn.text, nokanji=kn.nokanji)
-
-        # ---- translations -------------------------------------------
-        for s in entry.senses:
-            t_row = NETranslationModel.create(idseq=idseq)
-            tid = t_row.ID
-            # name_type (only on Translation subclass)
-            name_types = getattr(s, "name_type", [])
-            for nt in name_types:
-                NETransTypeModel.create(tid=tid, text=nt)
-            # xref (only on Translation subclass)
-            xrefs = getattr(s, "xref", [])
-            for xr in xrefs:
-                NETransXRefModel.create(tid=tid, text=xr)
-            # gloss
-            for g in s.gloss:
-                NETransGlossModel.create(tid=tid, lang=g.lang, gend=g.gend, text=g.text)
+        entries = skip_stored(self._db, entries, lambda e: int(e.idseq), "NEEntry", "idseq")
+        self._get_ne_cached.cache_clear()
+        rows = {model: [] for model in _INSERT_FIELDS}
+        tid = self._db.execute_sql(
+            'SELECT COALESCE(MAX("ID"), 0) FROM "NETranslation"'
+        ).fetchone()[0]
+        for entry in entries:
+            idseq = int(entry.idseq)
+            rows[NEEntryModel].append((idseq,))
+            rows[NEKanjiModel].extend((idseq, kj.text) for kj in entry.kanji_forms)
+            rows[NEKanaModel].extend(
+                (idseq, kn.text, kn.nokanji) for kn in entry.kana_forms
+            )
+
+            # ---- translations ---------------------------------------
+            for s in entry.senses:
+                tid += 1
+                rows[NETranslationModel].append((tid, idseq))
+                # name_type and xref only exist on the Translation subclass
+                rows[NETransTypeModel].extend(
+                    (tid, nt) for nt in getattr(s, "name_type", ())
+                )
+                rows[NETransXRefModel].extend((tid, xr) for xr in getattr(s, "xref", ()))
+                rows[NETransGlossModel].extend(
+                    (tid, g.lang, g.gend, g.text) for g in s.gloss
+                )
+
+        cursor = self._db.cursor()
+        for model, model_rows in rows.items():
+            if model_rows:
+                cursor.executemany(_SQL_INSERT[model], model_rows)
+        return [row[0] for row in rows[NEEntryModel]]
 
     # ------------------------------------------------------------------
     # Resource management
     # ------------------------------------------------------------------
 
+    def set_query_only(self, enabled: bool = True) -> None:
+        """Reject (or allow again) every write through this connection."""
+        self._db.pragma("query_only", int(bool(enabled)), permanent=True)
+
     def close(self) -> None:
-        """Close the underlying database connection."""
-        if not self._db.is_closed():
-            self._db.close()
+        """Close the underlying database connections of every thread."""
+        self._get_ne_cached.cache_clear()
+        self._db.close_all()
 
     def __enter__(self):
         return self
@@ -10,6 +10,7 @@ Kanjidic2 models
 
 import os
 import logging
+import sys
 import warnings
 from typing import List
 
@@ -109,7 +110,7 @@ class Character(object):
 
     def __repr__(self):
         meanings = self.meanings(english_only=True)
-        return "{l}:{sc}:{meanings}".format(l=self.literal, sc=self.stroke_count, meanings=','.join(meanings))
+        return f"{self.literal}:{self.stroke_count}:{','.join(meanings)}"
 
     def __str__(self):
         return self.literal
@@ -584,7 +585,9 @@ class Kanjidic2XMLParser(object):
         if attr_name == 'xml:lang':
             attr_name = '''{http://www.w3.org/XML/1998/namespace}lang'''
         if attr_name in a_tag.attrib:
-            return a_tag.attrib[attr_name]
+            # attribute values (r_type, m_lang, dr_type, ...) repeat across
+            # every character, so they all share one string object each
+            return sys.intern(a_tag.attrib[attr_name])
         else:
             return default_value
 
@@ -4,22 +4,29 @@
 KanjiDic2 SQLite backend — peewee implementation.
 
 Each KanjiDic2DB instance owns its own SqliteDatabase object.  Model classes
-are unbound at definition time (database=None) and bound to a specific
-database instance via peewee's bind_ctx API inside every public method.  This
-means multiple KanjiDic2DB instances with different paths — including :memory:
-— can coexist safely in the same process without stomping on each other.
-
-This module mirrors the design established by jmdict_peewee.py and is
-intentionally self-contained.
+are bound to a thread-local database proxy, which every public method points
+at its own database for the current thread.  This means multiple KanjiDic2DB
+instances with different paths — including :memory: — can coexist safely in
+the same process, and be queried from several threads at once, without
+stomping on each other.
+
+This module mirrors the design established by jmdict_peewee.py and reuses its
+thread-local binding (``ThreadBoundDatabase``); it is otherwise
+self-contained.
 """
 
 # This code is a part of jamdict library: https://github.com/neocl/jamdict
 # :copyright: (c) 2016 Le Tuan Anh <tuananh.ke@gmail.com>
 # :license: MIT, see LICENSE for more details.
 
+import json
 import logging
+import multiprocessing
 import os
-from typing import Iterator, List, Optional
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from peewee import (
     AutoField,
@@ -27,12 +34,24 @@ from peewee import (
     ForeignKeyField,
     IntegerField,
     Model,
+    OperationalError,
     SqliteDatabase,
     TextField,
 )
 
 from . import __url__ as JAMDICT_URL
 from . import __version__ as JAMDICT_VERSION
+from .jmdict_peewee import (
+    MMAP_SIZE,
+    ThreadBoundDatabase,
+    _insert_sql,
+    cache_hits,
+    chunked,
+    create_schema,
+    open_sqlite,
+    skip_stored,
+    truncate_wal,
+)
 from .kanjidic2 import (
     Character,
     CodePoint,
@@ -58,23 +77,44 @@ KANJIDIC2_DATE = "April 2008"
 KEY_FILE_VER = "kanjidic2.file_version"
 KEY_DB_VER = "kanjidic2.database_version"
 KEY_CREATED_DATE = "kanjidic2.date_of_creation"
+KEY_SCHEMA_VER = "kanjidic2.database_schema_version"
+
+# 2: grade/freq/jlpt stored as INTEGER instead of TEXT
+KANJIDIC2_SCHEMA_VERSION = "2"
+
+# number of Character objects memoized per KanjiDic2DB by get_char and by
+# get_char_by_id (each)
+CHAR_CACHE_SIZE = 8192
+
+# number of characters insert_chars() collects per round of executemany()
+INSERT_BATCH_SIZE = 200
 
 
 def getLogger():
     return logging.getLogger(__name__)
 
 
+def _json_dumps(obj) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+_json_loads = json.loads
+
+
 # ---------------------------------------------------------------------------
-# Model definitions — database=None (unbound)
+# Model definitions — bound to a thread-local proxy
 #
-# Models are defined once at module level with no database attached.
-# KanjiDic2DB.__init__ uses bind_ctx so each instance gets its own
-# connection without interfering with any other instance.
+# Models are defined once at module level against _DB_PROXY.  Every
+# KanjiDic2DB method wraps its queries in ``_DB_PROXY.bound(self._db)`` so each
+# instance (and each thread) uses its own connection.
 # ---------------------------------------------------------------------------
 
+_DB_PROXY = ThreadBoundDatabase()
+
 
 class _Base(Model):
-    pass
+    class Meta:
+        database = _DB_PROXY
 
 
 class MetaModel(_Base):
@@ -87,11 +127,13 @@ class MetaModel(_Base):
 
 class CharacterModel(_Base):
     ID = AutoField()
-    literal = TextField()
+    literal = TextField(index=True)
     stroke_count = IntegerField(null=True)
-    grade = TextField(null=True)
-    freq = TextField(null=True)
-    jlpt = TextField(null=True)
+    # numeric in KanjiDic2 but exposed as strings on Character, see
+    # _text_to_int / _int_to_text
+    grade = IntegerField(null=True)
+    freq = IntegerField(null=True)
+    jlpt = IntegerField(null=True)
 
     class Meta:
         table_name = "character"
@@ -207,6 +249,22 @@ class MeaningModel(_Base):
         primary_key = False
 
 
+class CharacterBlobModel(_Base):
+    """
+    Denormalized copy of a whole character, serialized as JSON at import time.
+
+    Kept in its own table (rather than as a column on ``character``) so that
+    databases created by the original schema stay readable; characters without
+    a blob are rebuilt from the child tables instead.
+    """
+
+    cid = IntegerField(primary_key=True, column_name="cid")
+    blob = TextField()
+
+    class Meta:
+        table_name = "character_blob"
+
+
 # Ordered so parent tables are created before child tables.
 ALL_MODELS = [
     MetaModel,
@@ -222,8 +280,305 @@ ALL_MODELS = [
     RMGroupModel,
     ReadingModel,
     MeaningModel,
+    CharacterBlobModel,
 ]
 
+# Columns written by _insert_batch(), one executemany() per table.
+# Character and rm_group IDs are assigned up front so child rows can
+# reference them.
+_INSERT_FIELDS = {
+    CharacterModel: [
+        CharacterModel.ID,
+        CharacterModel.literal,
+        CharacterModel.stroke_count,
+        CharacterModel.grade,
+        CharacterModel.freq,
+        CharacterModel.jlpt,
+    ],
+    CodePointModel: [CodePointModel.cid, CodePointModel.cp_type, CodePointModel.value],
+    RadicalModel: [RadicalModel.cid, RadicalModel.rad_type, RadicalModel.value],
+    StrokeMiscountModel: [StrokeMiscountModel.cid, StrokeMiscountModel.value],
+    VariantModel: [VariantModel.cid, VariantModel.var_type, VariantModel.value],
+    RadNameModel: [RadNameModel.cid, RadNameModel.value],
+    DicRefModel: [
+        DicRefModel.cid,
+        DicRefModel.dr_type,
+        DicRefModel.value,
+        DicRefModel.m_vol,
+        DicRefModel.m_page,
+    ],
+    QueryCodeModel: [
+        QueryCodeModel.cid,
+        QueryCodeModel.qc_type,
+        QueryCodeModel.value,
+        QueryCodeModel.skip_misclass,
+    ],
+    NanoriModel: [NanoriModel.cid, NanoriModel.value],
+    RMGroupModel: [RMGroupModel.ID, RMGroupModel.cid],
+    ReadingModel: [
+        ReadingModel.gid,
+        ReadingModel.r_type,
+        ReadingModel.value,
+        ReadingModel.on_type,
+        ReadingModel.r_status,
+    ],
+    MeaningModel: [MeaningModel.gid, MeaningModel.value, MeaningModel.m_lang],
+    CharacterBlobModel: [CharacterBlobModel.cid, CharacterBlobModel.blob],
+}
+
+
+# prebuilt INSERT statements; the rows are plain values, so they bypass
+# peewee's per-field conversion
+_SQL_INSERT = {model: _insert_sql(fields) for model, fields in _INSERT_FIELDS.items()}
+
+
+def _text_to_int(value):
+    """Coerce a numeric KanjiDic2 text value for an INTEGER column ('' → None)."""
+    if not value:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _int_to_text(value) -> Optional[str]:
+    """Inverse of _text_to_int — Character keeps these values as strings."""
+    return None if value is None else str(value)
+
+
+# ---------------------------------------------------------------------------
+# JSON blob (de)serialization
+#
+# The blob holds exactly the values _build_char would read from the child
+# tables (None → "" where the join path does the same).  Database IDs are
+# not stored: the character ID comes from the row itself and rm_group IDs
+# are fetched alongside.
+# ---------------------------------------------------------------------------
+
+
+def _char_to_blob(c: Character) -> str:
+    return _json_dumps({
+        "codepoints": [[cp.cp_type or "", cp.value or ""] for cp in c.codepoints],
+        "radicals": [[rad.rad_type or "", rad.value or ""] for rad in c.radicals],
+        "stroke_miscounts": list(c.stroke_miscounts),
+        "variants": [[v.var_type or "", v.value or ""] for v in c.variants],
+        "rad_names": list(c.rad_names),
+        "dic_refs": [
+            [dr.dr_type or "", dr.value or "", dr.m_vol or "", dr.m_page or ""]
+            for dr in c.dic_refs
+        ],
+        "query_codes": [
+            [qc.qc_type or "", qc.value or "", qc.skip_misclass or ""]
+            for qc in c.query_codes
+        ],
+        "nanoris": list(c.nanoris),
+        "rm_groups": [
+            [
+                [[r.r_type or "", r.value or "", r.on_type or "", r.r_status or ""]
+                 for r in rmg.readings],
+                [[m.value or "", m.m_lang or ""] for m in rmg.meanings],
+            ]
+            for rmg in c.rm_groups
+        ],
+    })
+
+
+def _fill_char_from_blob(c: Character, blob: str, gids: List[int]) -> Character:
+    """Populate the child collections of *c* from a JSON *blob*."""
+    data = _json_loads(blob)
+    cid = c.ID
+    for cp_type, value in data["codepoints"]:
+        cp = CodePoint(cp_type, value)
+        cp.cid = cid
+        c.codepoints.append(cp)
+    for rad_type, value in data["radicals"]:
+        rad = Radical(rad_type, value)
+        rad.cid = cid
+        c.radicals.append(rad)
+    c.stroke_miscounts.extend(data["stroke_miscounts"])
+    for var_type, value in data["variants"]:
+        v = Variant(var_type, value)
+        v.cid = cid
+        c.variants.append(v)
+    c.rad_names.extend(data["rad_names"])
+    for dr_type, value, m_vol, m_page in data["dic_refs"]:
+        dr = DicRef(dr_type, value, m_vol, m_page)
+        dr.cid = cid
+        c.dic_refs.append(dr)
+    for qc_type, value, skip_misclass in data["query_codes"]:
+        qc = QueryCode(qc_type, value, skip_misclass)
+        qc.cid = cid
+        c.query_codes.append(qc)
+    c.nanoris.extend(data["nanoris"])
+    for gid, (readings, meanings) in zip(gids, data["rm_groups"]):
+        rmg = RMGroup()
+        rmg.ID = gid
+        rmg.cid = cid
+        for r_type, value, on_type, r_status in readings:
+            r = Reading(r_type, value, on_type, r_status)
+            r.gid = gid
+            rmg.readings.append(r)
+        for value, m_lang in meanings:
+            m = Meaning(value, m_lang)
+            m.gid = gid
+            rmg.meanings.append(m)
+        c.rm_groups.append(rmg)
+    return c
+
+
+# ---------------------------------------------------------------------------
+# Hot-path SQL
+#
+# The read path runs these fixed statements straight through the DB-API
+# cursor: the SQL text only depends on the number of bound keys, so sqlite3's
+# statement cache re-uses the prepared statements instead of peewee building
+# and rendering a query AST on every call.
+# ---------------------------------------------------------------------------
+
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER on older builds
+_MAX_SQL_VARS = 999
+
+
+def _char_statements(select: str) -> Dict[str, str]:
+    """The character-row statements built on *select*."""
+    return {
+        "all": select + 'ORDER BY c."ID"',
+        "by_literal": select + 'WHERE c."literal" = ?',
+        "by_id": select + 'WHERE c."ID" = ?',
+        "by_literals": select + 'WHERE c."literal" IN ({}) ORDER BY c."ID"',
+    }
+
+
+_SQL_CHAR = _char_statements(
+    'SELECT c."ID", c."literal", c."stroke_count", c."grade", c."freq", c."jlpt", b."blob" '
+    'FROM "character" AS c LEFT OUTER JOIN "character_blob" AS b ON (b."cid" = c."ID") '
+)
+# a read-only file built before character_blob existed: every row takes the
+# child-table path
+_SQL_CHAR_NO_BLOB = _char_statements(
+    'SELECT c."ID", c."literal", c."stroke_count", c."grade", c."freq", c."jlpt", NULL '
+    'FROM "character" AS c '
+)
+
+# child tables, each selected with its owner key (cid or gid) first
+_SQL_CHILDREN = {
+    "codepoint": 'SELECT "cid", "cp_type", "value" FROM "codepoint"',
+    "radical": 'SELECT "cid", "rad_type", "value" FROM "radical"',
+    "stroke_miscount": 'SELECT "cid", "value" FROM "stroke_miscount"',
+    "variant": 'SELECT "cid", "var_type", "value" FROM "variant"',
+    "rad_name": 'SELECT "cid", "value" FROM "rad_name"',
+    "dic_ref": 'SELECT "cid", "dr_type", "value", "m_vol", "m_page" FROM "dic_ref"',
+    "query_code": 'SELECT "cid", "qc_type", "value", "skip_misclass" FROM "query_code"',
+    "nanori": 'SELECT "cid", "value" FROM "nanori"',
+    "rm_group": 'SELECT "cid", "ID" FROM "rm_group"',
+    "reading": 'SELECT "gid", "r_type", "value", "on_type", "r_status" FROM "reading"',
+    "meaning": 'SELECT "gid", "value", "m_lang" FROM "meaning"',
+}
+_CID_TABLES = (
+    "codepoint",
+    "radical",
+    "stroke_miscount",
+    "variant",
+    "rad_name",
+    "dic_ref",
+    "query_code",
+    "nanori",
+)
+
+
+def _placeholders(n: int) -> str:
+    return ", ".join("?" * n)
+
+
+def _assemble_char(row: tuple, gids, children: dict, readings: dict, meanings: dict) -> Character:
+    """
+    Build a Character from its character *row* plus child rows grouped by owner.
+
+    *row* is ``(ID, literal, stroke_count, grade, freq, jlpt, blob)``; *gids*
+    are its rm_group IDs in insertion order.  *children*, *readings* and
+    *meanings* map table name / gid to the grouped rows; characters that have
+    a JSON blob only need *gids*.
+    """
+    cid, literal, stroke_count, grade, freq, jlpt, blob = row
+    c = Character()
+    c.ID = cid
+    c.literal = literal
+    c.stroke_count = stroke_count
+    c.grade = _int_to_text(grade)
+    c.freq = _int_to_text(freq)
+    c.jlpt = _int_to_text(jlpt)
+    if blob is not None:
+        return _fill_char_from_blob(c, blob, gids)
+
+    def rows_of(table):
+        return children[table].get(cid, ())
+
+    for _, cp_type, value in rows_of("codepoint"):
+        cp = CodePoint(cp_type or "", value or "")
+        cp.cid = cid
+        c.codepoints.append(cp)
+    for _, rad_type, value in rows_of("radical"):
+        rad = Radical(rad_type or "", value or "")
+        rad.cid = cid
+        c.radicals.append(rad)
+    for _, value in rows_of("stroke_miscount"):
+        c.stroke_miscounts.append(value)
+    for _, var_type, value in rows_of("variant"):
+        v = Variant(var_type or "", value or "")
+        v.cid = cid
+        c.variants.append(v)
+    for _, value in rows_of("rad_name"):
+        c.rad_names.append(value)
+    for _, dr_type, value, m_vol, m_page in rows_of("dic_ref"):
+        dr = DicRef(dr_type or "", value or "", m_vol or "", m_page or "")
+        dr.cid = cid
+        c.dic_refs.append(dr)
+    for _, qc_type, value, skip_misclass in rows_of("query_code"):
+        qc = QueryCode(qc_type or "", value or "", skip_misclass or "")
+        qc.cid = cid
+        c.query_codes.append(qc)
+    for _, value in rows_of("nanori"):
+        c.nanoris.append(value)
+    for gid in gids:
+        rmg = RMGroup()
+        rmg.ID = gid
+        rmg.cid = cid
+        for _, r_type, value, on_type, r_status in readings.get(gid, ()):
+            r = Reading(r_type or "", value or "", on_type or "", r_status or "")
+            r.gid = gid
+            rmg.readings.append(r)
+        for _, value, m_lang in meanings.get(gid, ()):
+            m = Meaning(value or "", m_lang or "")
+            m.gid = gid
+            rmg.meanings.append(m)
+        c.rm_groups.append(rmg)
+    return c
+
+
+# ---------------------------------------------------------------------------
+# Process-level connection pool
+#
+# File-backed KanjiDic2DB instances opened on the same database file share
+# one SqliteDatabase (peewee still hands each thread its own connection), so
+# short-lived instances skip the connect + schema probe + meta seeding.
+# Entries are keyed by (path, device, inode) so a file that was deleted and
+# re-created is never served a handle to the old inode.  :memory: databases
+# are never pooled — each of them must stay independent.
+# ---------------------------------------------------------------------------
+
+_POOL: Dict[Tuple[str, int, int], SqliteDatabase] = {}
+_POOL_REFS: Dict[Tuple[str, int, int], int] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _pool_key(db_path: str) -> Optional[Tuple[str, int, int]]:
+    try:
+        st = os.stat(db_path)
+    except OSError:
+        return None
+    return (db_path, st.st_dev, st.st_ino)
+
 
 # ---------------------------------------------------------------------------
 # KanjiDic2DB — the clean public API
@@ -234,9 +589,10 @@ class KanjiDic2DB:
     """
     peewee-backed KanjiDic2 SQLite store.
 
-    Each instance owns its own SqliteDatabase connection.  Multiple instances
-    with different paths (including ':memory:') can coexist in the same
-    process.
+    Each ':memory:' instance owns its own SqliteDatabase connection;
+    file-backed instances opened on the same file share a pooled one that is
+    closed when the last of them is closed.  Multiple instances with different
+    paths (including ':memory:') can coexist in the same process.
 
     Typical usage::
 
@@ -270,21 +626,84 @@ class KanjiDic2DB:
             os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
         self._db_path = db_path
-        self._db = SqliteDatabase(
-            db_path,
-            pragmas={"foreign_keys": 0},
-        )
-        with self._db.bind_ctx(ALL_MODELS):
+        self._pool_key = None
+        self._get_char_cached = cache_hits(self._get_char, CHAR_CACHE_SIZE)
+        self._get_char_by_id_cached = cache_hits(self._get_char_by_id, CHAR_CACHE_SIZE)
+        if db_path and db_path != ":memory:":
+            with _POOL_LOCK:
+                key = _pool_key(db_path)
+                if key in _POOL:
+                    self._db = _POOL[key]
+                else:
+                    self._open()
+                    key = _pool_key(db_path)
+                    _POOL[key] = self._db
+                    _POOL_REFS[key] = 0
+                _POOL_REFS[key] += 1
+                self._pool_key = key
+        else:
+            self._open()
+        if self._db.table_exists(CharacterBlobModel._meta.table_name):
+            self._sql = _SQL_CHAR
+        else:
+            self._sql = _SQL_CHAR_NO_BLOB
+
+    def _open(self) -> None:
+        """Create, connect and initialise a new SqliteDatabase for this instance."""
+        pragmas = {
+            "page_size": 8192,
+            "foreign_keys": 0,
+            "synchronous": "NORMAL",
+            "cache_size": -65536,
+            "mmap_size": MMAP_SIZE,
+            "temp_store": "MEMORY",
+            "journal_size_limit": 64 << 20,
+        }
+        self._db = open_sqlite(self._db_path, pragmas, cached_statements=256)
+        with _DB_PROXY.bound(self._db):
             self._db.connect(reuse_if_open=True)
-            self._db.create_tables(ALL_MODELS, safe=True)
-        self._seed_meta()
+            if self._db_path != ":memory:":
+                # WAL keeps readers lock-free; an in-memory database cannot use it
+                self._enable_wal()
+            new_schema = not CharacterModel.table_exists()
+            self._create_tables()
+        self._seed_meta(new_schema)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _seed_meta(self) -> None:
-        """Insert default metadata rows if they are absent."""
+    def _enable_wal(self) -> None:
+        """Put a file database in WAL mode; a read-only file keeps its mode."""
+        try:
+            self._db.pragma("journal_mode", "wal")
+        except OperationalError:
+            getLogger().debug(
+                "KanjiDic2DB: %s is read-only, journal mode unchanged", self._db_path
+            )
+
+    def _create_tables(self) -> None:
+        """Create missing tables and indexes.
+
+        A read-only file built by an older release is used as it is, without
+        the indexes it lacks.
+        """
+        try:
+            create_schema(self._db, ALL_MODELS)
+        except OperationalError as e:
+            if "readonly" not in str(e):
+                raise
+            getLogger().debug(
+                "KanjiDic2DB: %s is read-only, schema unchanged", self._db_path
+            )
+
+    def _seed_meta(self, new_schema: bool = False) -> None:
+        """
+        Insert default metadata rows if they are absent.
+
+        The schema version is only recorded for tables created by this class;
+        older databases keep their TEXT columns and are left unmarked.
+        """
         defaults = [
             (KEY_FILE_VER, ""),
             (KEY_DB_VER, ""),
@@ -296,10 +715,19 @@ class KanjiDic2DB:
             ("generator_version", JAMDICT_VERSION),
             ("generator_url", JAMDICT_URL),
         ]
-        with self._db.bind_ctx(ALL_MODELS):
+        if new_schema:
+            defaults.append((KEY_SCHEMA_VER, KANJIDIC2_SCHEMA_VERSION))
+        # One SELECT to find what is missing, then a single executemany.  The
+        # probe keeps already-seeded (possibly read-only) databases write-free.
+        existing = {
+            key for (key,) in self._db.execute_sql("SELECT key FROM meta").fetchall()
+        }
+        missing = [(key, value) for key, value in defaults if key not in existing]
+        if missing:
             with self._db.atomic():
-                for key, value in defaults:
-                    MetaModel.get_or_create(key=key, defaults={"value": value})
+                self._db.cursor().executemany(
+                    "INSERT OR IGNORE INTO meta(key, value) VALUES (?, ?)", missing
+                )
 
     # ------------------------------------------------------------------
     # Metadata
@@ -317,23 +745,22 @@ class KanjiDic2DB:
             (KEY_DB_VER, database_version),
             (KEY_CREATED_DATE, date_of_creation),
         ]
-        with self._db.bind_ctx(ALL_MODELS):
-            with self._db.atomic():
-                for key, value in rows:
-                    MetaModel.insert(key=key, value=value).on_conflict(
-                        conflict_target=[MetaModel.key],
-                        update={MetaModel.value: value},
-                    ).execute()
+        with self._db.atomic():
+            self._db.cursor().executemany(
+                "INSERT INTO meta(key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                rows,
+            )
 
     def get_meta(self, key: str) -> Optional[str]:
         """Return the value for *key* from the meta table, or None."""
-        with self._db.bind_ctx(ALL_MODELS):
+        with _DB_PROXY.bound(self._db):
             row = MetaModel.get_or_none(MetaModel.key == key)
         return row.value if row is not None else None
 
     def all_meta(self) -> List[tuple]:
         """Return all metadata rows as a list of ``(key, value)`` tuples."""
-        with self._db.bind_ctx(ALL_MODELS):
+        with _DB_PROXY.bound(self._db):
             return [
                 (row.key, row.value)
                 for row in MetaModel.select().order_by(MetaModel.key)
@@ -344,239 +771,361 @@ class KanjiDic2DB:
     # ------------------------------------------------------------------
 
     def get_char(self, literal: str) -> Optional[Character]:
-        """Return the Character for the given *literal*, or None if not found."""
-        with self._db.bind_ctx(ALL_MODELS):
-            row = CharacterModel.get_or_none(CharacterModel.literal == literal)
-            if row is None:
-                return None
-            return self._build_char(row)
+        """
+        Return the Character for the given *literal*, or None if not found.
+
+        Memoized like :meth:`get_char_by_id`, with the same read-only caveat.
+        """
+        return self._get_char_cached(literal)
+
+    def _get_char(self, literal: str) -> Optional[Character]:
+        row = self._db.execute_sql(self._sql["by_literal"], (literal,)).fetchone()
+        if row is None:
+            return None
+        return self._build_char(row)
 
     def get_char_by_id(self, cid: int) -> Optional[Character]:
-        """Return the Character with the given internal *cid*, or None if not found."""
-        with self._db.bind_ctx(ALL_MODELS):
-            row = CharacterModel.get_or_none(CharacterModel.ID == cid)
-            if row is None:
-                return None
-            return self._build_char(row)
-
-    def _build_char(self, row: CharacterModel) -> Character:
         """
-        Reconstruct a full Character domain object from a CharacterModel row.
+        Return the Character with the given internal *cid*, or None if not found.
+
+        Results are memoized per instance (up to ``CHAR_CACHE_SIZE`` entries)
+        and the same Character object is returned for repeated calls, so
+        callers must treat it as read-only — mutating it changes what later
+        calls see.  The cache is cleared by this instance's inserts and by
+        close(); misses are not cached, so characters added through another
+        instance sharing the file are still found.
+        """
+        return self._get_char_by_id_cached(cid)
+
+    def _get_char_by_id(self, cid: int) -> Optional[Character]:
+        row = self._db.execute_sql(self._sql["by_id"], (cid,)).fetchone()
+        if row is None:
+            return None
+        return self._build_char(row)
+
+    def _build_char(self, row: tuple) -> Character:
+        """Reconstruct a full Character domain object from a character row."""
+        return self._build_chars([row])[0]
 
-        Must be called inside an active bind_ctx block.
+    def _build_chars(self, rows) -> List[Character]:
         """
-        c = Character()
-        c.ID = row.ID
-        c.literal = row.literal
-        c.stroke_count = row.stroke_count
-        c.grade = row.grade
-        c.freq = row.freq
-        c.jlpt = row.jlpt
-
-        # codepoints
-        for cp_row in CodePointModel.select().where(CodePointModel.cid == row.ID):
-            cp = CodePoint(cp_row.cp_type or "", cp_row.value or "")
-            cp.cid = row.ID
-            c.codepoints.append(cp)
-
-        # radicals
-        for rad_row in RadicalModel.select().where(RadicalModel.cid == row.ID):
-            rad = Radical(rad_row.rad_type or "", rad_row.value or "")
-            rad.cid = row.ID
-            c.radicals.append(rad)
-
-        # stroke miscounts
-        for smc_row in StrokeMiscountModel.select().where(
-            StrokeMiscountModel.cid == row.ID
-        ):
-            c.stroke_miscounts.append(smc_row.value)
-
-        # variants
-        for v_row in VariantModel.select().where(VariantModel.cid == row.ID):
-            v = Variant(v_row.var_type or "", v_row.value or "")
-            v.cid = row.ID
-            c.variants.append(v)
-
-        # rad_names
-        for rn_row in RadNameModel.select().where(RadNameModel.cid == row.ID):
-            c.rad_names.append(rn_row.value)
-
-        # dic_refs
-        for dr_row in DicRefModel.select().where(DicRefModel.cid == row.ID):
-            dr = DicRef(
-                dr_row.dr_type or "",
-                dr_row.value or "",
-                dr_row.m_vol or "",
-                dr_row.m_page or "",
-            )
-            dr.cid = row.ID
-            c.dic_refs.append(dr)
+        Reconstruct Character objects for a batch of character rows.
 
-        # query_codes
-        for qc_row in QueryCodeModel.select().where(QueryCodeModel.cid == row.ID):
-            qc = QueryCode(
-                qc_row.qc_type or "", qc_row.value or "", qc_row.skip_misclass or ""
+        *rows* are ``(ID, literal, stroke_count, grade, freq, jlpt, blob)``
+        tuples as selected by the ``_SQL_CHAR`` statements.  Each child
+        table is read once for the whole batch (``WHERE cid IN (...)``);
+        characters with a JSON blob skip everything but their rm_group IDs.
+        """
+        rows = list(rows)
+        cids = [row[0] for row in rows]
+        join_cids = [row[0] for row in rows if row[6] is None]
+        rm_groups = self._fetch_grouped("rm_group", "cid", cids)
+        children = {
+            table: self._fetch_grouped(table, "cid", join_cids) for table in _CID_TABLES
+        }
+        gids = [gid for cid in join_cids for (_, gid) in rm_groups.get(cid, ())]
+        readings = self._fetch_grouped("reading", "gid", gids)
+        meanings = self._fetch_grouped("meaning", "gid", gids)
+        return [
+            _assemble_char(
+                row,
+                [gid for (_, gid) in rm_groups.get(row[0], ())],
+                children,
+                readings,
+                meanings,
             )
-            qc.cid = row.ID
-            c.query_codes.append(qc)
-
-        # nanoris
-        for n_row in NanoriModel.select().where(NanoriModel.cid == row.ID):
-            c.nanoris.append(n_row.value)
-
-        # rm_groups
-        for rmg_row in RMGroupModel.select().where(RMGroupModel.cid == row.ID):
-            rmg = RMGroup()
-            rmg.ID = rmg_row.ID
-            rmg.cid = row.ID
-            for r_row in ReadingModel.select().where(ReadingModel.gid == rmg_row.ID):
-                r = Reading(
-                    r_row.r_type or "",
-                    r_row.value or "",
-                    r_row.on_type or "",
-                    r_row.r_status or "",
-                )
-                r.gid = rmg_row.ID
-                rmg.readings.append(r)
-            for m_row in MeaningModel.select().where(MeaningModel.gid == rmg_row.ID):
-                m = Meaning(m_row.value or "", m_row.m_lang or "")
-                m.gid = rmg_row.ID
-                rmg.meanings.append(m)
-            c.rm_groups.append(rmg)
+            for row in rows
+        ]
 
-        return c
+    def _fetch_grouped(self, table: str, key: str, keys) -> dict:
+        """Read the rows of child *table* owned by *keys*, grouped by owner key."""
+        grouped = {}
+        for batch in chunked(keys, _MAX_SQL_VARS):
+            sql = f'{_SQL_CHILDREN[table]} WHERE "{key}" IN ({_placeholders(len(batch))})'
+            for row in self._db.execute_sql(sql, batch):
+                grouped.setdefault(row[0], []).append(row)
+        return grouped
 
     def search_chars_iter(self, literals) -> Iterator[Character]:
         """
         Yield a Character for each literal in *literals* that exists in the database.
 
         Skips literals that are not found rather than raising an error.
+        Literals are resolved in batches of up to 999 with one character
+        query plus one query per child table per batch.
+        """
+        for batch in chunked(literals, _MAX_SQL_VARS):
+            unique = list(dict.fromkeys(batch))
+            sql = self._sql["by_literals"].format(_placeholders(len(unique)))
+            first_rows = {}
+            for row in self._db.execute_sql(sql, unique):
+                first_rows.setdefault(row[1], row)
+            found = {c.literal: c for c in self._build_chars(first_rows.values())}
+            for literal in batch:
+                c = found.get(literal)
+                if c is not None:
+                    yield c
+
+    def get_chars(self, literals) -> Dict[str, Character]:
+        """
+        Return ``{literal: Character}`` for the *literals* found in the database.
+
+        The batched counterpart of :meth:`get_char`; missing literals are
+        simply absent from the result.
         """
-        for literal in literals:
-            c = self.get_char(literal)
-            if c is not None:
-                yield c
+        return {c.literal: c for c in self.search_chars_iter(literals)}
 
     def all_chars(self) -> List[Character]:
-        """Return all characters in the database as a list."""
-        with self._db.bind_ctx(ALL_MODELS):
-            cids = [row.ID for row in CharacterModel.select(CharacterModel.ID)]
-        result = []
-        for cid in cids:
-            c = self.get_char_by_id(cid)
-            if c is not None:
-                result.append(c)
-        return result
+        """Return all characters in the database as a list (see :meth:`load_all_raw`)."""
+        return self.load_all_raw()
+
+    def load_all_raw(self) -> List[Character]:
+        """
+        Load every character in the database in one pass.
+
+        Each table is read sequentially exactly once with a plain cursor (no
+        WHERE clause, no peewee models) and child rows are stitched onto their
+        characters in Python.  Child tables other than rm_group are skipped
+        entirely when every character has a JSON blob.
+        """
+        rows = self._db.execute_sql(self._sql["all"]).fetchall()
+        rm_groups = self._scan_grouped("rm_group")
+        if any(row[6] is None for row in rows):
+            children = {table: self._scan_grouped(table) for table in _CID_TABLES}
+            readings = self._scan_grouped("reading")
+            meanings = self._scan_grouped("meaning")
+        else:
+            children = readings = meanings = {}
+        return [
+            _assemble_char(
+                row,
+                [gid for (_, gid) in rm_groups.get(row[0], ())],
+                children,
+                readings,
+                meanings,
+            )
+            for row in rows
+        ]
+
+    def _scan_grouped(self, table: str) -> dict:
+        """Read all rows of child *table*, grouped by owner key."""
+        grouped = {}
+        cursor = self._db.execute_sql(_SQL_CHILDREN[table])
+        while True:
+            batch = cursor.fetchmany(10000)
+            if not batch:
+                return grouped
+            for row in batch:
+                grouped.setdefault(row[0], []).append(row)
 
     # ------------------------------------------------------------------
     # Import
     # ------------------------------------------------------------------
 
-    def insert_chars(self, chars) -> None:
+    def insert_chars(self, chars, workers: int = 1) -> None:
         """
         Bulk-insert a collection of Character objects.
 
-        Wraps the entire operation in a single transaction with performance
-        PRAGMAs to match the throughput of the original puchikarui buckmode.
+        Everything goes in a single transaction with ``synchronous=OFF`` (and
+        an in-memory rollback journal unless the file is in WAL mode), so a
+        file database is synced once rather than once per character.  Each
+        run of ``INSERT_BATCH_SIZE`` characters costs one ``executemany()``
+        per table.
+
+        With ``workers > 1`` (file-backed databases only) the characters are
+        split into contiguous shards that *workers* processes insert into
+        temporary databases in parallel; the shards are then ATTACHed and
+        copied into this database with their IDs offset, so the result is the
+        same as a serial insert.  This starts worker processes, so on
+        platforms that spawn them the calling script needs the usual
+        ``if __name__ == "__main__":`` guard.
+
+        Characters whose literal is already stored are skipped (and keep
+        their ``ID``), so importing the same file twice adds nothing.
         """
         getLogger().debug("KanjiDic2DB: bulk insert %d characters", len(chars))
-        with self._db.bind_ctx(ALL_MODELS):
-            if self._db_path != ":memory:":
+        self._get_char_cached.cache_clear()
+        self._get_char_by_id_cached.cache_clear()
+        if workers > 1 and self._db_path != ":memory:" and len(chars) >= workers:
+            chars = skip_stored(self._db, chars, lambda c: c.literal, "character", "literal")
+            if len(chars) >= workers:
+                self._insert_chars_sharded(chars, workers)
+                return
+        with _DB_PROXY.bound(self._db):
+            # a file shared with a WAL-mode JMDictDB must stay in WAL:
+            # leaving it requires exclusive access to the file
+            if self._db_path != ":memory:" and self._db.pragma("journal_mode") != "wal":
                 self._db.execute_sql("PRAGMA journal_mode=MEMORY")
-            self._db.execute_sql("PRAGMA cache_size=-65536")
-            self._db.execute_sql("PRAGMA temp_store=MEMORY")
+            self._db.pragma("synchronous", "OFF")
+            try:
+                with self._db.atomic():
+                    for batch in chunked(chars, INSERT_BATCH_SIZE):
+                        self._insert_batch(batch)
+            finally:
+                self._db.pragma("synchronous", "NORMAL")
+            truncate_wal(self._db)
+
+    def _insert_chars_sharded(self, chars: List[Character], workers: int) -> None:
+        """Parallel insert_chars: build one shard database per worker, then merge."""
+        size = -(-len(chars) // workers)
+        shards = [chars[i:i + size] for i in range(0, len(chars), size)]
+        with tempfile.TemporaryDirectory(prefix="kanjidic2_") as tmpdir:
+            paths = [os.path.join(tmpdir, f"shard{i}.db") for i in range(len(shards))]
+            spawn = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=len(shards), mp_context=spawn) as pool:
+                list(pool.map(_insert_shard, paths, shards))
+            for path, shard in zip(paths, shards):
+                self._merge_shard(path, shard)
+        truncate_wal(self._db)
+
+    def _merge_shard(self, shard_path: str, chars: List[Character]) -> None:
+        """
+        Copy every table of the shard database at *shard_path* into this one.
+
+        Shard IDs start at 1, so character and rm_group IDs (and the cid/gid
+        references to them) are shifted past this database's current maximum.
+        """
+        execute = self._db.execute_sql
+        cbase = execute('SELECT COALESCE(MAX("ID"), 0) FROM "character"').fetchone()[0]
+        gbase = execute('SELECT COALESCE(MAX("ID"), 0) FROM "rm_group"').fetchone()[0]
+        offsets = {"cid": cbase, "gid": gbase}
+        execute("ATTACH DATABASE ? AS shard", (shard_path,))
+        try:
             with self._db.atomic():
-                for c in chars:
-                    self._insert_char_unsafe(c)
+                for model in ALL_MODELS:
+                    if model is MetaModel:
+                        continue
+                    columns, exprs, params = [], [], []
+                    for field in model._meta.sorted_fields:
+                        col = field.column_name
+                        columns.append(f'"{col}"')
+                        if col == "ID":
+                            offset = cbase if model is CharacterModel else gbase
+                        elif col in offsets:
+                            offset = offsets[col]
+                        else:
+                            exprs.append(f'"{col}"')
+                            continue
+                        exprs.append(f'"{col}" + ?')
+                        params.append(offset)
+                    table = model._meta.table_name
+                    execute(
+                        f'INSERT INTO main."{table}" ({", ".join(columns)}) '
+                        f'SELECT {", ".join(exprs)} FROM shard."{table}"',
+                        params,
+                    )
+        finally:
+            execute("DETACH DATABASE shard")
+        # propagate IDs as the serial path does; shards number rows 1..n in
+        # insertion order
+        gid = gbase
+        for cid, c in enumerate(chars, start=cbase + 1):
+            c.ID = cid
+            for rmg in c.rm_groups:
+                gid += 1
+                rmg.ID = gid
 
     def insert_char(self, c: Character) -> None:
-        """Insert a single Character and all its child rows."""
-        with self._db.bind_ctx(ALL_MODELS):
-            self._insert_char_unsafe(c)
+        """Insert a single Character and its child rows unless the literal is stored."""
+        self._get_char_cached.cache_clear()
+        self._get_char_by_id_cached.cache_clear()
+        with _DB_PROXY.bound(self._db):
+            with self._db.atomic():
+                self._insert_batch([c])
 
-    def _insert_char_unsafe(self, c: Character) -> None:
+    def _insert_batch(self, chars) -> None:
         """
-        Insert a single Character without acquiring bind_ctx.
+        Insert Character objects and all their child rows, table by table.
 
-        Must only be called from within an active bind_ctx block.
+        The assigned IDs are written back to each Character and RMGroup so
+        that callers (e.g. test_xml2sqlite) can use them after insertion.
+        Characters whose literal is already stored are skipped.
+        Must only be called from within an active ``_DB_PROXY.bound()`` block.
         """
-        row = CharacterModel.create(
-            literal=c.literal,
-            stroke_count=c.stroke_count,
-            grade=c.grade,
-            freq=c.freq,
-            jlpt=c.jlpt,
-        )
-        # propagate the DB-assigned ID back to the domain object so that
-        # callers (e.g. test_xml2sqlite) can use c.ID after insertion
-        c.ID = row.ID
-
-        # codepoints
-        for cp in c.codepoints:
-            CodePointModel.create(cid=row.ID, cp_type=cp.cp_type, value=cp.value)
-
-        # radicals
-        for rad in c.radicals:
-            RadicalModel.create(cid=row.ID, rad_type=rad.rad_type, value=rad.value)
-
-        # stroke miscounts
-        for smc in c.stroke_miscounts:
-            StrokeMiscountModel.create(cid=row.ID, value=smc)
-
-        # variants
-        for v in c.variants:
-            VariantModel.create(cid=row.ID, var_type=v.var_type, value=v.value)
-
-        # rad_names
-        for rn in c.rad_names:
-            RadNameModel.create(cid=row.ID, value=rn)
-
-        # dic_refs
-        for dr in c.dic_refs:
-            DicRefModel.create(
-                cid=row.ID,
-                dr_type=dr.dr_type,
-                value=dr.value,
-                m_vol=dr.m_vol,
-                m_page=dr.m_page,
+        chars = skip_stored(self._db, chars, lambda c: c.literal, "character", "literal")
+        rows = {model: [] for model in _INSERT_FIELDS}
+        execute = self._db.execute_sql
+        cid = execute('SELECT COALESCE(MAX("ID"), 0) FROM "character"').fetchone()[0]
+        gid = execute('SELECT COALESCE(MAX("ID"), 0) FROM "rm_group"').fetchone()[0]
+        for c in chars:
+            cid += 1
+            c.ID = cid
+            rows[CharacterModel].append((
+                cid,
+                c.literal,
+                c.stroke_count,
+                _text_to_int(c.grade),
+                _text_to_int(c.freq),
+                _text_to_int(c.jlpt),
+            ))
+            rows[CodePointModel].extend(
+                (cid, cp.cp_type, cp.value) for cp in c.codepoints
             )
-
-        # query_codes
-        for qc in c.query_codes:
-            QueryCodeModel.create(
-                cid=row.ID,
-                qc_type=qc.qc_type,
-                value=qc.value,
-                skip_misclass=qc.skip_misclass,
+            rows[RadicalModel].extend(
+                (cid, rad.rad_type, rad.value) for rad in c.radicals
             )
-
-        # nanoris
-        for n in c.nanoris:
-            NanoriModel.create(cid=row.ID, value=n)
-
-        # rm_groups
-        for rmg in c.rm_groups:
-            rmg_row = RMGroupModel.create(cid=row.ID)
-            rmg.ID = rmg_row.ID
-            for r in rmg.readings:
-                ReadingModel.create(
-                    gid=rmg_row.ID,
-                    r_type=r.r_type,
-                    value=r.value,
-                    on_type=r.on_type,
-                    r_status=r.r_status,
+            rows[StrokeMiscountModel].extend((cid, smc) for smc in c.stroke_miscounts)
+            rows[VariantModel].extend((cid, v.var_type, v.value) for v in c.variants)
+            rows[RadNameModel].extend((cid, rn) for rn in c.rad_names)
+            rows[DicRefModel].extend(
+                (cid, dr.dr_type, dr.value, dr.m_vol, dr.m_page) for dr in c.dic_refs
+            )
+            rows[QueryCodeModel].extend(
+                (cid, qc.qc_type, qc.value, qc.skip_misclass) for qc in c.query_codes
+            )
+            rows[NanoriModel].extend((cid, n) for n in c.nanoris)
+
+            # ---- reading/meaning groups -----------------------------
+            for rmg in c.rm_groups:
+                gid += 1
+                rmg.ID = gid
+                rows[RMGroupModel].append((gid, cid))
+                rows[ReadingModel].extend(
+                    (gid, r.r_type, r.value, r.on_type, r.r_status)
+                    for r in rmg.readings
                 )
-            for m in rmg.meanings:
-                MeaningModel.create(gid=rmg_row.ID, value=m.value, m_lang=m.m_lang)
+                rows[MeaningModel].extend(
+                    (gid, m.value, m.m_lang) for m in rmg.meanings
+                )
+
+            # denormalized copy for the single-row read path
+            rows[CharacterBlobModel].append((cid, _char_to_blob(c)))
+
+        cursor = self._db.cursor()
+        for model, model_rows in rows.items():
+            if model_rows:
+                cursor.executemany(_SQL_INSERT[model], model_rows)
 
     # ------------------------------------------------------------------
     # Resource management
     # ------------------------------------------------------------------
 
+    def set_query_only(self, enabled: bool = True) -> None:
+        """
+        Reject (or allow again) every write through this connection.
+
+        Instances pooled on the same file share the setting.
+        """
+        self._db.pragma("query_only", int(bool(enabled)), permanent=True)
+
     def close(self) -> None:
-        """Close the underlying database connection."""
-        if not self._db.is_closed():
-            self._db.close()
+        """
+        Close the underlying database connections of every thread.
+
+        A pooled connection is only closed once every instance sharing it has
+        been closed.  Calling close() more than once is harmless.
+        """
+        self._get_char_cached.cache_clear()
+        self._get_char_by_id_cached.cache_clear()
+        key, self._pool_key = self._pool_key, None
+        if key is not None:
+            with _POOL_LOCK:
+                _POOL_REFS[key] -= 1
+                if _POOL_REFS[key] > 0:
+                    return
+                del _POOL_REFS[key]
+                del _POOL[key]
+        self._db.close_all()
 
     def __enter__(self):
         return self
@@ -587,3 +1136,9 @@ class KanjiDic2DB:
 
     def __repr__(self) -> str:
         return f"KanjiDic2DB({self._db_path!r})"
+
+
+def _insert_shard(shard_path: str, chars: List[Character]) -> None:
+    """Worker entry point for KanjiDic2DB.insert_chars(workers=...)."""
+    with KanjiDic2DB(shard_path) as db:
+        db.insert_chars(chars)
@@ -32,7 +32,13 @@ logger = logging.getLogger(__name__)
 class KRad:
     ''' This class contains mapping from radicals to kanjis (radk) and kanjis to radicals (krad)
 
+    The parsed maps are shared by every KRad instance in the process, so the
+    radical file is read at most once.  Treat krad and radk as read-only:
+    changing them (or the sets in radk) changes them for every instance.
     '''
+    __shared_maps = None
+    __shared_lock = threading.Lock()
+
     def __init__(self, **kwargs):
         """ Kanji-Radical mapping """
         self.__krad_map: Mapping = None
@@ -42,21 +48,36 @@ class KRad:
 
     def _build_krad_map(self):
         with self.lock:
-            lines = chio.read_file(KRADFILE, mode='rt').splitlines()
-            # build the krad map
-            self.__krad_map = {}
-            self.__radk_map = dd(set)
-            for line in lines:
-                if line.startswith("#"):
-                    continue
-                else:
-                    parts = line.split(':', maxsplit=1)
-                    if len(parts) == 2:
-                        rads = [r.strip() for r in parts[1].split()]
-                        char_literal = parts[0].strip()
-                        self.__krad_map[char_literal] = rads
-                        for rad in rads:
-                            self.__radk_map[rad].add(char_literal)
+            if self.__krad_map is None:
+                self.__krad_map, self.__radk_map = KRad._shared()
+
+    @classmethod
+    def _shared(cls):
+        with cls.__shared_lock:
+            if cls.__shared_maps is None:
+                cls.__shared_maps = cls._parse_kradfile()
+            return cls.__shared_maps
+
+    @staticmethod
+    def _parse_kradfile():
+        lines = chio.read_file(KRADFILE, mode='rt').splitlines()
+        # build the krad map
+        krad_map = {}
+        radk_map = dd(set)
+        for line in lines:
+            if line.startswith("#"):
+                continue
+            else:
+                parts = line.split(':', maxsplit=1)
+                if len(parts) == 2:
+                    rads = [r.strip() for r in parts[1].split()]
+                    char_literal = parts[0].strip()
+                    krad_map[char_literal] = rads
+                    for rad in rads:
+                        radk_map[rad].add(char_literal)
+        # a plain dict: looking up a missing radical must not add it to the
+        # map every instance shares
+        return krad_map, dict(radk_map)
 
     @property
     def radk(self) -> Mapping:
@@ -94,7 +94,7 @@ def import_data(cli, args):
     t.start(
         "Creating Jamdict SQLite database. This process may take very long time ..."
     )
-    jam.import_data()
+    jam.import_data(parallel=args.parallel)
     t.stop()
 
 
@@ -329,6 +329,11 @@ def main():
 
     # import task
     import_task = app.add_task("import", func=import_data)
+    import_task.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Parse KanjiDic2 and JMnedict XML in worker processes",
+    )
     add_data_config(import_task)
 
     # show info
@@ -25,11 +25,17 @@ Intentional behavioural differences from util_old.py
 # :copyright: (c) 2016 Le Tuan Anh <tuananh.ke@gmail.com>
 # :license: MIT, see LICENSE for more details.
 
+import functools
 import logging
+import multiprocessing
 import os
+import sys
+import threading
 import warnings
-from collections import OrderedDict
-from typing import Iterator, List, Optional, Sequence
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
+from typing import List, Optional, Sequence, Tuple
 
 from chirptext.deko import HIRAGANA, KATAKANA
 
@@ -53,6 +59,19 @@ except Exception:
     _JAMDICT_DATA_AVAILABLE = False
 
 
+# characters that never need a KanjiDic2 lookup
+_KANA = frozenset(HIRAGANA + KATAKANA)
+
+# bits of Jamdict._avail_mask, one per configured data source
+_SRC_DB = 1
+_SRC_JMD_XML = 2
+_SRC_KD2 = 4
+_SRC_KD2_XML = 8
+_SRC_JMNE = 16
+_SRC_JMNE_XML = 32
+_SRC_ANY_KD2 = _SRC_DB | _SRC_KD2 | _SRC_KD2_XML
+
+
 # ---------------------------------------------------------------------------
 # Logger
 # ---------------------------------------------------------------------------
@@ -62,6 +81,109 @@ def getLogger():
     return logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# XML parse jobs (module level so they can run in a worker process)
+# ---------------------------------------------------------------------------
+
+
+def _parse_kd2_xml(path):
+    return Kanjidic2XMLParser().parse_file(os.path.abspath(os.path.expanduser(path)))
+
+
+def _parse_jmne_xml(path) -> List[JMDEntry]:
+    return list(JMDictXMLParser().parse_file_iter(path))
+
+
+# ---------------------------------------------------------------------------
+# Parallel lookups
+# ---------------------------------------------------------------------------
+
+_IO_POOL: Optional[ThreadPoolExecutor] = None
+_IO_POOL_LOCK = threading.Lock()
+
+
+def _io_pool() -> ThreadPoolExecutor:
+    """The thread pool shared by every ``Jamdict(parallel=True)``, created on first use."""
+    global _IO_POOL
+    if _IO_POOL is None:
+        with _IO_POOL_LOCK:
+            if _IO_POOL is None:
+                _IO_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="jamdict")
+    return _IO_POOL
+
+
+# ---------------------------------------------------------------------------
+# Caching helpers
+# ---------------------------------------------------------------------------
+
+# default number of results memoized per Jamdict query method
+DEFAULT_CACHE_SIZE = 1024
+
+
+def _instance_lru_cache(instance, func, maxsize):
+    """Return an LRU-cached ``func(instance, *args)`` bound to one *instance*.
+
+    The cache only keeps a weak reference to *instance* — a bound method would
+    create a reference cycle and delay ``__del__`` until the cyclic GC runs.
+    """
+    ref = weakref.ref(instance)
+
+    @functools.lru_cache(maxsize=maxsize)
+    def cached(*args):
+        return func(ref(), *args)
+
+    return cached
+
+
+class _DrainedCache:
+    """LRU store for ``lookup_iter`` results that were iterated to the end.
+
+    ``iterate()`` passes items through unchanged and only keeps them (as a
+    tuple) once the iterator is exhausted, so abandoned iterators cost nothing.
+    """
+
+    __slots__ = ("maxsize", "_items", "_lock")
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._items = {}
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[tuple]:
+        with self._lock:
+            items = self._items.pop(key, None)
+            if items is not None:
+                self._items[key] = items  # most recently used goes last
+            return items
+
+    def put(self, key, items: tuple) -> None:
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._items.pop(key, None)
+            if self.maxsize is not None and len(self._items) >= self.maxsize:
+                del self._items[next(iter(self._items))]
+            self._items[key] = items
+
+    def iterate(self, key, factory, *args):
+        """Replay *key* if it was drained before, else iterate ``factory(*args)``."""
+        items = self.get(key)
+        if items is not None:
+            return iter(items)
+        return self._drain(key, factory(*args))
+
+    def _drain(self, key, iterable):
+        items = []
+        for item in iterable:
+            items.append(item)
+            yield item
+        self.put(key, tuple(items))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
 # ---------------------------------------------------------------------------
 # LookupResult  (identical to util_old.LookupResult)
 # ---------------------------------------------------------------------------
@@ -77,8 +199,14 @@ class LookupResult:
 
     The command above returns a :any:`LookupResult` object which contains found words (:any:`entries`),
     kanji characters (:any:`chars`), and named entities (:any:`names`).
+
+    :meth:`Jamdict.lookup` caches its results, so repeated lookups (from any
+    thread) share one object — treat it as read-only; reassigning
+    :any:`entries`, :any:`chars` or :any:`names` changes the cached copy.
     """
 
+    __slots__ = ("__entries", "__chars", "__names")
+
     def __init__(self, entries, chars, names=None):
         self.__entries: Sequence[JMDEntry] = entries if entries else []
         self.__chars: Sequence[Character] = chars if chars else []
@@ -139,38 +267,31 @@ class LookupResult:
         :param with_chars: Include characters information
         :returns: A formatted string ready for display
         """
-        output = []
-        if self.entries:
-            entry_txts = []
-            for idx, e in enumerate(self.entries, start=1):
-                entry_txt = e.text(compact=compact, separator=" ", no_id=no_id)
-                entry_txts.append("#{}: {}".format(idx, entry_txt))
-            output.append("[Entries]")
-            output.append(entry_sep)
-            output.append(entry_sep.join(entry_txts))
+        # one flat buffer joined once at the end; properties are read once
+        entries, chars, names = self.entries, self.chars, self.names
+        buf: List[str] = []
+        append = buf.append
+        if entries:
+            append("[Entries]")
+            for idx, e in enumerate(entries, start=1):
+                append(entry_sep)
+                append(f"#{idx}: {e.text(compact=compact, separator=' ', no_id=no_id)}")
         elif not compact:
-            output.append("No entries")
-        if self.chars and with_chars:
-            if compact:
-                chars_txt = ", ".join(str(c) for c in self.chars)
-            else:
-                chars_txt = ", ".join(repr(c) for c in self.chars)
-            if output:
-                output.append(separator)
-            output.append("[Chars]")
-            output.append(entry_sep)
-            output.append(chars_txt)
-        if self.names:
-            name_txts = []
-            for idx, n in enumerate(self.names, start=1):
-                name_txt = n.text(compact=compact, separator=" ", no_id=no_id)
-                name_txts.append("#{}: {}".format(idx, name_txt))
-            if output:
-                output.append(separator)
-            output.append("[Names]")
-            output.append(entry_sep)
-            output.append(entry_sep.join(name_txts))
-        return "".join(output) if output else "Found nothing"
+            append("No entries")
+        if chars and with_chars:
+            if buf:
+                append(separator)
+            append("[Chars]")
+            append(entry_sep)
+            append(", ".join(map(str if compact else repr, chars)))
+        if names:
+            if buf:
+                append(separator)
+            append("[Names]")
+            for idx, n in enumerate(names, start=1):
+                append(entry_sep)
+                append(f"#{idx}: {n.text(compact=compact, separator=' ', no_id=no_id)}")
+        return "".join(buf) if buf else "Found nothing"
 
     def __repr__(self):
         return self.text(compact=True)
@@ -218,6 +339,8 @@ class IterLookupResult:
     ...     print(name)
     """
 
+    __slots__ = ("__entries", "__chars", "__names")
+
     def __init__(self, entries, chars=None, names=None):
         self.__entries = entries if entries is not None else []
         self.__chars = chars if chars is not None else []
@@ -248,17 +371,19 @@ class JMDictXML:
     """JMDict API for looking up information in XML"""
 
     def __init__(self, entries):
-        from collections import defaultdict as dd
-
         self.entries = entries
         self._seqmap = {}
-        self._textmap = dd(set)
+        textmap = {}
         for entry in self.entries:
             self._seqmap[entry.idseq] = entry
-            for kn in entry.kana_forms:
-                self._textmap[kn.text].add(entry)
-            for kj in entry.kanji_forms:
-                self._textmap[kj.text].add(entry)
+            for form in chain(entry.kana_forms, entry.kanji_forms):
+                bucket = textmap.setdefault(sys.intern(form.text), [])
+                # an entry's forms are visited together, so repeats are adjacent
+                if not bucket or bucket[-1] is not entry:
+                    bucket.append(entry)
+        # read-only after construction: tuples are smaller than sets and can
+        # be handed out as-is
+        self._textmap = {text: tuple(bucket) for text, bucket in textmap.items()}
 
     def __len__(self):
         return len(self.entries)
@@ -267,13 +392,11 @@ class JMDictXML:
         return self.entries[idx]
 
     def lookup(self, a_query) -> Sequence[JMDEntry]:
-        if a_query in self._textmap:
-            return tuple(self._textmap[a_query])
-        elif a_query.startswith("id#"):
-            entry_id = a_query[3:]
-            if entry_id in self._seqmap:
-                return (self._seqmap[entry_id],)
-        return ()
+        # id queries never match a written form, so test for them first
+        if a_query.startswith("id#"):
+            entry = self._seqmap.get(a_query[3:])
+            return (entry,) if entry is not None else ()
+        return self._textmap.get(a_query, ())
 
     @staticmethod
     def from_file(filename):
@@ -348,6 +471,15 @@ class Jamdict:
     With the peewee backend ``memory_mode`` is accepted for compatibility but
     is a no-op — the peewee implementation does not need pre-loading.
 
+    A Jamdict instance may be shared between threads for read queries
+    (``lookup``, ``get_entry``, ``get_char``, ...): every thread gets its own
+    SQLite connection to the same database files.  With ``parallel=True``,
+    :meth:`lookup` itself searches names (and, for ``strict_lookup``, kanji)
+    on a small shared thread pool while it searches words.
+
+    Use :meth:`close` (or a ``with Jamdict() as jam:`` block) to release the
+    SQLite connections as soon as they are no longer needed.
+
     When there is no suitable database available, Jamdict will try to use database
     from `jamdict-data <https://pypi.org/project/jamdict-data/>`_ package by default.
     """
@@ -364,11 +496,23 @@ class Jamdict:
         jmnedict_file=None,
         jmnedict_xml_file=None,
         memory_mode=False,  # accepted for API compatibility, no-op
+        cache_size=DEFAULT_CACHE_SIZE,
+        query_only=False,
+        parallel=False,
         **kwargs,
     ):
         self.auto_expand = auto_expand
+        # run the independent parts of lookup() on a shared thread pool
+        self.parallel = parallel
+        # open the databases with PRAGMA query_only (lifted during import_data)
+        self.query_only = query_only
         # memory_mode is kept as an attribute for introspection but is a no-op
         self.__memory_mode = memory_mode
+        # paths already found on disk (see _path_exists / refresh_file_status)
+        self._existing_files = set()
+        # which paths are set (see _set_source); kept up to date by the setters
+        self._avail_mask = 0
+        self._has_jmne: Optional[bool] = None
 
         # ---- resolve XML paths ------------------------------------------------
         self.jmd_xml_file = (
@@ -410,24 +554,20 @@ class Jamdict:
             if auto_config
             else None
         )
-        if not self.db_file or (
-            self.db_file != ":memory:" and not os.path.isfile(self.db_file)
-        ):
+        if not self._path_exists(self.db_file):
             if _JAMDICT_DATA_AVAILABLE:
                 self.db_file = jamdict_data.JAMDICT_DB_PATH
-            elif self.jmd_xml_file and os.path.isfile(self.jmd_xml_file):
+            elif self._path_exists(self.jmd_xml_file):
                 getLogger().warning(
                     "JAMDICT_DB could NOT be found. Searching will be extremely slow. "
                     "Please run `python3 -m jamdict import` first"
                 )
 
         self.kd2_file = kd2_file if kd2_file else self.db_file if auto_config else None
-        if not self.kd2_file or (
-            self.kd2_file != ":memory:" and not os.path.isfile(self.kd2_file)
-        ):
+        if not self._path_exists(self.kd2_file):
             if _JAMDICT_DATA_AVAILABLE:
                 self.kd2_file = None
-            elif self.kd2_xml_file and os.path.isfile(self.kd2_xml_file):
+            elif self._path_exists(self.kd2_xml_file):
                 getLogger().warning(
                     "Kanjidic2 database could NOT be found. Searching will be extremely slow. "
                     "Please run `python3 -m jamdict import` first"
@@ -436,12 +576,10 @@ class Jamdict:
         self.jmnedict_file = (
             jmnedict_file if jmnedict_file else self.db_file if auto_config else None
         )
-        if not self.jmnedict_file or (
-            self.jmnedict_file != ":memory:" and not os.path.isfile(self.jmnedict_file)
-        ):
+        if not self._path_exists(self.jmnedict_file):
             if _JAMDICT_DATA_AVAILABLE:
                 self.jmnedict_file = None
-            elif self.jmnedict_xml_file and os.path.isfile(self.jmnedict_xml_file):
+            elif self._path_exists(self.jmnedict_xml_file):
                 getLogger().warning(
                     "JMNE database could NOT be found. Searching will be extremely slow. "
                     "Please run `python3 -m jamdict import` first"
@@ -451,6 +589,7 @@ class Jamdict:
         self._db_peewee: Optional[JMDictDB] = None
         self._kd2_peewee: Optional[KanjiDic2DB] = None
         self._jmne_peewee: Optional[JMNEDictDB] = None
+        self._open_lock = threading.Lock()
 
         # ---- lazy-init XML handles -------------------------------------------
         self._jmd_xml: Optional[JMDictXML] = None
@@ -460,6 +599,17 @@ class Jamdict:
         # ---- krad map --------------------------------------------------------
         self.__krad_map: Optional[KRad] = None
 
+        # ---- query caches (see clear_cache) ----------------------------------
+        cls = type(self)
+        self._lookup_cached = _instance_lru_cache(self, cls._lookup, cache_size)
+        self._get_entry_cached = _instance_lru_cache(self, cls._get_entry, cache_size)
+        self._get_char_cached = _instance_lru_cache(self, cls._get_char, cache_size)
+        self._get_ne_cached = _instance_lru_cache(self, cls._get_ne, cache_size)
+        self._iter_cache = _DrainedCache(cache_size)
+        # tag sets are immutable between imports (see invalidate_tag_caches)
+        self._pos_cache: Optional[Tuple[str, ...]] = None
+        self._ne_type_cache: Optional[Tuple[str, ...]] = None
+
     # ------------------------------------------------------------------
     # Properties — file paths with auto-expand
     # ------------------------------------------------------------------
@@ -474,6 +624,7 @@ class Jamdict:
             self.__db_file = os.path.abspath(os.path.expanduser(value))
         else:
             self.__db_file = value
+        self._set_source(_SRC_DB, value)
 
     @property
     def kd2_file(self):
@@ -485,6 +636,7 @@ class Jamdict:
             self.__kd2_file = os.path.abspath(os.path.expanduser(value))
         else:
             self.__kd2_file = value
+        self._set_source(_SRC_KD2, value)
 
     @property
     def jmnedict_file(self):
@@ -496,6 +648,59 @@ class Jamdict:
             self.__jmnedict_file = os.path.abspath(os.path.expanduser(value))
         else:
             self.__jmnedict_file = value
+        self._set_source(_SRC_JMNE, value)
+
+    @property
+    def jmd_xml_file(self):
+        return self.__jmd_xml_file
+
+    @jmd_xml_file.setter
+    def jmd_xml_file(self, value):
+        self.__jmd_xml_file = value
+        self._set_source(_SRC_JMD_XML, value)
+
+    @property
+    def kd2_xml_file(self):
+        return self.__kd2_xml_file
+
+    @kd2_xml_file.setter
+    def kd2_xml_file(self, value):
+        self.__kd2_xml_file = value
+        self._set_source(_SRC_KD2_XML, value)
+
+    @property
+    def jmnedict_xml_file(self):
+        return self.__jmnedict_xml_file
+
+    @jmnedict_xml_file.setter
+    def jmnedict_xml_file(self, value):
+        self.__jmnedict_xml_file = value
+        self._set_source(_SRC_JMNE_XML, value)
+
+    def _set_source(self, bit: int, path) -> None:
+        """Record in ``_avail_mask`` whether the source *bit* has a path."""
+        self._has_jmne = None
+        if path is None:
+            self._avail_mask &= ~bit
+        else:
+            self._avail_mask |= bit
+
+    def _path_exists(self, path) -> bool:
+        """``os.path.isfile(path)``, remembered once the file has been found.
+
+        ``':memory:'`` always exists.  Missing paths are checked again on every
+        call since an import may create them.
+        """
+        if path == ":memory:" or path in self._existing_files:
+            return True
+        if path and os.path.isfile(path):
+            self._existing_files.add(path)
+            return True
+        return False
+
+    def refresh_file_status(self) -> None:
+        """Forget which files were found, e.g. after they were moved or deleted."""
+        self._existing_files.clear()
 
     @property
     def memory_mode(self) -> bool:
@@ -509,18 +714,18 @@ class Jamdict:
     @property
     def ready(self) -> bool:
         """Check if the JMDict database is available."""
-        return (
-            self.db_file is not None
-            and (self.db_file == ":memory:" or os.path.isfile(self.db_file))
-            and self.jmdict is not None
-        )
+        return self._path_exists(self.db_file) and self.jmdict is not None
 
     @property
     def jmdict(self) -> Optional[JMDictDB]:
         """Lazily open the peewee-backed JMDict database."""
         if self._db_peewee is None and self.db_file:
-            if self.db_file == ":memory:" or os.path.isfile(self.db_file):
-                self._db_peewee = JMDictDB(self.db_file)
+            with self._open_lock:
+                if self._db_peewee is None and self._path_exists(self.db_file):
+                    db = JMDictDB(self.db_file)
+                    if self.query_only:
+                        db.set_query_only(True)
+                    self._db_peewee = db
         return self._db_peewee
 
     @property
@@ -531,8 +736,12 @@ class Jamdict:
             # SQLite file — each peewee DB class manages its own table set,
             # so pointing both at the same file is safe.
             kd2_path = self.kd2_file if self.kd2_file else self.db_file
-            if kd2_path and (kd2_path == ":memory:" or os.path.isfile(kd2_path)):
-                self._kd2_peewee = KanjiDic2DB(kd2_path)
+            with self._open_lock:
+                if self._kd2_peewee is None and self._path_exists(kd2_path):
+                    db = KanjiDic2DB(kd2_path)
+                    if self.query_only:
+                        db.set_query_only(True)
+                    self._kd2_peewee = db
         return self._kd2_peewee
 
     @property
@@ -540,8 +749,12 @@ class Jamdict:
         """Lazily open the peewee-backed JMNEDict database."""
         if self._jmne_peewee is None:
             jmne_path = self.jmnedict_file if self.jmnedict_file else self.db_file
-            if jmne_path and (jmne_path == ":memory:" or os.path.isfile(jmne_path)):
-                self._jmne_peewee = JMNEDictDB(jmne_path)
+            with self._open_lock:
+                if self._jmne_peewee is None and self._path_exists(jmne_path):
+                    db = JMNEDictDB(jmne_path)
+                    if self.query_only:
+                        db.set_query_only(True)
+                    self._jmne_peewee = db
         return self._jmne_peewee
 
     # ------------------------------------------------------------------
@@ -607,58 +820,96 @@ class Jamdict:
     # ------------------------------------------------------------------
 
     def has_kd2(self) -> bool:
-        return (
-            self.db_file is not None
-            or self.kd2_file is not None
-            or self.kd2_xml_file is not None
-        )
+        return bool(self._avail_mask & _SRC_ANY_KD2)
 
     def has_jmne(self, ctx=None) -> bool:
-        """Check if the current database has JMNEDict support."""
-        if self.jmnedict is not None:
-            meta = self.jmnedict.get_meta("jmnedict.version")
-            return meta is not None and len(meta) > 0
-        return False
+        """Check if the current database has JMNEDict support.
+
+        The answer is remembered until a data path changes or data is imported.
+        """
+        if self._has_jmne is None:
+            has_jmne = False
+            if self.jmnedict is not None:
+                meta = self.jmnedict.get_meta("jmnedict.version")
+                has_jmne = meta is not None and len(meta) > 0
+            self._has_jmne = has_jmne
+        return self._has_jmne
 
     def is_available(self) -> bool:
-        return (
-            self.db_file is not None
-            or self.jmd_xml_file is not None
-            or self.kd2_file is not None
-            or self.kd2_xml_file is not None
-            or self.jmnedict_file is not None
-            or self.jmnedict_xml_file is not None
-        )
+        return bool(self._avail_mask)
 
     # ------------------------------------------------------------------
     # Import
     # ------------------------------------------------------------------
 
-    def import_data(self) -> None:
-        """Import JMDict, KanjiDic2, and JMNEDict data from XML into SQLite."""
+    def import_data(self, parallel=False) -> None:
+        """Import JMDict, KanjiDic2, and JMNEDict data from XML into SQLite.
+
+        With ``parallel=True`` the KanjiDic2 and JMNEDict files are parsed in
+        worker processes while JMDict is being imported; the parsed data is
+        still written to the databases one source at a time.  This is faster
+        but holds the parsed KanjiDic2 and JMNEDict data in memory.
+
+        Databases opened with ``query_only=True`` accept writes for the
+        duration of the import only.
+        """
+        self.clear_cache()
+        self.invalidate_tag_caches()
+        if not self.query_only:
+            self._import_data(parallel)
+            return
+        self._set_query_only(False)
+        try:
+            self._import_data(parallel)
+        finally:
+            self._set_query_only(True)
+
+    def _set_query_only(self, enabled: bool) -> None:
+        for db in (self.jmdict, self.kd2, self.jmnedict):
+            if db is not None:
+                db.set_query_only(enabled)
+
+    def _import_data(self, parallel=False) -> None:
+        kd2_job = jmne_job = pool = None
+        has_kd2_xml = self._path_exists(self.kd2_xml_file)
+        has_jmne_xml = self._path_exists(self.jmnedict_xml_file)
+        if parallel and (has_kd2_xml or has_jmne_xml):
+            pool = ProcessPoolExecutor(
+                max_workers=2, mp_context=multiprocessing.get_context("spawn"))
+            if has_kd2_xml:
+                kd2_job = pool.submit(_parse_kd2_xml, self.kd2_xml_file)
+            if has_jmne_xml:
+                jmne_job = pool.submit(_parse_jmne_xml, self.jmnedict_xml_file)
+        try:
+            self._import_sources(has_kd2_xml, has_jmne_xml, kd2_job, jmne_job)
+        finally:
+            self._has_jmne = None
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+    def _import_sources(self, has_kd2_xml, has_jmne_xml, kd2_job, jmne_job) -> None:
         # ---- JMDict ----------------------------------------------------------
         if (
             self.jmdict is not None
-            and self.jmd_xml_file
-            and os.path.isfile(self.jmd_xml_file)
+            and self._path_exists(self.jmd_xml_file)
         ):
             getLogger().info("Importing JMDict data from %s", self.jmd_xml_file)
+            # entries are streamed from the parser straight into the database
             parser = JMDictXMLParser()
-            entries = parser.parse_file(
-                os.path.abspath(os.path.expanduser(self.jmd_xml_file))
+            count = self.jmdict.insert_entries(
+                parser.parse_file_iter(self.jmd_xml_file)
             )
-            self.jmdict.insert_entries(entries)
-            getLogger().info("JMDict import complete (%d entries)", len(entries))
+            getLogger().info("JMDict import complete (%d entries)", count)
         else:
             getLogger().warning("JMDict XML data is not available — skipped!")
 
         # ---- KanjiDic2 -------------------------------------------------------
-        if self.kd2_xml_file and os.path.isfile(self.kd2_xml_file):
+        if has_kd2_xml:
             getLogger().info("Importing KanjiDic2 data from %s", self.kd2_xml_file)
-            parser = Kanjidic2XMLParser()
-            kd2 = parser.parse_file(
-                os.path.abspath(os.path.expanduser(self.kd2_xml_file))
-            )
+            if kd2_job is not None:
+                kd2 = kd2_job.result()
+            else:
+                kd2 = _parse_kd2_xml(self.kd2_xml_file)
             # Determine which KanjiDic2DB to write into.
             # When kd2_file == db_file, they share the file but KanjiDic2DB
             # manages its own table set, so we open a separate KanjiDic2DB
@@ -686,19 +937,21 @@ class Jamdict:
             getLogger().warning("KanjiDic2 XML data is not available — skipped!")
 
         # ---- JMNEDict --------------------------------------------------------
-        if self.jmnedict_xml_file and os.path.isfile(self.jmnedict_xml_file):
+        if has_jmne_xml:
             getLogger().info("Importing JMNEDict data from %s", self.jmnedict_xml_file)
-            # JMNEDictXML uses the same parser infrastructure as JMDict
-            jmne_xml = JMNEDictXML.from_file(self.jmnedict_xml_file)
-            ne_entries = list(jmne_xml)
             jmne_path = self.jmnedict_file if self.jmnedict_file else self.db_file
             if jmne_path:
                 jmne_db = self.jmnedict  # lazy-open
                 if jmne_db is not None:
-                    jmne_db.insert_entries(ne_entries)
-                    getLogger().info(
-                        "JMNEDict import complete (%d entries)", len(ne_entries)
-                    )
+                    # JMNEDict uses the same parser infrastructure as JMDict
+                    if jmne_job is not None:
+                        entries = jmne_job.result()
+                    else:
+                        entries = JMDictXMLParser().parse_file_iter(
+                            self.jmnedict_xml_file
+                        )
+                    count = jmne_db.insert_entries(entries)
+                    getLogger().info("JMNEDict import complete (%d entries)", count)
                 else:
                     getLogger().warning("JMNEDict DB could not be opened — skipped!")
             else:
@@ -708,12 +961,37 @@ class Jamdict:
         else:
             getLogger().warning("JMNEDict XML data is not available — skipped!")
 
+    # ------------------------------------------------------------------
+    # Caching
+    # ------------------------------------------------------------------
+
+    def clear_cache(self) -> None:
+        """Drop all memoized lookup / get_entry / get_char / get_ne results.
+
+        Results are cached per instance (up to ``cache_size`` each) and the
+        same objects are returned for repeated queries, so treat them as
+        read-only.  :meth:`import_data` clears the cache automatically.
+        """
+        self._lookup_cached.cache_clear()
+        self._get_entry_cached.cache_clear()
+        self._get_char_cached.cache_clear()
+        self._get_ne_cached.cache_clear()
+        self._iter_cache.clear()
+
+    def invalidate_tag_caches(self) -> None:
+        """Forget the memoized :meth:`all_pos` / :meth:`all_ne_type` results."""
+        self._pos_cache = None
+        self._ne_type_cache = None
+
     # ------------------------------------------------------------------
     # Query helpers
     # ------------------------------------------------------------------
 
     def get_ne(self, idseq) -> Optional[JMDEntry]:
         """Get a named entity by idseq from JMNEDict."""
+        return self._get_ne_cached(idseq)
+
+    def _get_ne(self, idseq) -> Optional[JMDEntry]:
         if self.jmnedict is not None:
             return self.jmnedict.get_ne(idseq)
         elif self.jmnedict_xml_file:
@@ -723,6 +1001,9 @@ class Jamdict:
 
     def get_char(self, literal, ctx=None) -> Optional[Character]:
         """Get a kanji character by literal from KanjiDic2."""
+        return self._get_char_cached(literal)
+
+    def _get_char(self, literal) -> Optional[Character]:
         if self.kd2 is not None:
             return self.kd2.get_char(literal)
         elif self.kd2_xml:
@@ -732,6 +1013,9 @@ class Jamdict:
 
     def get_entry(self, idseq) -> Optional[JMDEntry]:
         """Get a JMDict entry by idseq."""
+        return self._get_entry_cached(idseq)
+
+    def _get_entry(self, idseq) -> Optional[JMDEntry]:
         if self.jmdict is not None:
             return self.jmdict.get_entry(idseq)
         elif self.jmdict_xml:
@@ -744,18 +1028,22 @@ class Jamdict:
 
         :returns: A list of part-of-speeches (a list of strings)
         """
-        if self.jmdict is not None:
-            return self.jmdict.all_pos()
-        return []
+        if self.jmdict is None:
+            return []
+        if self._pos_cache is None:
+            self._pos_cache = tuple(self.jmdict.all_pos())
+        return list(self._pos_cache)
 
     def all_ne_type(self, ctx=None) -> List[str]:
         """Return all available named-entity type tags.
 
         :returns: A list of named-entity types (a list of strings)
         """
-        if self.jmnedict is not None:
-            return self.jmnedict.all_ne_type()
-        return []
+        if self.jmnedict is None:
+            return []
+        if self._ne_type_cache is None:
+            self._ne_type_cache = tuple(self.jmnedict.all_ne_type())
+        return list(self._ne_type_cache)
 
     # ------------------------------------------------------------------
     # Main lookup
@@ -769,6 +1057,7 @@ class Jamdict:
         ctx=None,  # accepted for API compatibility, unused
         lookup_ne=True,
         pos=None,
+        limit=None,
         **kwargs,
     ) -> LookupResult:
         """Search words, characters, and named entities.
@@ -786,9 +1075,14 @@ class Jamdict:
         :type pos: list of strings
         :param lookup_ne: Set to ``False`` to disable name-entity lookup.
         :type lookup_ne: bool
+        :param limit: Return at most this many words (``None`` for all).
+        :type limit: int
         :returns: A :class:`LookupResult` object.
         :rtype: LookupResult
 
+        Results are memoized per instance (see :meth:`clear_cache`); repeated
+        identical lookups return the same :class:`LookupResult` object.
+
         >>> jam = Jamdict()
         >>> results = jam.lookup('食べ%る')
         """
@@ -796,36 +1090,69 @@ class Jamdict:
             raise LookupError("There is no backend data available")
         if (not query or query == "%") and not pos:
             raise ValueError("Query and POS filter cannot be both empty")
+        # the cache key needs a hashable, order-insensitive pos filter
+        if pos and not isinstance(pos, str):
+            pos = frozenset(pos)
+        return self._lookup_cached(
+            query, strict_lookup, lookup_chars, lookup_ne, pos or None, limit
+        )
+
+    def _lookup(self, query, strict_lookup, lookup_chars, lookup_ne, pos, limit) -> LookupResult:
+        if isinstance(pos, frozenset):
+            pos = sorted(pos)
+
+        lookup_chars = lookup_chars and self.has_kd2()
+        lookup_ne = lookup_ne and self.has_jmne()
+        # names never depend on the entries, and neither do chars in strict
+        # mode, so with parallel=True those run next to the word search
+        chars_job = names_job = None
+        if self.parallel:
+            pool = _io_pool()
+            if lookup_chars and strict_lookup:
+                chars_job = pool.submit(self._lookup_chars, query, ())
+            if lookup_ne:
+                names_job = pool.submit(self.jmnedict.search_ne, query)
 
         # ---- word entries ----------------------------------------------------
         entries = []
         if self.jmdict is not None:
-            entries = self.jmdict.search(query, pos=pos)
+            entries = self.jmdict.search(query, pos=pos, limit=limit)
         elif self.jmdict_xml:
-            entries = list(self.jmdict_xml.lookup(query))
+            entries = self.jmdict_xml.lookup(query)[:limit]
 
         # ---- kanji characters ------------------------------------------------
         chars = []
-        if lookup_chars and self.has_kd2():
-            chars_to_search = OrderedDict({c: c for c in query})
-            if not strict_lookup and entries:
-                for e in entries:
-                    for k in e.kanji_forms:
-                        for c in k.text:
-                            if c not in HIRAGANA and c not in KATAKANA:
-                                chars_to_search[c] = c
-            for c in chars_to_search:
-                result = self.get_char(c)
-                if result is not None:
-                    chars.append(result)
+        if chars_job is not None:
+            chars = chars_job.result()
+        elif lookup_chars:
+            chars = self._lookup_chars(query, () if strict_lookup else entries)
 
         # ---- named entities --------------------------------------------------
         names = []
-        if lookup_ne and self.has_jmne():
+        if names_job is not None:
+            names = names_job.result()
+        elif lookup_ne:
             names = self.jmnedict.search_ne(query)
 
         return LookupResult(entries, chars, names)
 
+    def _lookup_chars(self, query, entries) -> List[Character]:
+        """Find the kanji in *query*, then those in the kanji forms of *entries*."""
+        # dict.fromkeys() keeps the first-seen order of the characters; kana
+        # are never in KanjiDic2, so a pure-kana strict lookup runs no query
+        text = query + "".join([k.text for e in entries for k in e.kanji_forms])
+        chars_to_search = [c for c in dict.fromkeys(text) if c not in _KANA]
+        if self.kd2 is not None:
+            # one batched query instead of a get_char() per character
+            found = self.kd2.get_chars(chars_to_search)
+            return [found[c] for c in chars_to_search if c in found]
+        chars = []
+        for c in chars_to_search:
+            result = self.get_char(c)
+            if result is not None:
+                chars.append(result)
+        return chars
+
     def lookup_iter(
         self,
         query,
@@ -861,29 +1188,44 @@ class Jamdict:
         :type lookup_ne: bool
         :returns: An :class:`IterLookupResult` object.
         :rtype: IterLookupResult
+
+        Each iterator that is looped through to the end is memoized (see
+        :meth:`clear_cache`), so repeating the same query replays it without
+        touching the database.
         """
         if not self.is_available():
             raise LookupError("There is no backend data available")
         if (not query or query == "%") and not pos:
             raise ValueError("Query and POS filter cannot be both empty")
+        if pos and not isinstance(pos, str):
+            pos = frozenset(pos)
+        cache = self._iter_cache
 
         # ---- word entries (iterator) -----------------------------------------
         entries = None
         if self.jmdict is not None:
-            entries = self.jmdict.search_iter(query, pos=pos)
+            search_pos = sorted(pos) if isinstance(pos, frozenset) else pos
+            entries = cache.iterate(
+                ("entries", query, pos or None),
+                self.jmdict.search_iter,
+                query,
+                search_pos,
+            )
 
         # ---- kanji characters (iterator) ------------------------------------
         chars = None
         if lookup_chars and self.has_kd2() and self.kd2 is not None:
-            chars_to_search = [
-                c for c in query if c not in HIRAGANA and c not in KATAKANA
-            ]
-            chars = self.kd2.search_chars_iter(chars_to_search)
+            chars_to_search = [c for c in query if c not in _KANA]
+            chars = cache.iterate(
+                ("chars", query), self.kd2.search_chars_iter, chars_to_search
+            )
 
         # ---- named entities (iterator) ---------------------------------------
         names = None
         if lookup_ne and self.has_jmne():
-            names = self.jmnedict.search_ne_iter(query)
+            names = cache.iterate(
+                ("names", query), self.jmnedict.search_ne_iter, query
+            )
 
         return IterLookupResult(entries, chars, names)
 
@@ -891,25 +1233,30 @@ class Jamdict:
     # Resource management
     # ------------------------------------------------------------------
 
+    def close(self) -> None:
+        """Close the open database connections.
+
+        Safe to call more than once; a later query simply reopens them.
+        """
+        self._close_dbs()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
     def __del__(self):
+        # last-resort cleanup for instances that were never closed
         self._close_dbs()
 
     def _close_dbs(self):
-        try:
-            if self._db_peewee is not None:
-                self._db_peewee.close()
-                self._db_peewee = None
-        except Exception:
-            pass
-        try:
-            if self._kd2_peewee is not None:
-                self._kd2_peewee.close()
-                self._kd2_peewee = None
-        except Exception:
-            pass
-        try:
-            if self._jmne_peewee is not None:
-                self._jmne_peewee.close()
-                self._jmne_peewee = None
-        except Exception:
-            pass
+        for attr in ("_db_peewee", "_kd2_peewee", "_jmne_peewee"):
+            db = getattr(self, attr, None)
+            if db is not None:
+                try:
+                    db.close()
+                except Exception:
+                    pass
+                setattr(self, attr, None)
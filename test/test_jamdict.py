@@ -113,6 +113,25 @@ class TestJamdictXML(unittest.TestCase):
         self.assertTrue(results)
         self.assertIsInstance(results[0], JMDEntry)
 
+    def test_jmdict_xml_lookup_is_ordered_and_unique(self):
+        parser = JMDictXMLParser()
+        entries = parser.parse_file(MINI_JMD)
+        jmd = JMDictXML(entries)
+        for text, found in jmd._textmap.items():
+            self.assertIsInstance(found, tuple)
+            self.assertEqual(len(found), len(set(map(id, found))))
+            self.assertEqual(list(found), [e for e in entries if e in found])
+        self.assertIs(jmd.lookup("おてんき"), jmd.lookup("おてんき"))
+
+    def test_jmdict_xml_lookup_by_id(self):
+        parser = JMDictXMLParser()
+        entries = parser.parse_file(MINI_JMD)
+        jmd = JMDictXML(entries)
+        self.assertEqual(jmd.lookup("id#" + entries[0].idseq), (entries[0],))
+        self.assertEqual(jmd.lookup("id#0"), ())
+        self.assertEqual(jmd.lookup("id#"), ())
+        self.assertEqual(jmd.lookup("zzznomatch"), ())
+
     def test_jmdict_json(self):
         print("Test JMDict - XML to JSON")
         # Load mini dict data
@@ -141,6 +160,15 @@ class TestJamdictXML(unittest.TestCase):
         for c in kd2:
             self.assertIsNotNone(c.to_dict())
 
+    def test_parsed_tags_are_shared_strings(self):
+        entries = JMDictXMLParser().parse_file(MINI_JMD)
+        kd2 = Kanjidic2XMLParser().parse_file(MINI_KD2)
+        tags = [p for e in entries for s in e.senses for p in s.pos]
+        tags += [r.r_type for c in kd2 for g in c.rm_groups for r in g.readings]
+        by_value = {}
+        for tag in tags:
+            self.assertIs(by_value.setdefault(tag, tag), tag)
+
     def test_jamdict_xml(self):
         print("Test Jamdict search in XML files")
         jam = Jamdict(
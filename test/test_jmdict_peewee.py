@@ -18,7 +18,7 @@ import pytest
 
 from jamdict.jamdict_peewee import JamdictPeewee, LookupResult
 from jamdict.jmdict import JMDEntry
-from jamdict.jmdict_peewee import JMDictDB
+from jamdict.jmdict_peewee import _DB_PROXY, MMAP_SIZE, JMDictDB, chunked
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -26,7 +26,6 @@ from jamdict.jmdict_peewee import JMDictDB
 
 TEST_DIR = Path(os.path.realpath(__file__)).parent
 TEST_DATA = TEST_DIR / "data"
-TEST_DB = TEST_DATA / "test_jmdict_peewee.db"
 MINI_JMD = TEST_DATA / "JMdict_mini.xml"
 
 # ---------------------------------------------------------------------------
@@ -44,32 +43,39 @@ def xml_entries():
 
 
 @pytest.fixture(scope="module")
-def file_db(xml_entries):
+def file_db(tmp_path_factory, xml_entries):
     """
     File-backed JMDictDB populated with all mini-XML entries.
-    Created once per module; the DB file is wiped before population.
+    Created once per module in its own temporary directory, so concurrent
+    runs (e.g. pytest-xdist workers) never share the file.
     """
-    TEST_DATA.mkdir(exist_ok=True)
-    if TEST_DB.exists():
-        TEST_DB.unlink()
-
-    db = JMDictDB(str(TEST_DB))
+    db = JMDictDB(str(tmp_path_factory.mktemp("file_db") / "jmdict.db"))
     db.insert_entries(xml_entries)
     yield db
     db.close()
-    if TEST_DB.exists():
-        TEST_DB.unlink()
 
 
-@pytest.fixture()
-def ram_db(xml_entries):
-    """Fresh :memory: JMDictDB pre-populated with mini-XML entries."""
+@pytest.fixture(scope="module")
+def _ram_db_module(xml_entries):
     db = JMDictDB(":memory:")
     db.insert_entries(xml_entries)
     yield db
     db.close()
 
 
+@pytest.fixture()
+def ram_db(_ram_db_module):
+    """:memory: JMDictDB pre-populated with mini-XML entries.
+
+    Populated once per module; anything a test writes is rolled back.
+    """
+    with _ram_db_module._db.atomic() as txn:
+        yield _ram_db_module
+        txn.rollback()
+    _ram_db_module._pos_cache = None
+    _ram_db_module._get_entry_cached.cache_clear()
+
+
 @pytest.fixture()
 def empty_db():
     """Fresh, empty :memory: JMDictDB with no entries imported."""
@@ -130,12 +136,55 @@ class TestImport:
             count = EntryModel.select().count()
         assert count == len(xml_entries)
 
+    def test_insert_entries_streamed_from_parser(self, empty_db, ram_db, xml_entries):
+        from jamdict.jmdict import JMDictXMLParser
+
+        stream = JMDictXMLParser().parse_file_iter(str(MINI_JMD))
+        assert not isinstance(stream, list)
+        assert empty_db.insert_entries(stream) == len(xml_entries)
+        for src in xml_entries[::20]:
+            streamed = empty_db.get_entry(int(src.idseq))
+            assert streamed.to_dict() == ram_db.get_entry(int(src.idseq)).to_dict()
+
+
+    def test_insert_batches_continue_ids(self, empty_db, xml_entries, monkeypatch):
+        """Successive batches must not reuse Kanji/Kana/Sense IDs."""
+        import jamdict.jmdict_peewee as jmdict_peewee
+
+        monkeypatch.setattr(jmdict_peewee, "INSERT_BATCH_SIZE", 7)
+        empty_db.insert_entries(xml_entries[:30])
+        empty_db.insert_entry(xml_entries[30])
+        empty_db.insert_entries(xml_entries[31:60])
+        for src in xml_entries[:60]:
+            assert empty_db.get_entry(int(src.idseq)).to_dict() == src.to_dict()
+
+    def test_reinsert_is_skipped(self, empty_db, xml_entries):
+        """Entries whose idseq is already stored are skipped, not duplicated."""
+        from jamdict.jmdict_peewee import EntryModel
+
+        assert empty_db.insert_entries(xml_entries[:10]) == 10
+        assert empty_db.insert_entries(xml_entries[5:20] + xml_entries[15:20]) == 10
+        empty_db.insert_entry(xml_entries[0])
+        with empty_db._db.bind_ctx([EntryModel]):
+            assert EntryModel.select().count() == 20
+        for src in xml_entries[:20]:
+            assert empty_db.get_entry(int(src.idseq)).to_dict() == src.to_dict()
+
 
 # ===========================================================================
 # 2. get_entry tests
 # ===========================================================================
 
 
+class TestChunked:
+    def test_groups_keep_order(self):
+        assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_short_and_empty_input(self):
+        assert list(chunked([1], 999)) == [[1]]
+        assert list(chunked(iter(()), 3)) == []
+
+
 class TestGetEntry:
     def test_returns_correct_idseq(self, ram_db):
         e = ram_db.get_entry(1001710)
@@ -144,6 +193,35 @@ class TestGetEntry:
     def test_returns_none_for_missing(self, ram_db):
         assert ram_db.get_entry(9999999999) is None
 
+    def test_accepts_str_idseq(self, ram_db):
+        assert ram_db.get_entry("1001710").to_dict() == ram_db.get_entry(1001710).to_dict()
+
+    def test_returns_none_for_non_numeric_idseq(self, ram_db):
+        assert ram_db.get_entry("abc") is None
+        assert ram_db.get_entry(None) is None
+        assert ram_db._get_entry_cached.cache_info().currsize == 0
+
+    def test_cached_until_insert(self, empty_db, xml_entries):
+        src = next(e for e in xml_entries if str(e.idseq) == "1001710")
+        assert empty_db.get_entry(1001710) is None
+        empty_db.insert_entry(src)
+        first = empty_db.get_entry(1001710)
+        assert first is not None
+        assert empty_db.get_entry("1001710") is first
+
+    def test_miss_is_not_cached(self, xml_entries, tmp_path):
+        src = next(e for e in xml_entries if str(e.idseq) == "1001710")
+        db_path = str(tmp_path / "miss.db")
+        with JMDictDB(db_path) as writer, JMDictDB(db_path) as reader:
+            assert reader.get_entry(1001710) is None
+            writer.insert_entry(src)
+            assert reader.get_entry(1001710).to_dict() == src.to_dict()
+
+    def test_kana_nokanji_is_bool(self, ram_db):
+        for e in ram_db.search("%", pos=ram_db.all_pos()):
+            for kn in e.kana_forms:
+                assert kn.nokanji is None or isinstance(kn.nokanji, bool)
+
     def test_okashi_kanji_forms(self, ram_db):
         """お菓子 has two kanji forms: お菓子 and 御菓子."""
         e = ram_db.get_entry(1001710)
@@ -199,6 +277,14 @@ class TestGetEntry:
         assert "kana" in d
         assert "senses" in d
 
+    def test_pos_tags_are_shared_strings(self, ram_db):
+        tags = [
+            p for e in ram_db.search("%", pos=ram_db.all_pos()) for s in e.senses for p in s.pos
+        ]
+        by_value = {}
+        for tag in tags:
+            assert by_value.setdefault(tag, tag) is tag
+
     def test_returns_jmdentry_instance(self, ram_db):
         e = ram_db.get_entry(1001710)
         assert isinstance(e, JMDEntry)
@@ -235,11 +321,21 @@ class TestSearch:
     def test_wildcard_kana_count(self, ram_db):
         assert len(ram_db.search("%あの%")) == 4
 
+    def test_limit_keeps_leading_results(self, ram_db):
+        every = [e.idseq for e in ram_db.search("%あの%")]
+        assert [e.idseq for e in ram_db.search("%あの%", limit=2)] == every[:2]
+        assert ram_db.search("id#1001710", limit=0) == []
+
     def test_search_by_id_prefix(self, ram_db):
         results = ram_db.search("id#1001710")
         assert len(results) == 1
         assert str(results[0].idseq) == "1001710"
 
+    def test_search_by_unknown_id(self, ram_db):
+        assert ram_db.search("id#9999999") == []
+        assert ram_db.search("id#abc") == []
+        assert ram_db.search("id#²") == []
+
     def test_no_results(self, ram_db):
         assert ram_db.search("zzznomatch999") == []
 
@@ -254,11 +350,42 @@ class TestSearch:
     def test_exact_gloss(self, ram_db):
         assert len(ram_db.search("confections")) == 1
 
+    def test_exact_match_uses_covering_index(self, ram_db):
+        with _DB_PROXY.bound(ram_db._db):
+            sql, params = ram_db._build_entry_query("お菓子").sql()
+        plan = " ".join(r[3] for r in ram_db._db.execute_sql("EXPLAIN QUERY PLAN " + sql, params))
+        for index in ("kanjimodel_text_idseq", "kanamodel_text_idseq", "senseglossmodel_text_sid"):
+            assert "COVERING INDEX " + index in plan
+
     def test_pos_filter_narrows_results(self, ram_db):
         all_r = ram_db.search("%あの%")
         filtered = ram_db.search("%あの%", pos=["pronoun"])
         assert len(filtered) <= len(all_r)
 
+    def test_trigram_index_matches_like(self, ram_db, monkeypatch):
+        assert ram_db.get_meta(JMDictDB.KEY_FTS) == "trigram+gloss"
+        for pattern in ("%あの%", "お菓子%", "%かし", "_のう", "%cake%", "%SWEET%", "con%ions"):
+            monkeypatch.setattr(ram_db, "_fts", True)
+            indexed = [e.idseq for e in ram_db.search(pattern)]
+            monkeypatch.setattr(ram_db, "_fts", False)
+            assert indexed == [e.idseq for e in ram_db.search(pattern)]
+
+    def test_forms_only_index_is_rebuilt(self, tmp_path, xml_entries):
+        db_path = str(tmp_path / "old_fts.db")
+        with JMDictDB(db_path) as db:
+            db.insert_entries(xml_entries[:10])
+            db._db.execute_sql("DELETE FROM jmdict_fts")
+            db._db.execute_sql(
+                "INSERT INTO jmdict_fts(text, idseq) "
+                "SELECT text, idseq FROM Kanji UNION ALL SELECT text, idseq FROM Kana"
+            )
+            db._db.execute_sql("UPDATE meta SET value = 'trigram' WHERE key = ?", (JMDictDB.KEY_FTS,))
+        with JMDictDB(db_path) as db:
+            assert not db._fts
+            db.insert_entries(xml_entries[10:])
+            assert db.get_meta(JMDictDB.KEY_FTS) == "trigram+gloss"
+            assert "1001710" in {str(e.idseq) for e in db.search("%confections%")}
+
     def test_pos_filter_entries_carry_pos(self, ram_db):
         for entry in ram_db.search("%あの%", pos=["pronoun"]):
             all_pos = [p for s in entry.senses for p in s.pos]
@@ -288,6 +415,16 @@ class TestSearchIter:
     def test_no_results(self, ram_db):
         assert list(ram_db.search_iter("zzznomatch999")) == []
 
+    def test_batched_hydration_matches_get_entry(self, ram_db, monkeypatch):
+        import jamdict.jmdict_peewee as jmdict_peewee
+
+        monkeypatch.setattr(jmdict_peewee, "HYDRATE_BATCH_SIZE", 7)
+        entries = list(ram_db.search_iter("%", pos=ram_db.all_pos()))
+        assert len(entries) > 7
+        for entry in entries:
+            single = ram_db.get_entry(int(entry.idseq))
+            assert entry.to_dict() == single.to_dict()
+
 
 # ===========================================================================
 # 5. all_pos tests
@@ -312,6 +449,16 @@ class TestAllPos:
         pos = ram_db.all_pos()
         assert len(pos) == len(set(pos))
 
+    def test_sorted(self, ram_db):
+        pos = ram_db.all_pos()
+        assert pos == sorted(pos)
+
+    def test_refreshed_after_insert(self, empty_db, xml_entries):
+        assert empty_db.all_pos() == []
+        src = next(e for e in xml_entries if str(e.idseq) == "1001710")
+        empty_db.insert_entry(src)
+        assert "noun (common) (futsuumeishi)" in empty_db.all_pos()
+
 
 # ===========================================================================
 # 6. update_meta / get_meta tests
@@ -357,11 +504,77 @@ class TestContextManager:
             assert len(results) == 2
         assert db._db.is_closed()
 
+    @pytest.mark.parametrize("name", ["threads.db", ":memory:"])
+    def test_close_closes_every_threads_connection(self, xml_entries, tmp_path, name):
+        import sqlite3
+        import threading
+
+        db = JMDictDB(name if name == ":memory:" else str(tmp_path / name))
+        db.insert_entries(xml_entries)
+        conns = [db._db.connection()]
+
+        def lookup():
+            assert db.get_entry(1001710) is not None
+            conns.append(db._db.connection())
+
+        worker = threading.Thread(target=lookup)
+        worker.start()
+        worker.join()
+        assert len(conns) == 2 and conns[0] is not conns[1]
+        db.close()
+        if name == ":memory:":
+            conns.append(db._db._keepalive)
+        for conn in conns:
+            with pytest.raises(sqlite3.ProgrammingError, match="closed database"):
+                conn.execute("SELECT 1")
+
     def test_memory_db_via_context_manager(self, xml_entries):
         with JMDictDB(":memory:") as db:
             db.insert_entries(xml_entries)
             assert len(db.search("お菓子")) == 1
 
+    def test_file_db_reads_through_mmap(self, tmp_path):
+        with JMDictDB(str(tmp_path / "mmap.db")) as db:
+            assert db._db.pragma("mmap_size") == MMAP_SIZE
+
+    def test_bulk_import_truncates_wal(self, xml_entries, tmp_path):
+        db_path = str(tmp_path / "wal.db")
+        with JMDictDB(db_path) as db:
+            db.insert_entries(xml_entries)
+            assert os.path.getsize(db_path + "-wal") == 0
+            assert len(db.search("お菓子")) == 1
+
+    def test_new_file_uses_large_pages(self, tmp_path):
+        with JMDictDB(str(tmp_path / "pages.db")) as db:
+            assert db._db.pragma("page_size") == 8192
+            assert db._db.pragma("journal_size_limit") == 64 << 20
+
+    def test_schema_matches_create_tables(self, tmp_path):
+        from peewee import SqliteDatabase
+
+        from jamdict.jmdict_peewee import ALL_MODELS
+
+        schema_sql = "SELECT type, name, sql FROM sqlite_master ORDER BY name"
+        peewee_db = SqliteDatabase(str(tmp_path / "peewee.db"))
+        with _DB_PROXY.bound(peewee_db):
+            peewee_db.create_tables(ALL_MODELS, safe=True)
+        expected = peewee_db.execute_sql(schema_sql).fetchall()
+        with JMDictDB(str(tmp_path / "schema.db")) as db:
+            found = db._db.execute_sql(schema_sql).fetchall()
+        assert [r for r in found if r[1] in {e[1] for e in expected}] == expected
+
+    def test_missing_indexes_are_added_unless_read_only(self, tmp_path):
+        db_path = str(tmp_path / "old_schema.db")
+        index_sql = "SELECT name FROM sqlite_master WHERE name = 'kanjimodel_text_idseq'"
+        with JMDictDB(db_path) as db:
+            db._db.execute_sql("DROP INDEX kanjimodel_text_idseq")
+            db._db.pragma("query_only", 1)
+            with _DB_PROXY.bound(db._db):
+                db._create_tables()
+            assert db._db.execute_sql(index_sql).fetchone() is None
+        with JMDictDB(db_path) as db:
+            assert db._db.execute_sql(index_sql).fetchone() is not None
+
 
 # ===========================================================================
 # 8. JamdictPeewee runner tests
@@ -52,6 +52,15 @@ class TestModels(unittest.TestCase):
         self.assertEqual(krad.krad['𪚲'], ['乙', '勹', '月', '田', '亀'])
         self.assertEqual(krad.radk['龠'], {'籥', '鸙', '龢', '龠', '龡', '籲', '瀹', '龥', '禴', '鑰', '爚', '龣'})
 
+    def test_krad_maps_are_shared(self):
+        self.assertIs(KRad().krad, KRad().krad)
+        self.assertIs(KRad().radk, KRad().radk)
+
+    def test_radk_lookup_does_not_grow_shared_map(self):
+        with self.assertRaises(KeyError):
+            KRad().radk['x']
+        self.assertNotIn('x', KRad().radk)
+
 
 ########################################################################
 
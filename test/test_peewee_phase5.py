@@ -64,9 +64,8 @@ def kd2_data():
     return _parse_kd2()
 
 
-@pytest.fixture()
-def kd2_ram(kd2_data):
-    """Fresh :memory: KanjiDic2DB pre-populated with mini-XML characters."""
+@pytest.fixture(scope="module")
+def _kd2_ram_module(kd2_data):
     db = KanjiDic2DB(":memory:")
     db.update_kd2_meta(
         kd2_data.file_version,
@@ -78,6 +77,19 @@ def kd2_ram(kd2_data):
     db.close()
 
 
+@pytest.fixture()
+def kd2_ram(_kd2_ram_module):
+    """:memory: KanjiDic2DB pre-populated with mini-XML characters.
+
+    Populated once per module; anything a test writes is rolled back.
+    """
+    with _kd2_ram_module._db.atomic() as txn:
+        yield _kd2_ram_module
+        txn.rollback()
+    _kd2_ram_module._get_char_cached.cache_clear()
+    _kd2_ram_module._get_char_by_id_cached.cache_clear()
+
+
 @pytest.fixture()
 def kd2_empty():
     """Fresh, empty :memory: KanjiDic2DB."""
@@ -115,6 +127,46 @@ class TestKanjiDic2Import:
         assert c2 is not None
         assert c2.literal == original_literal
 
+    def test_insert_batches_continue_ids(self, kd2_empty, kd2_ram, kd2_data, monkeypatch):
+        """Successive batches must not reuse character or rm_group IDs."""
+        import jamdict.kanjidic2_peewee as kanjidic2_peewee
+
+        chars = kd2_data.characters
+        monkeypatch.setattr(kanjidic2_peewee, "INSERT_BATCH_SIZE", 3)
+        kd2_empty.insert_chars(chars[:7])
+        kd2_empty.insert_char(chars[7])
+        kd2_empty.insert_chars(chars[8:])
+        assert [c.ID for c in chars] == list(range(1, len(chars) + 1))
+        for c in chars:
+            expected = kd2_ram.get_char(c.literal)
+            assert kd2_empty.get_char_by_id(c.ID).to_dict() == expected.to_dict()
+
+    def test_insert_chars_with_workers_matches_serial(self, tmp_path, kd2_data):
+        """A sharded parallel import yields the same rows and IDs as a serial one."""
+        serial = KanjiDic2DB(":memory:")
+        serial.insert_chars(kd2_data.characters)
+        expected = {c.literal: c for c in serial.all_chars()}
+        serial.close()
+        with KanjiDic2DB(str(tmp_path / "kd2_sharded.db")) as db:
+            db.insert_chars(kd2_data.characters, workers=3)
+            loaded = db.all_chars()
+            assert [c.ID for c in loaded] == list(range(1, len(loaded) + 1))
+            assert len(loaded) == len(expected)
+            for c in loaded:
+                assert c.to_dict() == expected[c.literal].to_dict()
+                assert [g.ID for g in c.rm_groups] == [
+                    g.ID for g in expected[c.literal].rm_groups
+                ]
+        # IDs are propagated onto the inserted objects, as in a serial insert
+        assert [c.ID for c in kd2_data.characters] == [c.ID for c in loaded]
+
+    def test_reinsert_is_skipped(self, kd2_empty, kd2_data):
+        """Characters whose literal is already stored are not inserted again."""
+        kd2_empty.insert_chars(kd2_data.characters[:5])
+        kd2_empty.insert_chars(kd2_data.characters)
+        kd2_empty.insert_char(kd2_data.characters[0])
+        assert len(kd2_empty.all_chars()) == len(kd2_data.characters)
+
     def test_insert_chars_all_retrievable(self, kd2_ram, kd2_data):
         """Every literal inserted must be retrievable by get_char."""
         for c_xml in kd2_data.characters:
@@ -144,6 +196,22 @@ class TestKanjiDic2GetChar:
     def test_get_char_by_id_returns_none_for_missing(self, kd2_ram):
         assert kd2_ram.get_char_by_id(999999) is None
 
+    def test_get_char_by_id_is_cached_until_insert(self, kd2_empty, kd2_data):
+        c = kd2_data.characters[0]
+        kd2_empty.insert_char(c)
+        first = kd2_empty.get_char_by_id(c.ID)
+        assert kd2_empty.get_char_by_id(c.ID) is first
+        kd2_empty.insert_char(kd2_data.characters[1])
+        assert kd2_empty.get_char_by_id(c.ID) is not first
+
+    def test_get_char_is_cached_until_insert(self, kd2_empty, kd2_data):
+        c = kd2_data.characters[0]
+        assert kd2_empty.get_char(c.literal) is None
+        kd2_empty.insert_char(c)
+        first = kd2_empty.get_char(c.literal)
+        assert first is not None
+        assert kd2_empty.get_char(c.literal) is first
+
     def test_get_char_has_readings(self, kd2_ram):
         """The 持 character must have at least one rm_group with readings."""
         c = kd2_ram.get_char("持")
@@ -216,6 +284,28 @@ class TestKanjiDic2GetChar:
                 f"to_dict() mismatch for {c_db.literal!r}"
             )
 
+    def test_load_all_raw_without_blobs(self, kd2_ram, kd2_data):
+        """The table-stitching path of load_all_raw matches get_char."""
+        expected = {c.literal: kd2_ram.get_char(c.literal) for c in kd2_data.characters}
+        kd2_ram._db.execute_sql("DELETE FROM character_blob")
+        loaded = kd2_ram.load_all_raw()
+        assert len(loaded) == len(expected)
+        for c in loaded:
+            assert c.ID == expected[c.literal].ID
+            assert c.to_dict() == expected[c.literal].to_dict()
+
+    def test_blob_and_join_paths_agree(self, kd2_ram, kd2_data):
+        """Characters decoded from the JSON blob match those rebuilt from child tables."""
+        lits = [c.literal for c in kd2_data.characters]
+        from_blob = [kd2_ram.get_char(lit) for lit in lits]
+        kd2_ram._db.execute_sql("DELETE FROM character_blob")
+        kd2_ram._get_char_cached.cache_clear()
+        from_join = [kd2_ram.get_char(lit) for lit in lits]
+        for c_blob, c_join in zip(from_blob, from_join):
+            assert c_blob.ID == c_join.ID
+            assert c_blob.to_dict() == c_join.to_dict()
+            assert [g.ID for g in c_blob.rm_groups] == [g.ID for g in c_join.rm_groups]
+
 
 # ===========================================================================
 # KanjiDic2DB — reading order
@@ -246,6 +336,18 @@ class TestKanjiDic2Meta:
     def test_seed_meta_on_init(self, kd2_empty):
         assert kd2_empty.get_meta("kanjidic2.version") == "1.6"
 
+    def test_schema_version_seeded_on_new_db(self, kd2_empty):
+        assert kd2_empty.get_meta("kanjidic2.database_schema_version") == "2"
+
+    def test_numeric_columns_stored_as_integers(self, kd2_ram):
+        cursor = kd2_ram._db.execute_sql(
+            "SELECT DISTINCT typeof(grade), typeof(freq), typeof(jlpt) FROM character"
+        )
+        types = {t for row in cursor.fetchall() for t in row}
+        assert types <= {"integer", "null"}
+        c = kd2_ram.get_char("持")
+        assert c.grade == "3"
+
     def test_update_kd2_meta_sets_file_version(self, kd2_empty):
         kd2_empty.update_kd2_meta("4", "2024-01", "2024-01-01")
         assert kd2_empty.get_meta("kanjidic2.file_version") == "4"
@@ -302,6 +404,22 @@ class TestKanjiDic2SearchIter:
         result = list(kd2_ram.search_chars_iter([]))
         assert result == []
 
+    def test_preserves_input_order_and_matches_get_char(self, kd2_ram, kd2_data):
+        literals = [c.literal for c in reversed(kd2_data.characters)]
+        literals.insert(1, literals[0])
+        result = list(kd2_ram.search_chars_iter(literals))
+        assert [c.literal for c in result] == literals
+        for c in result:
+            assert c.to_dict() == kd2_ram.get_char(c.literal).to_dict()
+
+
+    def test_get_chars_maps_found_literals(self, kd2_ram, kd2_data):
+        literals = [c.literal for c in kd2_data.characters[:3]] + ["⿰"]
+        found = kd2_ram.get_chars(literals)
+        assert list(found) == literals[:3]
+        for lit, c in found.items():
+            assert c.to_dict() == kd2_ram.get_char(lit).to_dict()
+
 
 # ===========================================================================
 # KanjiDic2DB — context manager + multiple instances
@@ -329,6 +447,51 @@ class TestKanjiDic2ContextManager:
             assert len(mdb.all_chars()) == 0
             assert len(fdb.all_chars()) == len(kd2_data.characters)
 
+    def test_file_dbs_on_same_path_share_a_connection(self, tmp_path, kd2_data):
+        db_path = str(tmp_path / "kd2_pool.db")
+        db1 = KanjiDic2DB(db_path)
+        db2 = KanjiDic2DB(db_path)
+        assert db1._db is db2._db
+        db1.insert_chars(kd2_data.characters[:1])
+        db1.close()
+        # still open for the remaining instance
+        assert db2.get_char(kd2_data.characters[0].literal) is not None
+        db2.close()
+        assert db2._db.is_closed()
+
+    def test_miss_is_not_cached_across_instances(self, tmp_path, kd2_data):
+        """A character inserted through one pooled instance is found by another."""
+        db_path = str(tmp_path / "kd2_miss.db")
+        char = kd2_data.characters[0]
+        with KanjiDic2DB(db_path) as db1, KanjiDic2DB(db_path) as db2:
+            assert db2.get_char(char.literal) is None
+            assert db2.get_char_by_id(1) is None
+            db1.insert_chars([char])
+            assert db2.get_char(char.literal).to_dict() == char.to_dict()
+            assert db2.get_char_by_id(1).literal == char.literal
+
+    def test_read_only_file_without_blob_table(self, tmp_path, kd2_data, monkeypatch):
+        """A read-only file built before character_blob existed is read via child tables."""
+        import jamdict.kanjidic2_peewee as kanjidic2_peewee
+        from peewee import OperationalError
+
+        db_path = str(tmp_path / "old_schema.db")
+        with KanjiDic2DB(db_path) as db:
+            db.insert_chars(kd2_data.characters)
+            expected = {c.literal: c.to_dict() for c in db.all_chars()}
+            db._db.execute_sql("DROP TABLE character_blob")
+
+        def read_only(db, models):
+            raise OperationalError("attempt to write a readonly database")
+
+        monkeypatch.setattr(kanjidic2_peewee, "create_schema", read_only)
+        lits = [c.literal for c in kd2_data.characters]
+        with KanjiDic2DB(db_path) as db:
+            assert db.get_char(lits[0]).to_dict() == expected[lits[0]]
+            found = [c.to_dict() for c in db.search_chars_iter(lits + ["⿰"])]
+            assert found == [expected[lit] for lit in lits]
+            assert {c.literal: c.to_dict() for c in db.all_chars()} == expected
+
 
 # ===========================================================================
 # JMNEDictDB — fixtures
@@ -337,19 +500,39 @@ class TestKanjiDic2ContextManager:
 
 @pytest.fixture(scope="module")
 def jmne_data():
-    """Parse jmendict_mini.xml once per module."""
-    return _parse_jmne()
+    """Parse jmendict_mini.xml once per module, with int idseqs as the DB returns them."""
+    entries = _parse_jmne()
+    for e in entries:
+        e.idseq = int(e.idseq)
+    return entries
 
 
-@pytest.fixture()
-def jmne_ram(jmne_data):
-    """Fresh :memory: JMNEDictDB pre-populated with mini-XML entries."""
+@pytest.fixture(scope="module")
+def _jmne_ram_module(jmne_data):
     db = JMNEDictDB(":memory:")
     db.insert_entries(jmne_data)
     yield db
     db.close()
 
 
+@pytest.fixture()
+def jmne_ram(_jmne_ram_module):
+    """:memory: JMNEDictDB pre-populated with mini-XML entries.
+
+    Populated once per module; anything a test writes is rolled back.
+    """
+    with _jmne_ram_module._db.atomic() as txn:
+        yield _jmne_ram_module
+        txn.rollback()
+    _jmne_ram_module._get_ne_cached.cache_clear()
+
+
+@pytest.fixture(scope="module")
+def jmne_db_entries(_jmne_ram_module, jmne_data):
+    """Every mini-XML entry as loaded back from the DB, keyed by idseq."""
+    return _jmne_ram_module.get_nes(e.idseq for e in jmne_data)
+
+
 @pytest.fixture()
 def jmne_empty():
     """Fresh, empty :memory: JMNEDictDB."""
@@ -384,16 +567,28 @@ class TestJMNEDictImport:
         """A single inserted entry must be retrievable by get_ne."""
         entry = jmne_data[0]
         jmne_empty.insert_entry(entry)
-        retrieved = jmne_empty.get_ne(int(entry.idseq))
+        retrieved = jmne_empty.get_ne(entry.idseq)
         assert retrieved is not None
-        assert int(retrieved.idseq) == int(entry.idseq)
+        assert retrieved.idseq == entry.idseq
 
     def test_all_idseqs_inserted(self, jmne_ram, jmne_data):
         """Every idseq from the XML must be findable by get_ne."""
         for e in jmne_data:
-            r = jmne_ram.get_ne(int(e.idseq))
+            r = jmne_ram.get_ne(e.idseq)
             assert r is not None, f"idseq {e.idseq} not found"
 
+    def test_insert_batches_continue_ids(self, jmne_empty, jmne_ram, jmne_data, monkeypatch):
+        """Successive batches must not reuse translation IDs."""
+        import jamdict.jmnedict_peewee as jmnedict_peewee
+
+        monkeypatch.setattr(jmnedict_peewee, "INSERT_BATCH_SIZE", 3)
+        jmne_empty.insert_entries(jmne_data[:7])
+        jmne_empty.insert_entry(jmne_data[7])
+        jmne_empty.insert_entries(jmne_data[8:])
+        for e in jmne_data:
+            idseq = e.idseq
+            assert jmne_empty.get_ne(idseq).to_dict() == jmne_ram.get_ne(idseq).to_dict()
+
 
 # ===========================================================================
 # JMNEDictDB — get_ne
@@ -402,63 +597,78 @@ class TestJMNEDictImport:
 
 class TestJMNEDictGetNe:
     def test_returns_jmdentry_instance(self, jmne_ram, jmne_data):
-        idseq = int(jmne_data[0].idseq)
+        idseq = jmne_data[0].idseq
         e = jmne_ram.get_ne(idseq)
         assert isinstance(e, JMDEntry)
 
     def test_returns_none_for_missing(self, jmne_ram):
         assert jmne_ram.get_ne(99999999) is None
 
-    def test_kanji_forms_roundtrip(self, jmne_ram, jmne_data):
+    def test_returns_none_for_non_numeric_idseq(self, jmne_ram):
+        assert jmne_ram.get_ne("abc") is None
+        assert jmne_ram.get_ne(None) is None
+        assert jmne_ram._get_ne_cached.cache_info().currsize == 0
+
+    def test_cached_until_insert(self, jmne_empty, jmne_data):
+        entry = jmne_data[0]
+        idseq = entry.idseq
+        assert jmne_empty.get_ne(idseq) is None
+        jmne_empty.insert_entry(entry)
+        first = jmne_empty.get_ne(idseq)
+        assert first is not None
+        assert jmne_empty.get_ne(str(idseq)) is first
+
+    def test_kanji_forms_roundtrip(self, jmne_db_entries, jmne_data):
         """Kanji forms must match the XML source."""
         for e_xml in jmne_data:
-            e_db = jmne_ram.get_ne(int(e_xml.idseq))
+            e_db = jmne_db_entries[e_xml.idseq]
             xml_kanjis = [k.text for k in e_xml.kanji_forms]
             db_kanjis = [k.text for k in e_db.kanji_forms]
             assert xml_kanjis == db_kanjis, f"kanji mismatch for idseq {e_xml.idseq}"
 
-    def test_kana_forms_roundtrip(self, jmne_ram, jmne_data):
+    def test_kana_forms_roundtrip(self, jmne_db_entries, jmne_data):
         """Kana forms must match the XML source."""
         for e_xml in jmne_data:
-            e_db = jmne_ram.get_ne(int(e_xml.idseq))
+            e_db = jmne_db_entries[e_xml.idseq]
             xml_kanas = [k.text for k in e_xml.kana_forms]
             db_kanas = [k.text for k in e_db.kana_forms]
             assert xml_kanas == db_kanas, f"kana mismatch for idseq {e_xml.idseq}"
 
-    def test_glosses_roundtrip(self, jmne_ram, jmne_data):
+    def test_glosses_roundtrip(self, jmne_db_entries, jmne_data):
         """Glosses for each sense must match the XML source."""
         for e_xml in jmne_data:
-            e_db = jmne_ram.get_ne(int(e_xml.idseq))
+            e_db = jmne_db_entries[e_xml.idseq]
             xml_glosses = [g.text for s in e_xml.senses for g in s.gloss]
             db_glosses = [g.text for s in e_db.senses for g in s.gloss]
             assert xml_glosses == db_glosses, f"gloss mismatch for idseq {e_xml.idseq}"
 
-    def test_name_type_roundtrip(self, jmne_ram, jmne_data):
+    def test_name_type_roundtrip(self, jmne_db_entries, jmne_data):
         """name_type lists must match the XML source."""
         from jamdict.jmdict import Translation
 
-        for e_xml in jmne_data:
-            e_db = jmne_ram.get_ne(int(e_xml.idseq))
-            xml_types = [
-                nt
-                for s in e_xml.senses
-                for nt in (s.name_type if isinstance(s, Translation) else [])
-            ]
-            db_types = [
+        def name_types(e):
+            return [
                 nt
-                for s in e_db.senses
+                for s in e.senses
                 for nt in (s.name_type if isinstance(s, Translation) else [])
             ]
-            assert xml_types == db_types, f"name_type mismatch for idseq {e_xml.idseq}"
+
+        xml_types = {e.idseq: name_types(e) for e in jmne_data}
+        db_types = {idseq: name_types(e) for idseq, e in jmne_db_entries.items()}
+        assert db_types == xml_types
 
     def test_to_dict_roundtrip(self, jmne_ram, jmne_data):
-        """to_dict() must be identical between XML-parsed and DB-retrieved entry."""
-        for e_xml in jmne_data:
-            e_xml.idseq = int(e_xml.idseq)
-            e_db = jmne_ram.get_ne(int(e_xml.idseq))
-            assert e_db.to_dict() == e_xml.to_dict(), (
-                f"to_dict() mismatch for idseq {e_xml.idseq}"
-            )
+        """The DB must hold exactly the XML entries, with identical to_dict()."""
+        xml_map = {e.idseq: e.to_dict() for e in jmne_data}
+        db_map = {e.idseq: e.to_dict() for e in jmne_ram.all_ne_iter()}
+        assert db_map == xml_map
+
+    def test_get_nes_matches_get_ne(self, jmne_ram, jmne_data):
+        idseqs = [e.idseq for e in jmne_data[:5]]
+        entries = jmne_ram.get_nes(idseqs + [99999999])
+        assert list(entries) == idseqs
+        for idseq, entry in entries.items():
+            assert entry.to_dict() == jmne_ram.get_ne(idseq).to_dict()
 
     def test_shenron_by_idseq(self, jmne_ram):
         shenron = jmne_ram.get_ne(5741815)
@@ -487,6 +697,10 @@ class TestJMNEDictSearch:
         assert len(results) == 1
         assert results[0].idseq == 5741815
 
+    def test_search_by_unknown_idseq(self, jmne_ram):
+        assert jmne_ram.search_ne("id#9999999") == []
+        assert jmne_ram.search_ne("id#²") == []
+
     def test_search_exact_kanji(self, jmne_ram):
         results = jmne_ram.search_ne("神龍")
         assert len(results) == 1
@@ -519,6 +733,14 @@ class TestJMNEDictSearch:
         actual = [r.idseq for r in results]
         assert actual == expected
 
+    def test_search_trigram_index_matches_like(self, jmne_ram, monkeypatch):
+        assert jmne_ram.get_meta(JMNEDictDB.KEY_FTS) == "trigram"
+        for pattern in ("しめか%", "%ロン", "%神龍%", "%shi%"):
+            monkeypatch.setattr(jmne_ram, "_fts", True)
+            indexed = [r.idseq for r in jmne_ram.search_ne(pattern)]
+            monkeypatch.setattr(jmne_ram, "_fts", False)
+            assert indexed == [r.idseq for r in jmne_ram.search_ne(pattern)]
+
     def test_search_no_results(self, jmne_ram):
         results = jmne_ram.search_ne("ZZZNOMATCH")
         assert results == []
@@ -546,8 +768,7 @@ class TestJMNEDictSearch:
 class TestJMNEDictSearchIter:
     def test_yields_same_count_as_search(self, jmne_ram):
         expected = jmne_ram.search_ne("しめ%")
-        actual = list(jmne_ram.search_ne_iter("しめ%"))
-        assert len(actual) == len(expected)
+        assert sum(1 for _ in jmne_ram.search_ne_iter("しめ%")) == len(expected)
 
     def test_yields_jmdentry_objects(self, jmne_ram):
         for e in jmne_ram.search_ne_iter("神龍"):
@@ -630,16 +851,16 @@ class TestJMNEDictContextManager:
     def test_two_memory_dbs_are_independent(self, jmne_data):
         with JMNEDictDB(":memory:") as db1, JMNEDictDB(":memory:") as db2:
             db1.insert_entries([jmne_data[0]])
-            assert db2.get_ne(int(jmne_data[0].idseq)) is None
-            assert db1.get_ne(int(jmne_data[0].idseq)) is not None
+            assert db2.get_ne(jmne_data[0].idseq) is None
+            assert db1.get_ne(jmne_data[0].idseq) is not None
 
     def test_file_db_independent_from_memory(self, tmp_path, jmne_data):
         db_path = str(tmp_path / "jmne_test.db")
         with JMNEDictDB(db_path) as fdb, JMNEDictDB(":memory:") as mdb:
             fdb.insert_entries(jmne_data)
             # memory DB is still empty
-            assert mdb.get_ne(int(jmne_data[0].idseq)) is None
-            assert fdb.get_ne(int(jmne_data[0].idseq)) is not None
+            assert mdb.get_ne(jmne_data[0].idseq) is None
+            assert fdb.get_ne(jmne_data[0].idseq) is not None
 
 
 # ===========================================================================
@@ -698,6 +919,23 @@ class TestJamdictPeeweeExtendedImport:
         runner.import_data()
         runner.close()
 
+    def test_import_data_parallel_matches_serial(self, tmp_path, full_jam_module):
+        runner = JamdictPeewee(
+            db_path=str(tmp_path / "jmdict.db"),
+            xml_path=str(MINI_JMD),
+            kd2_db_path=str(tmp_path / "kd2.db"),
+            kd2_xml_path=str(MINI_KD2),
+            jmne_db_path=str(tmp_path / "jmne.db"),
+            jmne_xml_path=str(MINI_JMNE),
+        )
+        runner.import_data(parallel=True)
+        for query in ("おみやげ", "土"):
+            res, expected = runner.lookup(query), full_jam_module.lookup(query)
+            assert [e.to_dict() for e in res.entries] == [e.to_dict() for e in expected.entries]
+            assert [c.to_dict() for c in res.chars] == [c.to_dict() for c in expected.chars]
+        assert len(runner.jmne_db.search_ne("%")) == len(full_jam_module.jmne_db.search_ne("%"))
+        runner.close()
+
     def test_import_data_jmdict_only_flag(self, tmp_path):
         """When kanjidic2=False and jmnedict=False, only JMDict is imported."""
         runner = JamdictPeewee(
@@ -36,6 +36,7 @@ What is intentionally NOT compared
 
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
@@ -51,6 +52,9 @@ from jamdict.old.util_old import Jamdict as OldJamdict
 from jamdict.util import (
     IterLookupResult,
     Jamdict,  # new peewee-backed
+    JMDictXML,
+    JMNEDictXML,
+    KanjiDic2XML,
     LookupResult,
 )
 
@@ -125,6 +129,21 @@ def new_jam(tmp_path_factory) -> Jamdict:
     return _make_new_jam(str(db))
 
 
+@pytest.fixture(scope="module")
+def xml_jmd() -> JMDictXML:
+    return JMDictXML.from_file(str(MINI_JMD))
+
+
+@pytest.fixture(scope="module")
+def xml_kd2() -> KanjiDic2XML:
+    return KanjiDic2XML.from_file(str(MINI_KD2))
+
+
+@pytest.fixture(scope="module")
+def xml_jmne() -> JMNEDictXML:
+    return JMNEDictXML.from_file(str(MINI_JMNE))
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -187,12 +206,52 @@ class TestAvailability:
         # The new backend also returns True for an existing file DB
         assert new_jam.ready is True
 
+    def test_ready_new_backend_stats_file_once(self, new_jam, monkeypatch):
+        new_jam.refresh_file_status()
+        calls = []
+        real_isfile = os.path.isfile
+        monkeypatch.setattr(
+            os.path, "isfile", lambda p: calls.append(p) or real_isfile(p)
+        )
+        for _ in range(3):
+            assert new_jam.ready is True
+        assert calls == [new_jam.db_file]
+
     def test_has_kd2(self, old_jam, new_jam):
         assert old_jam.has_kd2() == new_jam.has_kd2()
 
     def test_has_jmne(self, old_jam, new_jam):
         assert old_jam.has_jmne() == new_jam.has_jmne()
 
+    def test_has_jmne_is_remembered(self, new_jam, monkeypatch):
+        jam = Jamdict(new_jam.db_file, auto_config=False)
+        assert jam.has_jmne() is True
+        monkeypatch.setattr(jam.jmnedict, "get_meta", None)  # not queried again
+        assert jam.has_jmne() is True
+        jam.jmnedict_file = None  # a path change forgets the answer
+        assert jam._has_jmne is None
+        jam.close()
+
+    def test_availability_follows_path_setters(self):
+        jam = Jamdict(auto_config=False)
+        assert not jam.is_available() and not jam.has_kd2()
+        jam.kd2_xml_file = str(MINI_KD2)
+        assert jam.is_available() and jam.has_kd2()
+        jam.kd2_xml_file = None
+        jam.jmnedict_file = ":memory:"
+        assert jam.is_available() and not jam.has_kd2()
+        jam.jmnedict_file = None
+        assert not jam.is_available()
+
+    def test_context_manager_closes_connections(self, new_jam):
+        with Jamdict(new_jam.db_file, auto_config=False, cache_size=0) as jam:
+            db = jam.jmdict
+            assert jam.lookup("おみやげ").entries
+        assert db._db.is_closed() and jam._db_peewee is None
+        jam.close()  # idempotent
+        assert jam.lookup("おみやげ").entries  # reopened lazily
+        jam.close()
+
 
 # ===========================================================================
 # 2. lookup — basic word queries
@@ -251,6 +310,12 @@ class TestLookupEntries:
         assert len(old.entries) == 1
         assert len(new.entries) == 1
 
+    def test_limit(self, new_jam):
+        every = new_jam.lookup("%あの%", lookup_chars=False, lookup_ne=False)
+        first = new_jam.lookup("%あの%", lookup_chars=False, lookup_ne=False, limit=1)
+        assert len(every.entries) > 1
+        assert _entry_idseqs(first.entries) == _entry_idseqs(every.entries[:1])
+
     def test_no_results(self, old_jam, new_jam):
         old = old_jam.lookup("zzznomatch99")
         new = new_jam.lookup("zzznomatch99")
@@ -405,6 +470,13 @@ class TestLookupResultType:
         assert hasattr(new_res, "chars")
         assert hasattr(new_res, "names")
 
+    def test_cached_result_is_slotted(self, new_jam):
+        res = new_jam.lookup("おみやげ")
+        assert new_jam.lookup("おみやげ") is res
+        assert res.chars  # the char fan-out is part of the cached object
+        with pytest.raises(AttributeError):
+            res.extra = 1
+
     def test_to_dict_keys(self, old_jam, new_jam):
         old_d = old_jam.lookup("おみやげ").to_dict()
         new_d = new_jam.lookup("おみやげ").to_dict()
@@ -704,6 +776,61 @@ class TestLookupIter:
         assert hasattr(res, "chars")
         assert hasattr(res, "names")
 
+    def test_lookup_iter_result_has_no_dict(self, new_jam):
+        res = new_jam.lookup_iter("お土産")
+        assert isinstance(res, IterLookupResult)
+        assert not hasattr(res, "__dict__")
+
+
+class TestConcurrentLookup:
+    """One Jamdict instance may be queried from several threads at once."""
+
+    QUERIES = ["おみやげ", "お土産", "surname", "%みや%", "土"]
+
+    @staticmethod
+    def _summary(jam, query):
+        res = jam.lookup(query)
+        return (
+            sorted(e.idseq for e in res.entries),
+            sorted(c.literal for c in res.chars),
+            sorted(n.idseq for n in res.names),
+        )
+
+    def _check(self, jam):
+        expected = {q: self._summary(jam, q) for q in self.QUERIES}
+        jam.clear_cache()
+        work = self.QUERIES * 8
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda q: self._summary(jam, q), work))
+        for q, r in zip(work, results):
+            assert r == expected[q]
+
+    def test_threads_share_file_db(self, new_jam):
+        jam = Jamdict(new_jam.db_file, auto_config=False, cache_size=0)
+        self._check(jam)
+
+    def test_parallel_lookup_matches_serial(self, new_jam):
+        jam = Jamdict(new_jam.db_file, auto_config=False, parallel=True)
+        for query in self.QUERIES:
+            for strict in (False, True):
+                res = jam.lookup(query, strict_lookup=strict)
+                assert res.to_dict() == new_jam.lookup(query, strict_lookup=strict).to_dict()
+        jam.close()
+
+    def test_threads_share_memory_db(self):
+        jam = Jamdict(
+            ":memory:",
+            kd2_file=":memory:",
+            jmnedict_file=":memory:",
+            jmd_xml_file=str(MINI_JMD),
+            kd2_xml_file=str(MINI_KD2),
+            jmnedict_xml_file=str(MINI_JMNE),
+            auto_config=False,
+            cache_size=0,
+        )
+        jam.import_data()
+        self._check(jam)
+
 
 # ===========================================================================
 # 14. JMDictXML / KanjiDic2XML / JMNEDictXML — XML-only path unchanged
@@ -714,41 +841,26 @@ class TestXMLBackends:
     """The XML helpers (JMDictXML, KanjiDic2XML, JMNEDictXML) are shared
     unchanged between old and new util; they are tested here for regression."""
 
-    def test_jmdict_xml_lookup(self):
-        from jamdict.util import JMDictXML
-
-        jmd = JMDictXML.from_file(str(MINI_JMD))
-        results = jmd.lookup("おみやげ")
+    def test_jmdict_xml_lookup(self, xml_jmd):
+        results = xml_jmd.lookup("おみやげ")
         assert results
         assert any(k.text == "おみやげ" for e in results for k in e.kana_forms)
 
-    def test_jmdict_xml_id_lookup(self):
-        from jamdict.util import JMDictXML
-
-        jmd = JMDictXML.from_file(str(MINI_JMD))
-        results = jmd.lookup("id#1002490")
+    def test_jmdict_xml_id_lookup(self, xml_jmd):
+        results = xml_jmd.lookup("id#1002490")
         assert len(results) == 1
         assert int(results[0].idseq) == 1002490
 
-    def test_kanjidic2_xml_lookup(self):
-        from jamdict.util import KanjiDic2XML
-
-        kd2 = KanjiDic2XML.from_file(str(MINI_KD2))
-        c = kd2.lookup("土")
+    def test_kanjidic2_xml_lookup(self, xml_kd2):
+        c = xml_kd2.lookup("土")
         assert c is not None
         assert c.literal == "土"
 
-    def test_kanjidic2_xml_missing(self):
-        from jamdict.util import KanjiDic2XML
-
-        kd2 = KanjiDic2XML.from_file(str(MINI_KD2))
-        assert kd2.lookup("Ω") is None
+    def test_kanjidic2_xml_missing(self, xml_kd2):
+        assert xml_kd2.lookup("Ω") is None
 
-    def test_jmnedict_xml_lookup(self):
-        from jamdict.util import JMNEDictXML
-
-        jmne = JMNEDictXML.from_file(str(MINI_JMNE))
-        results = jmne.lookup("シェンロン")
+    def test_jmnedict_xml_lookup(self, xml_jmne):
+        results = xml_jmne.lookup("シェンロン")
         assert results
 
     def test_xml_classes_importable_from_new_util(self):
@@ -804,8 +916,9 @@ class TestNewBackendMemoryMode:
     """These tests only run against the new backend, verifying that :memory:
     works correctly (the old backend's :memory: is broken by design)."""
 
-    @pytest.fixture()
-    def mem_jam(self) -> Jamdict:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mem_jam(cls) -> Jamdict:
         jam = Jamdict(
             ":memory:",
             kd2_file=":memory:",
@@ -835,7 +948,87 @@ class TestNewBackendMemoryMode:
         pos = mem_jam.all_pos()
         assert "noun (common) (futsuumeishi)" in pos
 
+    def test_memory_mode_kana_query_skips_kanjidic(self, mem_jam, monkeypatch):
+        def no_db(*args, **kwargs):
+            raise AssertionError("KanjiDic2 queried for a kana-only lookup")
+
+        monkeypatch.setattr(mem_jam.kd2._db, "execute_sql", no_db)
+        res = mem_jam.lookup("おみやげ", strict_lookup=True)
+        assert res.entries and not res.chars
+        assert list(mem_jam.lookup_iter("おみやげ").chars) == []
+
     def test_memory_mode_get_entry(self, mem_jam):
         e = mem_jam.get_entry(1002490)
         assert e is not None
         assert {k.text for k in e.kana_forms} == {"おとそ"}
+
+    def test_memory_mode_results_are_cached(self, mem_jam):
+        res = mem_jam.lookup("おみやげ")
+        assert mem_jam.lookup("おみやげ") is res
+        assert mem_jam.get_entry(1002490) is mem_jam.get_entry(1002490)
+        assert mem_jam.get_char("土") is mem_jam.get_char("土")
+        # pos filters hit the same cache entry regardless of order
+        pos = ["noun (common) (futsuumeishi)", "expressions (phrases, clauses, etc.)"]
+        assert mem_jam.lookup("%", pos=pos) is mem_jam.lookup("%", pos=pos[::-1])
+        mem_jam.clear_cache()
+        assert mem_jam.lookup("おみやげ") is not res
+
+    def test_memory_mode_lookup_iter_replays_drained(self, mem_jam, monkeypatch):
+        first = mem_jam.lookup_iter("お土産")
+        entries, chars = list(first.entries), list(first.chars)
+        assert entries and chars
+
+        def no_db(*args, **kwargs):
+            raise AssertionError("database queried again")
+
+        monkeypatch.setattr(mem_jam.jmdict, "search_iter", no_db)
+        monkeypatch.setattr(mem_jam.kd2, "search_chars_iter", no_db)
+        again = mem_jam.lookup_iter("お土産")
+        assert next(again.entries) is entries[0]
+        assert list(again.chars) == chars
+        mem_jam.clear_cache()
+        with pytest.raises(AssertionError):
+            list(mem_jam.lookup_iter("お土産").entries)
+
+    def test_memory_mode_tag_sets_are_memoized(self, mem_jam):
+        pos = mem_jam.all_pos()
+        assert mem_jam._pos_cache is not None
+        pos.clear()  # callers get a copy
+        assert mem_jam.all_pos()
+        assert mem_jam.all_ne_type() == mem_jam.all_ne_type()
+        mem_jam.invalidate_tag_caches()
+        assert mem_jam._pos_cache is None and mem_jam._ne_type_cache is None
+
+    def test_memory_mode_parallel_import(self, mem_jam):
+        jam = Jamdict(
+            ":memory:",
+            kd2_file=":memory:",
+            jmnedict_file=":memory:",
+            jmd_xml_file=str(MINI_JMD),
+            kd2_xml_file=str(MINI_KD2),
+            jmnedict_xml_file=str(MINI_JMNE),
+            auto_config=False,
+        )
+        jam.import_data(parallel=True)
+        for query in ("おみやげ", "surname", "土"):
+            res, expected = jam.lookup(query), mem_jam.lookup(query)
+            assert res.to_dict() == expected.to_dict()
+        assert len(jam.kd2.all_chars()) == len(mem_jam.kd2.all_chars())
+
+    def test_memory_mode_query_only(self):
+        jam = Jamdict(
+            ":memory:",
+            kd2_file=":memory:",
+            jmnedict_file=":memory:",
+            jmd_xml_file=str(MINI_JMD),
+            kd2_xml_file=str(MINI_KD2),
+            jmnedict_xml_file=str(MINI_JMNE),
+            auto_config=False,
+            query_only=True,
+        )
+        jam.import_data()  # writes are allowed while importing
+        assert len(jam.lookup("おみやげ").entries) == 1
+        for db in (jam.jmdict, jam.kd2, jam.jmnedict):
+            assert db._db.pragma("query_only") == 1
+        with pytest.raises(Exception, match="readonly"):
+            jam.jmdict.update_meta("x", "y")